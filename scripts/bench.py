@@ -0,0 +1,72 @@
+import argparse
+from pathlib import Path
+import sys
+
+# FORCE le chemin racine du projet
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(PROJECT_ROOT))
+
+from src.utils.perf_suite import (
+    BASELINE_PATH, DEFAULT_THRESHOLD, LEVELS, REPORT_PATH, SUITE_SIZE,
+    compare, format_diff, load_report, run_suite, save_report,
+)
+
+
+def _print_stats(level, name, stats):
+    median = stats["temps_median_ns"] / 1e6
+    print(f"  {level:7} {name:34} {median:10.2f} ms  bruit ±{stats['bruit_relatif'] * 100:.1f} %  "
+          f"itérations {stats['iterations_mediane']}  succès {stats['taux_succes'] * 100:.0f} %", flush=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Suite de performance : grilles fixes, répétitions, comparaison à une référence")
+    parser.add_argument("--levels", default=",".join(LEVELS), help="Niveaux, séparés par des virgules")
+    parser.add_argument("--algorithms", default=None, help="Sous-ensemble d'algorithmes, séparés par des virgules")
+    parser.add_argument("--size", type=int, default=SUITE_SIZE, help="Nombre de grilles (fixes) par niveau")
+    parser.add_argument("--repetitions", type=int, default=5, help="Mesures par grille et par algorithme")
+    parser.add_argument("--warmup", type=int, default=1, help="Exécutions d'échauffement ignorées")
+    parser.add_argument("--seed", type=int, default=0, help="Graine des solveurs stochastiques")
+    parser.add_argument("--max-time", type=float, default=10.0, help="Budget temps par exécution en secondes (0 = illimité)")
+    parser.add_argument("--max-nodes", type=int, default=None, help="Budget de noeuds/itérations par exécution")
+    parser.add_argument("--out", default=str(REPORT_PATH), help="Rapport JSON de cette exécution")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH), help="Fichier de référence")
+    parser.add_argument("--save-baseline", action="store_true", help="Enregistre ce rapport comme nouvelle référence")
+    parser.add_argument("--allow-missing", action="store_true",
+                        help="Niveaux / algorithmes sans référence comparable : avertissement au lieu d'un échec")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Hausse relative tolérée des médianes (0.10 = 10 %%)")
+    args = parser.parse_args()
+    limits = {"max_time": args.max_time or None, "max_nodes": args.max_nodes}
+    levels = [level.strip() for level in args.levels.split(",")]
+    algorithms = [name.strip() for name in args.algorithms.split(",")] if args.algorithms else None
+
+    print(f"\n🚀 Suite de performance : {', '.join(levels)} "
+          f"({args.size} grilles, {args.warmup} échauffement(s), {args.repetitions} répétitions)")
+    report = run_suite(levels, algorithms, size=args.size, repetitions=args.repetitions, warmup=args.warmup,
+                       limits=limits, seed=args.seed, on_progress=_print_stats)
+    print(f"💾 Rapport : {save_report(report, args.out)}")
+
+    if args.save_baseline:
+        print(f"📌 Référence enregistrée : {save_report(report, args.baseline)}")
+        sys.exit(0)
+
+    # Sans référence, rien n'est vérifié : échec explicite plutôt qu'un succès trompeur
+    if not Path(args.baseline).exists():
+        print(f"❌ Pas de référence ({args.baseline}) : relancer avec --save-baseline pour en créer une.")
+        sys.exit(2)
+
+    regressions, missing, warnings = compare(report, load_report(args.baseline), args.threshold)
+    for warning in warnings:
+        print(f"⚠️ {warning}")
+    for message in missing:
+        print(f"{'⚠️' if args.allow_missing else '❌'} {message}")
+    if regressions:
+        print(f"\n❌ {len(regressions)} régression(s) au-delà de {args.threshold * 100:.0f} % :")
+        print(format_diff(regressions))
+        sys.exit(1)
+    # Mesures sans référence comparable : non vérifiées, donc pas de succès par défaut
+    if missing and not args.allow_missing:
+        print(f"\n❌ {len(missing)} mesure(s) sans référence comparable : relancer avec --save-baseline "
+              f"(ou --allow-missing pour les ignorer).")
+        sys.exit(2)
+    print("✅ Aucune régression par rapport à la référence.")
@@ -1,5 +1,3 @@
-import time
-import json
 import argparse
 from pathlib import Path
 import sys
@@ -8,79 +6,51 @@ import sys
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 sys.path.append(str(PROJECT_ROOT))
 
-from src.core.grid import SudokuGrid
-from src.core.validator import is_valid_sudoku
+# API de benchmark importable (aussi utilisée en processus par server.py)
+from src.utils.benchmark import run_all_algorithms, run_batch
+from src.utils.jobs import format_progress_line
+from src.utils.result_cache import ResultCache
 
-from src.algorithms import ALGORITHMS  # Import centralisé
-from src.utils.loader import load_grid_from_dataset
-
-
-def run_all_algorithms(difficulty: str):
-    data_path = PROJECT_ROOT / "data" / f"{difficulty.lower()}.csv"
-
-    if not data_path.exists():
-        raise FileNotFoundError(f"❌ Fichier introuvable : {data_path}")
-
-    grid_initial = SudokuGrid(load_grid_from_dataset(data_path))
-    results = []
-
-    for name, solver in ALGORITHMS.items():
-        print(f"▶️ Exécution de l'algorithme : {name}")
-        try:
-            grid_copy = SudokuGrid(grid_initial.to_list())
-            start = time.time()
-            # --- Attendu : chaque solveur retourne un DICO de mesures ---
-            res = solver(grid_copy)
-            end = time.time()
-            # Ajoute les infos de temps, nom algo, grille initiale, etc.
-            res["algorithme"] = name
-            res["temps"] = round(end - start, 4)
-            res["grille_initiale"] = grid_initial.to_list()
-
-            # Optionnel : vérification manuelle de succès (si non déjà dans res)
-            if "taux_succes" not in res:
-                res["taux_succes"] = is_valid_sudoku(SudokuGrid(res["grille_resolue"]))
-
-            # Optionnel : nombre de cases fausses (utile pour visualisation)
-            if "cases_fausses" not in res and not res.get("taux_succes", False):
-                res["cases_fausses"] = count_false_cells(SudokuGrid(res["grille_resolue"]))
-            else:
-                res["cases_fausses"] = 0
-
-            results.append(res)
-
-            if not res.get("taux_succes", False):
-                print(f"⚠️ {name} a généré une solution invalide.")
-
-        except Exception as e:
-            print(f"❌ Erreur avec {name} : {e}")
-
-    # Sauvegarde des résultats DANS le bon dossier à la racine du projet
-    output_dir = PROJECT_ROOT / "web_interface" / "data"
-    output_dir.mkdir(parents=True, exist_ok=True)
-    output_file = output_dir / f"results_{difficulty.lower()}.json"
-    
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2)
-
-    print(f"\n✅ Résultats sauvegardés dans : {output_file}")
-
-def count_false_cells(grid: SudokuGrid) -> int:
-    errors = 0
-    for i in range(9):
-        for j in range(9):
-            val = grid.grid[i][j]
-            grid.grid[i][j] = 0
-            if not grid.is_valid_value(i, j, val):
-                errors += 1
-            grid.grid[i][j] = val
-    return errors
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--level", default="Expert", help="Niveau : Easy | Medium | Hard | Expert")
+    parser.add_argument("--algorithms", default=None, help="Sous-ensemble d'algorithmes, séparés par des virgules")
+    parser.add_argument("--batch", action="store_true", help="Exécute toutes les grilles du niveau (pool de processus)")
+    parser.add_argument("--sample", type=int, default=None, help="Batch : nombre de grilles tirées au hasard")
+    parser.add_argument("--seed", type=int, default=0, help="Batch : graine du tirage et des solveurs stochastiques")
+    parser.add_argument("--workers", type=int, default=None, help="Batch : nombre de processus (défaut : nb de coeurs)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Batch : temps max par tâche en secondes")
+    parser.add_argument("--max-tasks-per-child", type=int, default=50, help="Batch : recyclage des workers")
+    parser.add_argument("--max-time", type=float, default=30.0, help="Budget temps par solveur en secondes (0 = illimité)")
+    parser.add_argument("--max-nodes", type=int, default=None, help="Budget de noeuds/itérations par solveur")
+    parser.add_argument("--max-memory", type=float, default=None, help="Budget mémoire par solveur (Mo de RSS en plus)")
+    parser.add_argument("--no-trace-memory", action="store_true",
+                        help="Sans exécution tracée (tracemalloc) en plus : deux fois moins d'exécutions, pas de pic d'allocations")
+    parser.add_argument("--no-cache", action="store_true", help="Réexécute tout sans lire ni écrire le cache des résultats")
+    parser.add_argument("--progress", action="store_true", help="Écrit une ligne de progression JSON après chaque algorithme")
+    parser.add_argument("--profile", action="store_true",
+                        help="Profile chaque algorithme (cProfile) : .pstats et piles repliées à côté des résultats")
+    parser.add_argument("--profile-top", type=int, default=15, help="Profil : nombre de fonctions listées par algorithme")
     args = parser.parse_args()
+    limits = {
+        "max_time": args.max_time or None,
+        "max_nodes": args.max_nodes,
+        "max_memory_mb": args.max_memory,
+    }
+    algorithms = [name.strip() for name in args.algorithms.split(",")] if args.algorithms else None
+    cache = None if args.no_cache else ResultCache()
 
     print(f"\n🚀 Lancement de la génération des résultats pour niveau : {args.level}")
-    run_all_algorithms(args.level)
+    if args.batch and args.profile:
+        parser.error("--profile ne s'utilise qu'en mode grille unique (sans --batch)")
+    if args.batch:
+        run_batch(args.level, sample=args.sample, seed=args.seed, workers=args.workers,
+                  timeout=args.timeout, max_tasks_per_child=args.max_tasks_per_child, limits=limits,
+                  algorithms=algorithms, cache=cache, trace_memory=not args.no_trace_memory)
+    else:
+        on_progress = (lambda event: print(format_progress_line(event), flush=True)) if args.progress else None
+        run_all_algorithms(args.level, limits, on_progress, algorithms=algorithms, cache=cache,
+                           trace_memory=not args.no_trace_memory, profile=args.profile,
+                           profile_top=args.profile_top)
     print("🏁 Fin de l'exécution.\n")
@@ -15,22 +15,21 @@ if __name__ == "__main__":
     BASE_DIR = Path(__file__).resolve().parent  # scripts/
     PROJECT_ROOT = BASE_DIR.parent
 
-    main_path = PROJECT_ROOT / "scripts" / "main.py"
     server_path = PROJECT_ROOT / "scripts" / "server.py"
+    sys.path.append(str(PROJECT_ROOT))
+    from src.utils.benchmark import run_all_algorithms, DEFAULT_LIMITS
 
     def run_main(level):
         print(f"\n Génération des résultats pour le niveau : {level}\n")
-        if not main_path.exists():
-            print(f" Fichier introuvable : {main_path}")
-            sys.exit(1)
-        subprocess.run(["python", str(main_path), "--level", level], check=True)
+        # Exécution dans ce processus (plus de lancement de main.py)
+        run_all_algorithms(level, limits=DEFAULT_LIMITS)
 
     def run_server():
         print(" Lancement du serveur Flask...\n")
         if not server_path.exists():
             print(f" Fichier introuvable : {server_path}")
             sys.exit(1)
-        return subprocess.Popen(["python", str(server_path)])
+        return subprocess.Popen([sys.executable, str(server_path)])
 
     try:
         run_main(args.level)
@@ -47,5 +46,5 @@ if __name__ == "__main__":
         print("\n Arrêt du serveur demandé par l'utilisateur.")
         server_process.terminate()
 
-    except subprocess.CalledProcessError as e:
-        print(f" Erreur lors de l’exécution de main.py : {e}")
+    except (FileNotFoundError, ValueError) as e:
+        print(f" Erreur lors de la génération des résultats : {e}")
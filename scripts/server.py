@@ -1,36 +1,115 @@
-from flask import Flask, request, jsonify, send_from_directory
-import subprocess
+from flask import Flask, Response, request, jsonify, send_from_directory, stream_with_context
+import json
+import os
+import sys
 from pathlib import Path
 
 # Correction : base projet = racine
 BASE_DIR = Path(__file__).resolve().parent.parent
 STATIC_DIR = BASE_DIR / "web_interface"
+sys.path.append(str(BASE_DIR))
+
+from src.algorithms import ALGORITHMS
+from src.utils.benchmark import DEFAULT_LIMITS, SolverPool, run_all_algorithms
+from src.utils.jobs import Job, JobManager, JobQueueFull
+from src.utils.result_cache import ResultCache
+
+LEVELS = ["Easy", "Medium", "Hard", "Expert"]
 
 app = Flask(__name__, static_folder=str(STATIC_DIR), static_url_path="")
 
+
+# Pool de processus du serveur : les solveurs tournent dans des workers déjà démarrés
+# (imports et structures partagées réutilisés d'une requête à l'autre)
+# Un seul worker : les solveurs sont chronométrés un à la fois ; recréé si le worker meurt
+SOLVER_WORKERS = 1
+solver_pool = SolverPool(SOLVER_WORKERS)
+
+# Résultats déjà calculés (solveurs déterministes) servis sans relancer le solveur
+result_cache = ResultCache()
+
+
+def run_main(job, difficulty, algorithms=None):
+    """Exécute les algorithmes d'un niveau sur le pool et publie la progression dans la tâche."""
+    return run_all_algorithms(difficulty, limits=DEFAULT_LIMITS, on_progress=job.publish,
+                              algorithms=algorithms, executor=solver_pool, cache=result_cache)
+
+
+# Une exécution à la fois : les temps mesurés d'un niveau ne dépendent pas d'un autre niveau
+# lancé en même temps sur le même pool ; les demandes identiques en cours sont fusionnées
+jobs = JobManager(run_main, max_workers=1)
+
+
 @app.route("/")
 def index():
     return send_from_directory(app.static_folder, "index.html")
 
 @app.route("/run", methods=["GET"])
-def run_main():
+def run_level():
     difficulty = request.args.get("difficulty", "Expert").capitalize()
+    if difficulty not in LEVELS:
+        return jsonify({"success": False, "error": f"Niveau inconnu : {difficulty}"}), 400
+    algorithms = request.args.get("algorithms")
+    algorithms = tuple(name.strip() for name in algorithms.split(",")) if algorithms else None
+    if algorithms and any(name not in ALGORITHMS for name in algorithms):
+        return jsonify({"success": False, "error": "Algorithme inconnu"}), 400
     print(f" Requête de génération de grille pour niveau : {difficulty}")
-    
-    scripts_dir = BASE_DIR / "scripts"
-    main_script = scripts_dir / "main.py"
-
-    if not main_script.exists():
-        error_msg = f" main.py introuvable à l’emplacement : {main_script}"
-        print(error_msg)
-        return jsonify({"success": False, "error": error_msg}), 500
 
     try:
-        subprocess.run(["python", str(main_script), "--level", difficulty], check=True)
-        return jsonify({"success": True})
-    except subprocess.CalledProcessError as e:
-        print(f" Erreur d’exécution : {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+        job, deduplicated = jobs.submit((difficulty, algorithms), difficulty, algorithms)
+    except JobQueueFull as e:
+        return jsonify({"success": False, "error": str(e)}), 429
+
+    return jsonify({
+        "success": True,
+        "job_id": job.id,
+        "statut": job.status,
+        "deduplique": deduplicated,
+    }), 202
+
+@app.route("/jobs", methods=["GET"])
+def list_jobs():
+    return jsonify([job.to_dict() for job in jobs.list_jobs()])
+
+@app.route("/jobs/<job_id>", methods=["GET"])
+def job_status(job_id):
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({"success": False, "error": "Tâche inconnue"}), 404
+    return jsonify(job.to_dict())
+
+@app.route("/jobs/<job_id>/results", methods=["GET"])
+def job_results(job_id):
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({"success": False, "error": "Tâche inconnue"}), 404
+    if not job.is_finished:
+        return jsonify({"success": False, "error": "Tâche en cours", "statut": job.status}), 409
+    return jsonify(job.result or [])
+
+@app.route("/jobs/<job_id>/events", methods=["GET"])
+def job_events(job_id):
+    """Flux SSE : un évènement 'progress' par algorithme terminé, puis 'done' ou 'failed'."""
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({"success": False, "error": "Tâche inconnue"}), 404
+
+    def stream():
+        sent = 0
+        while True:
+            events, finished = job.wait_events(sent)
+            for event in events:
+                yield f"event: progress\ndata: {json.dumps(event)}\n\n"
+            sent += len(events)
+            if finished and sent >= len(job.events):
+                final = "done" if job.status == Job.DONE else "failed"
+                yield f"event: {final}\ndata: {json.dumps(job.to_dict())}\n\n"
+                return
+            if not events:
+                yield ": keep-alive\n\n"
+
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    return Response(stream_with_context(stream()), mimetype="text/event-stream", headers=headers)
 
 @app.route("/<path:filename>")
 def serve_static(filename):
@@ -38,4 +117,10 @@ def serve_static(filename):
 
 if __name__ == "__main__":
     print(" Serveur Flask en cours de démarrage : http://127.0.0.1:5000/")
-    app.run(debug=True)
+    # Avec le reloader, seul le processus qui sert les requêtes préchauffe le pool
+    if os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        solver_pool.start()
+        removed = result_cache.invalidate_stale(ALGORITHMS)
+        if removed:
+            print(f" Cache : {removed} résultat(s) obsolète(s) supprimé(s)")
+    app.run(debug=True, threaded=True)
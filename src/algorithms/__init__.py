@@ -9,13 +9,19 @@ from .bfs import solve as bfs
 from .a_star import solve as a_star
 from .beam import solve as beam
 from .a_star_bt import solve as a_star_bt  # Assure-toi que ce fichier existe !
+from .ida_star import solve as ida_star
+from .sma_star import solve as sma_star
 
 # --- Recherche locale (métaheuristique) ---
 from .hill_climbing import solve as hill_climbing
 from .hill_climbing_restart import solve as hill_climbing_restart
+from .hill_climbing_restart import solve_parallel as hill_climbing_parallel_restart
+from .simulated_annealing import solve as simulated_annealing
+from .tabu_search import solve as tabu_search
 
 # --- CSP (contraintes) ---
-
+from .csp import solve as csp
+from .dlx import solve as dlx
 
 # --- Dictionnaire centralisé des solveurs ---
 ALGORITHMS = {
@@ -24,7 +30,35 @@ ALGORITHMS = {
     "BFS": bfs,
     "A*": a_star,
     "A* + Backtracking": a_star_bt,
+    "IDA*": ida_star,
+    "SMA*": sma_star,
     "Hill Climbing": hill_climbing,
     "Hill Climbing + Restart": hill_climbing_restart,
+    "Hill Climbing + Parallel Restart": hill_climbing_parallel_restart,
     "Beam Search": beam,
+    "Simulated Annealing": simulated_annealing,
+    "Tabu Search": tabu_search,
+    "CSP (Propagation + MRV)": csp,
+    "Dancing Links (DLX)": dlx,
+}
+
+# Solveurs dont le résultat dépend du tirage aléatoire (ordre des chiffres, mouvements) :
+# relancés à chaque demande, mis en cache seulement pour une graine donnée
+STOCHASTIC = {
+    "A*",
+    "A* + Backtracking",
+    "IDA*",
+    "SMA*",
+    "Hill Climbing",
+    "Hill Climbing + Restart",
+    "Hill Climbing + Parallel Restart",
+    "Simulated Annealing",
+    "Tabu Search",
+}
+
+# Solveurs qui répartissent eux-mêmes leur travail sur un pool de processus : dans un worker
+# (pas de pool imbriqué) ils tourneraient en séquentiel. Exécutés dans le processus appelant
+# par run_all_algorithms, ignorés par le mode batch (déjà un pool)
+OWN_POOL = {
+    "Hill Climbing + Parallel Restart",
 }
@@ -2,84 +2,90 @@
 
 import heapq
 import random
-from copy import deepcopy
-from typing import Dict
+from typing import Dict, Optional
 from src.core.grid import SudokuGrid
-from src.core.validator import is_valid, is_complete
+from src.core.validator import is_complete
+from src.core import state as compact
+from src.core.bitboard import POPCOUNT
+from src.algorithms.heuristics import count_conflicts, get_heuristic
+from src.core.budget import Budget
+from src.core.cell_order import get_cell_order
 
 class AStarBT_Solver:
-    def __init__(self, grid):
-        self.original_grid = deepcopy(grid)
+    def __init__(self, grid, budget: Optional[Budget] = None, heuristic=None, cell_order=None):
+        # États compacts (81 octets) : dérivation d'un fils par tranche, clé directe du visited
+        self.original_grid = compact.from_grid(grid)
+        self.budget = budget or Budget()
+        self.h = get_heuristic(heuristic)
+        self.order = get_cell_order(cell_order)
         self.iterations = 0
         self.solution = None
         self.max_heap_size = 1
         self.visited_count = 0
 
     def heuristic(self, grid):
-        conflicts = 0
-        for i in range(9):
-            row_counts = [0] * 10
-            col_counts = [0] * 10
-            for j in range(9):
-                row_counts[grid[i][j]] += 1
-                col_counts[grid[j][i]] += 1
-            conflicts += sum(c - 1 for c in row_counts if c > 1)
-            conflicts += sum(c - 1 for c in col_counts if c > 1)
-        return conflicts
+        """Valeur de l'heuristique choisie, recalculée sur toute la grille."""
+        return self.h.evaluate(grid if isinstance(grid, bytes) else compact.from_grid(grid))
 
     def get_next_states(self, grid):
-        for i in range(9):
-            for j in range(9):
-                if grid[i][j] == 0:
-                    for num in random.sample(range(1, 10), 9):
-                        if is_valid(grid, i, j, num):
-                            new_grid = deepcopy(grid)
-                            new_grid[i][j] = num
-                            yield new_grid
-                    return
+        cell, allowed = self.order.select_state(grid)
+        if cell < 0:
+            return
+        nb_children = POPCOUNT[allowed]
+        self.budget.count(Budget.EXPANSIONS)
+        self.budget.count(Budget.CANDIDATE_CHECKS, nb_children)
+        self.budget.count(Budget.COPIES, nb_children)
+        for num in random.sample(range(1, 10), 9):
+            if allowed >> num & 1:
+                yield cell, num, compact.place(grid, cell, num)
 
     def solve(self):
         heap = []
-        h = self.heuristic(self.original_grid)
-        heapq.heappush(heap, (h, 0, self.original_grid))
+        # Noeud : (f, g, état, h, aux) ; h et aux servent à évaluer les fils en O(1)
+        h, aux = self.h.root(self.original_grid)
+        heapq.heappush(heap, (h, 0, self.original_grid, h, aux))
         visited = set()
 
         while heap:
             self.max_heap_size = max(self.max_heap_size, len(heap))
-            f_score, steps, current = heapq.heappop(heap)
+            f_score, steps, current, h, aux = heapq.heappop(heap)
+            if self.budget.tick():
+                return False
             self.iterations += 1
 
-            grid_tuple = tuple(tuple(row) for row in current)
-            if grid_tuple in visited:
+            if current in visited:
                 continue
-            visited.add(grid_tuple)
+            visited.add(current)
             self.visited_count = len(visited)
 
-            if is_complete(current):
+            if compact.is_complete(current):
                 self.solution = current
                 return True
 
             # À chaque étape, on backtrack sur tous les voisins "valides"
-            for neighbor in self.get_next_states(current):
-                hn = self.heuristic(neighbor)
-                heapq.heappush(heap, (steps + 1 + hn, steps + 1, neighbor))
+            for cell, num, neighbor in self.get_next_states(current):
+                hn, aux_n = self.h.child(current, h, aux, cell, num, neighbor)
+                heapq.heappush(heap, (steps + 1 + hn, steps + 1, neighbor, hn, aux_n))
 
         return False
 
     @property
     def grid(self):
-        return self.solution if self.solution else self.original_grid
+        return compact.to_list(self.solution if self.solution else self.original_grid)
 
-def solve(sudoku_grid: SudokuGrid) -> Dict:
-    solver = AStarBT_Solver(sudoku_grid.grid)
+def solve(sudoku_grid: SudokuGrid, budget: Optional[Budget] = None, heuristic=None, cell_order=None) -> Dict:
+    solver = AStarBT_Solver(sudoku_grid.grid, budget, heuristic, cell_order)
     solver.solve()
     taux_succes = is_complete(solver.grid)
     return {
         "grille_resolue": solver.grid,
         "iterations": solver.iterations,
         "taux_succes": taux_succes,
-        "conflits_heuristique": solver.heuristic(solver.grid),
+        "conflits_heuristique": count_conflicts(solver.grid),
+        "heuristique": solver.h.name,
+        "ordre_cases": solver.order.name,
         "etats_explores": solver.visited_count,
         "memoire_max_file": solver.max_heap_size,
-        "categorie": "recherche_informee"
+        "categorie": "recherche_informee",
+        **solver.budget.to_metrics()
     }
@@ -0,0 +1,162 @@
+# ==== Moteur commun de backtracking itératif (pile explicite) : Backtracking, DFS ====
+
+import json
+from pathlib import Path
+from typing import Dict, Optional
+
+from src.core.bitboard import BitboardGrid, MASK_DIGITS
+from src.core.budget import Budget
+from src.core.cell_order import COL_OF, ROW_OF, get_cell_order
+
+
+class BacktrackEngine:
+    """
+    Backtracking sans récursion : une entrée de pile par case remplie, dans des tableaux
+    alloués une fois (autant d'entrées que de cases vides au départ) :
+      cells[k]  case choisie à la profondeur k
+      cands[k]  ses candidats au moment du choix (liste partagée de MASK_DIGITS, jamais copiée)
+      nexts[k]  nombre de candidats déjà essayés ; le dernier essayé est posé sur la grille
+    Les coups sont posés et retirés en place sur le BitboardGrid (masques mis à jour en O(1)),
+    les cases vides suivies par EmptyCells (voir src/core/cell_order.py).
+    Mesures identiques à l'ancienne version récursive : itérations (noeuds entrés),
+    retours arrière, profondeur max (noeud racine = 1).
+    Quand le budget est épuisé, la pile est conservée telle quelle : 'run' reprend là où la
+    recherche s'est arrêtée, et 'checkpoint' / 'resume' permettent de la reprendre plus tard
+    (autre processus, autre budget).
+    """
+
+    def __init__(self, board: BitboardGrid, budget: Optional[Budget] = None, cell_order=None):
+        """:param board: grille modifiée en place (solution ou état courant à la fin de 'run')"""
+        self.board = board
+        self.budget = budget or Budget()
+        self.order = get_cell_order(cell_order)
+        self.empties = self.order.empty_cells(board.cells)
+        capacity = max(1, len(self.empties))
+        self.cells = [0] * capacity
+        self.cands = [None] * capacity
+        self.nexts = [0] * capacity
+        self.depth = 0
+        self.enter = True  # un noeud reste à entrer (la racine, ou le fils du dernier coup posé)
+        self.solved = False
+        self.iterations = 0
+        self.backtracks = 0
+        self.max_depth = 0
+
+    def run(self) -> bool:
+        """Poursuit la recherche ; True si la grille est résolue, False si épuisée ou budget dépassé."""
+        if self.solved:
+            return True
+        board, budget, order, empties = self.board, self.budget, self.order, self.empties
+        cells, cands, nexts = self.cells, self.cands, self.nexts
+        depth, enter = self.depth, self.enter
+        iterations, backtracks, max_depth = self.iterations, self.backtracks, self.max_depth
+        found = False
+
+        while True:
+            if enter:
+                if budget.tick():
+                    break
+                iterations += 1
+                if depth >= max_depth:
+                    max_depth = depth + 1
+                cell, mask = order.select(board, empties)
+                if cell < 0:
+                    found = True
+                    break
+                candidates = MASK_DIGITS[mask]
+                budget.count(Budget.EXPANSIONS)
+                budget.count(Budget.CANDIDATE_CHECKS, len(candidates))
+                empties.remove(cell)
+                cells[depth] = cell
+                cands[depth] = candidates
+                nexts[depth] = 0
+                depth += 1
+
+            if depth == 0:
+                enter = False
+                break
+            # Coup suivant de la case du sommet ; le précédent (s'il y en a un) a échoué
+            top = depth - 1
+            cell = cells[top]
+            tried = nexts[top]
+            if tried:
+                board.unplace(ROW_OF[cell], COL_OF[cell])
+                backtracks += 1
+            if tried < len(cands[top]):
+                board.place(ROW_OF[cell], COL_OF[cell], cands[top][tried])
+                nexts[top] = tried + 1
+                enter = True
+            else:
+                empties.restore(cell)
+                depth -= 1
+                enter = False
+
+        self.depth, self.enter, self.solved = depth, enter, found
+        self.iterations, self.backtracks, self.max_depth = iterations, backtracks, max_depth
+        return found
+
+    @property
+    def no_solution(self) -> bool:
+        """Espace de recherche entièrement parcouru sans solution."""
+        return not self.solved and self.depth == 0 and not self.enter
+
+    # --- Points de reprise ---
+
+    def checkpoint(self) -> Dict:
+        """État complet de la recherche (sérialisable en JSON)."""
+        return {
+            "grille": self.board.cells[:],
+            "ordre_cases": self.order.name,
+            "ordre_vides": self.empties.dense[:],
+            "pile": [[self.cells[k], list(self.cands[k]), self.nexts[k]] for k in range(self.depth)],
+            "entrer": self.enter,
+            "resolu": self.solved,
+            "iterations": self.iterations,
+            "nb_backtracks": self.backtracks,
+            "profondeur_max": self.max_depth,
+        }
+
+    @classmethod
+    def resume(cls, checkpoint: Dict, budget: Optional[Budget] = None) -> "BacktrackEngine":
+        """Reconstruit un moteur depuis 'checkpoint' ; 'run' continue la recherche interrompue."""
+        cells = checkpoint["grille"]
+        if len(cells) != 81:
+            raise ValueError("❌ Point de reprise invalide (81 cases attendues).")
+        board = BitboardGrid([cells[i * 9:i * 9 + 9] for i in range(9)])
+        engine = cls(board, budget, checkpoint["ordre_cases"])
+        # Même ordre interne des cases vides qu'au moment de la sauvegarde : même suite de choix
+        engine.empties.set_order(checkpoint["ordre_vides"])
+        stack = checkpoint["pile"]
+        # Cases du chemin déjà remplies sur la grille : la pile doit contenir chemin + cases encore vides
+        capacity = len(stack) + len(engine.empties)
+        if capacity > len(engine.cells):
+            extra = capacity - len(engine.cells)
+            engine.cells += [0] * extra
+            engine.cands += [None] * extra
+            engine.nexts += [0] * extra
+        for k, (cell, candidates, tried) in enumerate(stack):
+            engine.cells[k] = cell
+            engine.cands[k] = MASK_DIGITS[sum(1 << n for n in candidates)]
+            engine.nexts[k] = tried
+        engine.depth = len(stack)
+        engine.enter = checkpoint["entrer"]
+        engine.solved = checkpoint["resolu"]
+        engine.iterations = checkpoint["iterations"]
+        engine.backtracks = checkpoint["nb_backtracks"]
+        engine.max_depth = checkpoint["profondeur_max"]
+        return engine
+
+    def save(self, path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.checkpoint(), f)
+        return path
+
+    @classmethod
+    def load(cls, path, budget: Optional[Budget] = None) -> "BacktrackEngine":
+        path = Path(path)
+        if not path.exists():
+            raise FileNotFoundError(f"❌ Point de reprise introuvable : {path}")
+        with open(path, encoding="utf-8") as f:
+            return cls.resume(json.load(f), budget)
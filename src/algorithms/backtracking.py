@@ -1,57 +1,30 @@
 # ==== ALGORITHME : Backtracking (Recherche Aveugle) ====
 
-from copy import deepcopy
-from typing import Dict
+from typing import Dict, Optional
 from src.core.grid import SudokuGrid
-from src.core.validator import is_valid, is_complete
+from src.core.validator import is_complete
+from src.core.bitboard import BitboardGrid
+from src.core.budget import Budget
+from src.core.cell_order import get_cell_order
+from src.algorithms.backtrack_engine import BacktrackEngine
 
-def find_empty(grid):
-    """Retourne la première case vide ou None si la grille est complète."""
-    for i in range(9):
-        for j in range(9):
-            if grid[i][j] == 0:
-                return i, j
-    return None
-
-def solve_backtracking(grid):
+def solve_backtracking(grid, budget: Optional[Budget] = None, cell_order=None):
     """
     Résout une grille de Sudoku avec backtracking simple.
     Retourne la solution, le nombre d'itérations, le nombre de backtracks, la profondeur max.
+    Les tests de validité passent par les masques d'un BitboardGrid (O(1)), la recherche par le
+    moteur à pile explicite (voir src/algorithms/backtrack_engine.py), dans l'ordre 'cell_order'.
+    S'arrête proprement (grille non résolue) si le budget est épuisé.
     """
-    iterations = [0]
-    backtracks = [0]
-    max_depth = [0]
-    current_depth = [0]
-
-    def backtrack():
-        iterations[0] += 1
-        current_depth[0] += 1
-        max_depth[0] = max(max_depth[0], current_depth[0])
-
-        empty = find_empty(grid)
-        if not empty:
-            current_depth[0] -= 1
-            return True
-
-        i, j = empty
-        for num in range(1, 10):
-            if is_valid(grid, i, j, num):
-                grid[i][j] = num
-                if backtrack():
-                    current_depth[0] -= 1
-                    return True
-                grid[i][j] = 0
-                backtracks[0] += 1
-        current_depth[0] -= 1
-        return False
-
-    backtrack()
-    return grid, iterations[0], backtracks[0], max_depth[0]
+    board = grid if isinstance(grid, BitboardGrid) else BitboardGrid(grid)
+    engine = BacktrackEngine(board, budget, cell_order)
+    engine.run()
+    return board.to_list(), engine.iterations, engine.backtracks, engine.max_depth
 
 # ==== Interface "moderne" pour main.py ====
-def solve(sudoku_grid: SudokuGrid) -> Dict:
-    working_grid = deepcopy(sudoku_grid.grid)
-    grid, iterations, backtracks, max_depth = solve_backtracking(working_grid)
+def solve(sudoku_grid: SudokuGrid, budget: Optional[Budget] = None, cell_order=None) -> Dict:
+    budget = budget or Budget()
+    grid, iterations, backtracks, max_depth = solve_backtracking(sudoku_grid.to_bitboard(), budget, cell_order)
     taux_succes = is_complete(grid)
     return {
         "grille_resolue": grid,
@@ -59,5 +32,7 @@ def solve(sudoku_grid: SudokuGrid) -> Dict:
         "taux_succes": taux_succes,
         "nb_backtracks": backtracks,
         "profondeur_max": max_depth,
-        "categorie": "recherche_aveugle"
+        "ordre_cases": get_cell_order(cell_order).name,
+        "categorie": "recherche_aveugle",
+        **budget.to_metrics()
     }
@@ -0,0 +1,240 @@
+# ==== Résolution par lot : masques de candidats en tableaux + propagation vectorisée (NumPy) ====
+#
+# Chaque ligne du tableau 'masks' (R, 81) est un état de recherche : masque des candidats de
+# chaque case (bit n = chiffre n, une case est fixée quand il ne reste qu'un bit).
+# Toutes les lignes avancent ensemble :
+#   1. propagation jusqu'au point fixe (singletons nus puis singletons cachés) ;
+#   2. lignes contradictoires supprimées, lignes complètes -> solution de leur grille ;
+#   3. les autres sont dédoublées sur la case au plus petit domaine :
+#      une copie reçoit le plus petit candidat (explorée à l'étape suivante),
+#      l'autre ne l'a plus (mise en réserve, reprise si la première échoue).
+# Chaque grille a donc un seul état propagé par étape (parcours en profondeur) :
+# le travail suit le nombre de noeuds de recherche, pas le nombre de branches ouvertes.
+# Une grille qui dépasse 'max_guesses' suppositions est finie par le solveur CSP (rare).
+
+import argparse
+import time
+from collections import namedtuple
+from itertools import islice
+from typing import Optional
+
+from src.core.bitboard import UNITS, POPCOUNT, FULL_MASK
+from src.core.batch_validator import np, to_array, _require_numpy
+from src.core.budget import Budget
+
+BatchSolution = namedtuple("BatchSolution", ["solutions", "solved", "stats"])
+
+if np is not None:
+    _UNITS = np.array(UNITS, dtype=np.intp)                       # (27, 9)
+    _POPCOUNT = np.array(POPCOUNT, dtype=np.uint8)                # masque -> nombre de candidats
+    _LOWBIT = np.array([m & -m for m in range(1 << 10)], dtype=np.uint16)
+    # Position (unité * 9 + rang) des 3 unités de chaque case, pour rapatrier les singletons cachés
+    _CELL_UNITS = np.array([[u for u in range(27) if cell in UNITS[u]] for cell in range(81)],
+                           dtype=np.intp)                         # (81, 3)
+    _CELL_UNIT_POS = np.array(
+        [[u * 9 + UNITS[u].index(cell) for u in range(27) if cell in UNITS[u]] for cell in range(81)],
+        dtype=np.intp,
+    )                                                             # (81, 3)
+    _VALUE_OF_BIT = np.zeros(1 << 10, dtype=np.uint8)
+    for _d in range(1, 10):
+        _VALUE_OF_BIT[1 << _d] = _d
+
+
+def _initial_masks(grids: "np.ndarray") -> "np.ndarray":
+    """Grilles (N, 81) -> masques : indice = son bit, case vide = tous les candidats."""
+    bits = np.left_shift(np.uint16(1), grids.astype(np.uint16))
+    return np.where(grids == 0, np.uint16(FULL_MASK), bits).astype(np.uint16)
+
+
+def _propagate(masks: "np.ndarray"):
+    """
+    Propagation en place jusqu'au point fixe.
+    Retourne (lignes en contradiction, nombre de passes).
+    """
+    dead = np.zeros(len(masks), dtype=bool)
+    rounds = 0
+    active = np.arange(len(masks))
+    while len(active):
+        rounds += 1
+        m = masks[active]
+        before = m
+
+        # Singletons nus : les chiffres fixés d'une unité sont retirés des autres cases de l'unité
+        fixed = np.where(_POPCOUNT[m] == 1, m, np.uint16(0))
+        unit_fixed = fixed[:, _UNITS]                                       # (r, 27, 9)
+        unit_or = np.bitwise_or.reduce(unit_fixed, axis=2)                  # (r, 27)
+        # Deux cases fixées au même chiffre dans une unité : somme des bits != union
+        clash = (unit_fixed.sum(axis=2, dtype=np.uint16) != unit_or).any(axis=1)
+        eliminated = np.bitwise_or.reduce(unit_or[:, _CELL_UNITS], axis=2)  # (r, 81)
+        m = np.where(fixed != 0, m, m & ~eliminated)
+
+        # Singletons cachés : chiffres présents dans une seule case de l'unité (cumul « une fois / deux fois »)
+        unit_masks = m[:, _UNITS]
+        once = np.zeros(unit_masks.shape[:2], dtype=np.uint16)
+        twice = np.zeros_like(once)
+        for k in range(9):
+            d = unit_masks[:, :, k]
+            twice |= once & d
+            once |= d
+        missing = (once != FULL_MASK).any(axis=1)
+        singles = once & ~twice
+        forced_units = (unit_masks & singles[:, :, None]).reshape(len(m), 243)
+        forced = np.bitwise_or.reduce(forced_units[:, _CELL_UNIT_POS], axis=2)
+        # Une case forcée à deux chiffres différents : contradiction
+        clash |= (_POPCOUNT[forced] > 1).any(axis=1)
+        m = np.where(forced != 0, forced, m)
+
+        contradiction = clash | missing | (m == 0).any(axis=1)
+        masks[active] = m
+        dead[active[contradiction]] = True
+        changed = (m != before).any(axis=1) & ~contradiction
+        active = active[changed]
+    return dead, rounds
+
+
+def _solve_chunk(grids: "np.ndarray", max_guesses: int, budget: Budget):
+    """Résout un paquet de grilles (N, 81)."""
+    n = len(grids)
+    solutions = np.zeros((n, 81), dtype=np.uint8)
+    solved = np.zeros(n, dtype=bool)
+    guesses = np.zeros(n, dtype=np.int32)
+    rounds = np.zeros(n, dtype=np.int32)
+    fallback = np.zeros(n, dtype=bool)
+
+    # Réserve des états : chaque grille explore en profondeur son état le plus récent (seq max),
+    # les alternatives attendent leur tour dans la réserve
+    pool = _initial_masks(grids)
+    owner = np.arange(n)
+    seq = np.zeros(n, dtype=np.int64)
+    step = 0
+    while len(pool):
+        if budget.check():
+            break
+        step += 1
+        order = np.lexsort((-seq, owner))
+        sorted_owner = owner[order]
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = sorted_owner[1:] != sorted_owner[:-1]
+        front = order[first]
+        waiting = order[~first]
+
+        masks, front_owner = pool[front], owner[front]
+        pool, owner, seq = pool[waiting], owner[waiting], seq[waiting]
+
+        dead, nb_rounds = _propagate(masks)
+        rounds[front_owner] += nb_rounds
+
+        complete = ~dead & (_POPCOUNT[masks] == 1).all(axis=1)
+        if complete.any():
+            done = front_owner[complete]
+            solved[done] = True
+            solutions[done] = _VALUE_OF_BIT[masks[complete]]
+            kept = ~solved[owner]
+            pool, owner, seq = pool[kept], owner[kept], seq[kept]
+
+        alive = ~dead & ~complete
+        masks, front_owner = masks[alive], front_owner[alive]
+        if not len(masks):
+            continue
+
+        # Trop de suppositions pour une grille : elle sera finie par le solveur CSP
+        guesses[front_owner] += 1
+        too_many = guesses[front_owner] > max_guesses
+        if too_many.any():
+            fallback[front_owner[too_many]] = True
+            masks, front_owner = masks[~too_many], front_owner[~too_many]
+            kept = ~fallback[owner]
+            pool, owner, seq = pool[kept], owner[kept], seq[kept]
+
+        # Branchement sur la case au plus petit domaine (> 1) :
+        # « plus petit candidat » exploré d'abord, « sans ce candidat » mis en réserve
+        sizes = _POPCOUNT[masks]
+        cell = np.where(sizes > 1, sizes, 10).argmin(axis=1)
+        rows = np.arange(len(masks))
+        current = masks[rows, cell]
+        low = _LOWBIT[current]
+        without_low = masks.copy()
+        without_low[rows, cell] = current & ~low
+        masks[rows, cell] = low
+        pool = np.concatenate([pool, without_low, masks])
+        owner = np.concatenate([owner, front_owner, front_owner])
+        seq = np.concatenate([seq, np.full(len(masks), 2 * step), np.full(len(masks), 2 * step + 1)])
+
+    for puzzle in np.flatnonzero(fallback & ~solved):
+        solution = _solve_scalar(grids[puzzle], budget)
+        if solution is not None:
+            solved[puzzle] = True
+            solutions[puzzle] = solution
+
+    stats = {"passes": rounds, "suppositions": guesses, "repli_csp": fallback}
+    return solutions, solved, stats
+
+
+def _solve_scalar(grid: "np.ndarray", budget: Budget):
+    """Repli : solveur CSP sur une seule grille."""
+    from src.algorithms.csp import CSPSolver
+    rows = grid.reshape(9, 9).tolist()
+    solver = CSPSolver(rows, budget=budget)
+    if not solver.solve():
+        return None
+    return np.array(solver.values, dtype=np.uint8)
+
+
+def solve_batch(puzzles, chunk_size: int = 4096, max_guesses: int = 200,
+                budget: Optional[Budget] = None) -> BatchSolution:
+    """
+    Résout un lot de grilles.
+    :param puzzles: tableau (N, 9, 9) / (N, 81), liste de grilles 9x9, de chaînes de 81 chiffres,
+                    ou itérable de ces formes (consommé par paquets de 'chunk_size')
+    :param max_guesses: suppositions au-delà desquelles une grille passe au solveur CSP
+    :param budget: budget partagé par tout le lot (vérifié entre deux étapes)
+    :return: BatchSolution(solutions (N, 81) uint8 (zéros si non résolue), solved (N,) bool,
+             stats : dict de tableaux (N,) passes, suppositions, repli_csp)
+    """
+    _require_numpy()
+    budget = budget or Budget()
+    if isinstance(puzzles, np.ndarray):
+        chunks = (puzzles[i:i + chunk_size] for i in range(0, len(puzzles), chunk_size))
+    else:
+        iterator = iter(puzzles)
+        chunks = iter(lambda: list(islice(iterator, chunk_size)), [])
+
+    parts = []
+    for chunk in chunks:
+        grids = to_array(chunk).reshape(-1, 81)
+        parts.append(_solve_chunk(grids, max_guesses, budget))
+    if not parts:
+        empty = np.zeros(0, dtype=np.int32)
+        return BatchSolution(np.zeros((0, 81), np.uint8), np.zeros(0, bool),
+                             {"passes": empty, "suppositions": empty, "repli_csp": np.zeros(0, bool)})
+
+    solutions = np.concatenate([p[0] for p in parts])
+    solved = np.concatenate([p[1] for p in parts])
+    stats = {key: np.concatenate([p[2][key] for p in parts]) for key in parts[0][2]}
+    return BatchSolution(solutions, solved, stats)
+
+
+if __name__ == "__main__":
+    import csv
+    from src.utils.loader import iter_puzzles
+
+    parser = argparse.ArgumentParser(description="Résout toutes les grilles d'un jeu de données par lot")
+    parser.add_argument("dataset", help="Fichier de grilles (CSV, CSV compressé ou .sdkb)")
+    parser.add_argument("--out", default=None, help="CSV de sortie (puzzle_id, puzzle, solution)")
+    parser.add_argument("--chunk-size", type=int, default=4096)
+    args = parser.parse_args()
+
+    records = list(iter_puzzles(args.dataset))
+    start = time.perf_counter()
+    result = solve_batch([r.puzzle for r in records], chunk_size=args.chunk_size)
+    elapsed = time.perf_counter() - start
+    print(f"✅ {int(result.solved.sum())}/{len(records)} grilles résolues en {elapsed:.2f}s "
+          f"({len(records) / max(elapsed, 1e-9):.0f} grilles/s, "
+          f"{int(result.stats['repli_csp'].sum())} via le solveur CSP)")
+
+    if args.out:
+        with open(args.out, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["puzzle_id", "puzzle", "solution"])
+            for record, solution, ok in zip(records, result.solutions, result.solved):
+                writer.writerow([record.puzzle_id, record.puzzle, "".join(map(str, solution)) if ok else ""])
@@ -1,39 +1,36 @@
 # ==== ALGORITHME : Beam Search (Recherche informée) ====
 
 import heapq
-from copy import deepcopy
-from typing import Dict, List
+from typing import Dict, List, Optional, Union
 from src.core.grid import SudokuGrid
-from src.core.validator import is_valid, is_complete
+from src.core.validator import is_complete
+from src.core.bitboard import digits
+from src.core import state as compact
+from src.core.budget import Budget
+from src.core.cell_order import get_cell_order
+from src.algorithms.heuristics import count_conflicts, get_heuristic
 
-def find_empty(grid: List[List[int]]):
-    for i in range(9):
-        for j in range(9):
-            if grid[i][j] == 0:
-                return i, j
-    return None
-
-def heuristic_conflicts(grid: List[List[int]]) -> int:
+def heuristic_conflicts(grid: Union[List[List[int]], bytes]) -> int:
     """
-    Heuristique : nombre de conflits (lignes + colonnes).
+    Heuristique : nombre de conflits (lignes + colonnes), recalculé sur toute la grille.
     """
-    conflicts = 0
-    for i in range(9):
-        row_count = [0] * 10
-        col_count = [0] * 10
-        for j in range(9):
-            row_count[grid[i][j]] += 1
-            col_count[grid[j][i]] += 1
-        conflicts += sum(c - 1 for c in row_count if c > 1)
-        conflicts += sum(c - 1 for c in col_count if c > 1)
-    return conflicts
+    return count_conflicts(grid)
 
-def solve_beam(grid: List[List[int]], beam_width: int = 5):
+def solve_beam(grid: List[List[int]], beam_width: int = 5,
+               budget: Optional[Budget] = None, heuristic=None, cell_order=None):
     """
     Beam Search limité : explore les 'beam_width' meilleures grilles à chaque étape.
+    Chaque candidat garde (h, état, aux) : le score d'un fils se déduit de celui de son parent.
+    La case développée est choisie par 'cell_order' (voir src/core/cell_order.py).
     Mesure : itérations, heuristique finale, états explorés, taux succès.
     """
-    beam = [(heuristic_conflicts(grid), deepcopy(grid))]
+    h_func = get_heuristic(heuristic)
+    order = get_cell_order(cell_order)
+    # États compacts (81 octets) : un fils = une tranche de bytes, l'état sert de clé
+    board = compact.from_grid(grid)
+    budget = budget or Budget()
+    h_root, aux_root = h_func.root(board)
+    beam = [(h_root, board, aux_root)]
     iterations = 0
     max_beam_size = 1
     etats_explores = set()
@@ -41,24 +38,26 @@ def solve_beam(grid: List[List[int]], beam_width: int = 5):
     while beam:
         max_beam_size = max(max_beam_size, len(beam))
         new_candidates = []
-        for _, g in beam:
+        for h, g, aux in beam:
+            if budget.tick():
+                break
             iterations += 1
-            grid_tuple = tuple(tuple(row) for row in g)
-            etats_explores.add(grid_tuple)
-            if is_complete(g):
-                return g, iterations, heuristic_conflicts(g), len(etats_explores), max_beam_size
+            etats_explores.add(g)
+            cell, mask = order.select_state(g)
+            if cell < 0:
+                return compact.to_list(g), iterations, heuristic_conflicts(g), len(etats_explores), max_beam_size
 
-            empty = find_empty(g)
-            if not empty:
-                continue
+            candidates = digits(mask)
+            budget.count(Budget.EXPANSIONS)
+            budget.count(Budget.CANDIDATE_CHECKS, len(candidates))
+            budget.count(Budget.COPIES, len(candidates))
+            for num in candidates:
+                new_grid = compact.place(g, cell, num)
+                score, aux_n = h_func.child(g, h, aux, cell, num, new_grid)
+                new_candidates.append((score, new_grid, aux_n))
 
-            i, j = empty
-            for num in range(1, 10):
-                if is_valid(g, i, j, num):
-                    new_grid = deepcopy(g)
-                    new_grid[i][j] = num
-                    score = heuristic_conflicts(new_grid)
-                    new_candidates.append((score, new_grid))
+        if budget.exhausted:
+            break
 
         # Garde les meilleurs selon l'heuristique
         beam = heapq.nsmallest(beam_width, new_candidates, key=lambda x: x[0])
@@ -67,11 +66,13 @@ def solve_beam(grid: List[List[int]], beam_width: int = 5):
     if beam:
         best_grid = beam[0][1]
     else:
-        best_grid = grid
-    return best_grid, iterations, heuristic_conflicts(best_grid), len(etats_explores), max_beam_size
+        best_grid = board
+    return compact.to_list(best_grid), iterations, heuristic_conflicts(best_grid), len(etats_explores), max_beam_size
 
-def solve(sudoku_grid: SudokuGrid) -> Dict:
-    grid, iterations, h_final, etats, max_beam = solve_beam(sudoku_grid.grid)
+def solve(sudoku_grid: SudokuGrid, budget: Optional[Budget] = None, heuristic=None, cell_order=None) -> Dict:
+    budget = budget or Budget()
+    grid, iterations, h_final, etats, max_beam = solve_beam(sudoku_grid.grid, budget=budget,
+                                                            heuristic=heuristic, cell_order=cell_order)
     taux_succes = is_complete(grid)
     return {
         "grille_resolue": grid,
@@ -80,5 +81,8 @@ def solve(sudoku_grid: SudokuGrid) -> Dict:
         "conflits_heuristique": h_final,
         "etats_explores": etats,
         "memoire_max_beam": max_beam,
-        "categorie": "recherche_informee"
+        "heuristique": get_heuristic(heuristic).name,
+        "ordre_cases": get_cell_order(cell_order).name,
+        "categorie": "recherche_informee",
+        **budget.to_metrics()
     }
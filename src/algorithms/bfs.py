@@ -1,52 +1,58 @@
 # ==== ALGORITHME : BFS (Recherche Aveugle) ====
 
 from collections import deque
-from copy import deepcopy
-from typing import Dict
+from typing import Dict, Optional
 from src.core.grid import SudokuGrid
-from src.core.validator import is_valid, is_complete
-
-def find_empty(grid):
-    for i in range(9):
-        for j in range(9):
-            if grid[i][j] == 0:
-                return i, j
-    return None
-
-def solve_bfs(grid):
+from src.core.validator import is_complete
+from src.core.bitboard import digits
+from src.core import state as compact
+from src.core.budget import Budget
+from src.core.cell_order import get_cell_order
+
+def solve_bfs(grid, budget: Optional[Budget] = None, cell_order=None):
+    """
+    BFS sur les grilles partielles ; chaque niveau remplit la case choisie par 'cell_order'.
+    Si le budget est épuisé, retourne le dernier état exploré (solution partielle).
+    """
+    budget = budget or Budget()
+    order = get_cell_order(cell_order)
+    # Les états de la file sont compacts (81 octets) : un fils = une tranche de bytes
+    start = compact.from_grid(grid)
     queue = deque()
-    queue.append((deepcopy(grid), 0))
+    queue.append((start, 0))
     iterations = 0
     max_queue_size = 1  # Pour évaluer le pic de mémoire utilisée
 
     while queue:
         max_queue_size = max(max_queue_size, len(queue))
         current_grid, depth = queue.popleft()
+        if budget.tick():
+            return compact.to_list(current_grid), iterations, max_queue_size
         iterations += 1
 
-        if is_complete(current_grid):
-            return current_grid, iterations, max_queue_size
-
-        empty = find_empty(current_grid)
-        if not empty:
-            continue
+        cell, mask = order.select_state(current_grid)
+        if cell < 0:
+            return compact.to_list(current_grid), iterations, max_queue_size
 
-        i, j = empty
-        for num in range(1, 10):
-            if is_valid(current_grid, i, j, num):
-                new_grid = deepcopy(current_grid)
-                new_grid[i][j] = num
-                queue.append((new_grid, depth + 1))
+        candidates = digits(mask)
+        budget.count(Budget.EXPANSIONS)
+        budget.count(Budget.CANDIDATE_CHECKS, len(candidates))
+        budget.count(Budget.COPIES, len(candidates))
+        for num in candidates:
+            queue.append((compact.place(current_grid, cell, num), depth + 1))
 
     return None, iterations, max_queue_size
 
-def solve(sudoku_grid: SudokuGrid) -> Dict:
-    grid, iterations, max_queue_size = solve_bfs(sudoku_grid.grid)
+def solve(sudoku_grid: SudokuGrid, budget: Optional[Budget] = None, cell_order=None) -> Dict:
+    budget = budget or Budget()
+    grid, iterations, max_queue_size = solve_bfs(sudoku_grid.grid, budget, cell_order)
     taux_succes = is_complete(grid) if grid else False
     return {
         "grille_resolue": grid if grid is not None else [],
         "iterations": iterations,
         "taux_succes": taux_succes,
         "memoire_max_file": max_queue_size,
-        "categorie": "recherche_aveugle"
+        "ordre_cases": get_cell_order(cell_order).name,
+        "categorie": "recherche_aveugle",
+        **budget.to_metrics()
     }
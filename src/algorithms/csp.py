@@ -0,0 +1,228 @@
+# ==== ALGORITHME : CSP - Propagation de contraintes + MRV (Contraintes) ====
+
+from typing import Dict, List, Optional
+from src.core.grid import SudokuGrid
+from src.core.validator import is_complete
+from src.core.bitboard import FULL_MASK, MASK_DIGITS, POPCOUNT, UNITS, PEERS
+from src.core.budget import Budget
+
+class CSPSolver:
+    """
+    Solveur CSP : chaque case porte un domaine (masque de bits des chiffres possibles).
+    Propagation : singletons nus, singletons cachés et paires nues (ces deux règles sont désactivables).
+    Branchement : variable au plus petit domaine (MRV).
+    Les domaines sont modifiés en place ; une pile (trail) permet d'annuler au backtrack.
+    """
+
+    def __init__(self, grid: List[List[int]], use_pairs: bool = True, budget: Optional[Budget] = None,
+                 use_hidden: bool = True):
+        self.original_grid = [row[:] for row in grid]
+        self.use_pairs = use_pairs
+        self.use_hidden = use_hidden
+        self.budget = budget or Budget()
+        self.domains = [FULL_MASK] * 81
+        self.values = [0] * 81
+        self.trail = []      # (case, ancien domaine, ancienne valeur)
+        self.pending = []    # cases dont le domaine est devenu un singleton
+        self.iterations = 0
+        self.nb_assignations = 0
+        self.nb_backtracks = 0
+        self.max_depth = 0
+        self.max_domain_size = 0
+        self.solved = False
+
+    # --- Gestion des domaines ---
+
+    def _save(self, cell: int):
+        self.trail.append((cell, self.domains[cell], self.values[cell]))
+
+    def _undo(self, mark: int):
+        trail = self.trail
+        while len(trail) > mark:
+            cell, domain, value = trail.pop()
+            self.domains[cell] = domain
+            self.values[cell] = value
+
+    def _assign(self, cell: int, digit: int) -> bool:
+        """Affecte 'digit' à la case et le retire du domaine de ses voisins."""
+        bit = 1 << digit
+        if not self.domains[cell] & bit:
+            return False
+        self._save(cell)
+        self.domains[cell] = bit
+        self.values[cell] = digit
+        self.nb_assignations += 1
+
+        domains = self.domains
+        for peer in PEERS[cell]:
+            d = domains[peer]
+            if d & bit:
+                d &= ~bit
+                if not d:
+                    return False
+                self._save(peer)
+                domains[peer] = d
+                if POPCOUNT[d] == 1:
+                    self.pending.append(peer)
+        return True
+
+    # --- Propagation ---
+
+    def _hidden_singles(self):
+        """
+        Un chiffre qui n'a plus qu'une place possible dans une unité y est forcé.
+        Retourne True si un domaine a été réduit, False sinon, None en cas de contradiction.
+        """
+        domains, values = self.domains, self.values
+        changed = False
+        for unit in UNITS:
+            once = twice = placed = 0
+            for cell in unit:
+                if values[cell]:
+                    placed |= domains[cell]
+                    continue
+                d = domains[cell]
+                twice |= once & d
+                once |= d
+            if (once | placed) != FULL_MASK:
+                return None  # un chiffre n'a plus aucune place dans l'unité
+            singles = once & ~twice & ~placed
+            if not singles:
+                continue
+            for digit in MASK_DIGITS[singles]:
+                bit = 1 << digit
+                for cell in unit:
+                    if not values[cell] and domains[cell] & bit:
+                        if domains[cell] != bit:
+                            self._save(cell)
+                            domains[cell] = bit
+                        self.pending.append(cell)
+                        changed = True
+                        break
+        return changed
+
+    def _naked_pairs(self):
+        """
+        Deux cases d'une unité partageant le même domaine à deux valeurs
+        excluent ces valeurs des autres cases de l'unité.
+        """
+        domains, values = self.domains, self.values
+        changed = False
+        for unit in UNITS:
+            seen = {}
+            for cell in unit:
+                d = domains[cell]
+                if values[cell] or POPCOUNT[d] != 2:
+                    continue
+                if d not in seen:
+                    seen[d] = cell
+                    continue
+                first = seen[d]
+                for other in unit:
+                    if other == cell or other == first or values[other]:
+                        continue
+                    od = domains[other]
+                    if od & d:
+                        od &= ~d
+                        if not od:
+                            return None
+                        self._save(other)
+                        domains[other] = od
+                        if POPCOUNT[od] == 1:
+                            self.pending.append(other)
+                        changed = True
+        return changed
+
+    def _propagate(self) -> bool:
+        """Applique les règles jusqu'au point fixe. Retourne False si contradiction."""
+        while True:
+            while self.pending:
+                cell = self.pending.pop()
+                if self.values[cell]:
+                    continue
+                d = self.domains[cell]
+                if POPCOUNT[d] != 1 or not self._assign(cell, MASK_DIGITS[d][0]):
+                    return False
+
+            changed = self._hidden_singles() if self.use_hidden else False
+            if changed is None:
+                return False
+            if not changed and self.use_pairs:
+                changed = self._naked_pairs()
+                if changed is None:
+                    return False
+            if not changed:
+                return True
+
+    # --- Recherche ---
+
+    def _select_mrv(self):
+        """Case non affectée au plus petit domaine (None si tout est affecté)."""
+        best, best_size = None, 10
+        domains, values = self.domains, self.values
+        for cell in range(81):
+            if values[cell]:
+                continue
+            size = POPCOUNT[domains[cell]]
+            if size < best_size:
+                best, best_size = cell, size
+                if size == 2:
+                    break
+        return best
+
+    def _search(self, depth: int) -> bool:
+        if self.budget.tick():
+            return False
+        self.iterations += 1
+        self.max_depth = max(self.max_depth, depth)
+
+        cell = self._select_mrv()
+        if cell is None:
+            return True
+
+        domain = self.domains[cell]
+        self.max_domain_size = max(self.max_domain_size, POPCOUNT[domain])
+        self.budget.count(Budget.EXPANSIONS)
+        self.budget.count(Budget.CANDIDATE_CHECKS, POPCOUNT[domain])
+        for digit in MASK_DIGITS[domain]:
+            mark = len(self.trail)
+            self.pending.clear()
+            if self._assign(cell, digit) and self._propagate() and self._search(depth + 1):
+                return True
+            self._undo(mark)
+            if self.budget.exhausted:
+                break
+            self.nb_backtracks += 1
+        return False
+
+    def solve(self) -> bool:
+        for i in range(9):
+            for j in range(9):
+                num = self.original_grid[i][j]
+                if num != 0 and not self._assign(i * 9 + j, num):
+                    return False
+        if not self._propagate():
+            return False
+        self.solved = self._search(0)
+        return self.solved
+
+    @property
+    def grid(self):
+        values = self.values if self.solved else [v for row in self.original_grid for v in row]
+        return [values[i * 9:i * 9 + 9] for i in range(9)]
+
+def solve(sudoku_grid: SudokuGrid, budget: Optional[Budget] = None) -> Dict:
+    solver = CSPSolver(sudoku_grid.grid, budget=budget)
+    solver.solve()
+    grid = solver.grid
+    return {
+        "grille_resolue": grid,
+        "iterations": solver.iterations,
+        "taux_succes": is_complete(grid),
+        "nb_assignations": solver.nb_assignations,
+        "nb_backtracks": solver.nb_backtracks,
+        "profondeur_max": solver.max_depth,
+        "taille_max_domaine": solver.max_domain_size,
+        "categorie": "recherche_csp",
+        **solver.budget.to_metrics()
+    }
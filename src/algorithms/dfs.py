@@ -1,59 +1,38 @@
 # ==== ALGORITHME : DFS (Recherche Aveugle) ====
 
-from copy import deepcopy
-from typing import Dict
+from typing import Dict, Optional
 from src.core.grid import SudokuGrid
-from src.core.validator import is_valid, is_complete
+from src.core.validator import is_complete
+from src.core.bitboard import BitboardGrid
+from src.core.budget import Budget
+from src.core.cell_order import get_cell_order
+from src.algorithms.backtrack_engine import BacktrackEngine
 
-def find_empty(grid):
-    """Retourne la première case vide (ou None si complète)."""
-    for i in range(9):
-        for j in range(9):
-            if grid[i][j] == 0:
-                return i, j
-    return None
-
-def solve_dfs(grid):
+def solve_dfs(grid, budget: Optional[Budget] = None, cell_order=None):
     """
-    DFS récursif pour résoudre une grille Sudoku.
-    Explore en profondeur en remplissant les cases une par une.
+    DFS pour résoudre une grille Sudoku, sur le moteur à pile explicite
+    (voir src/algorithms/backtrack_engine.py).
+    Explore en profondeur en remplissant les cases une par une,
+    dans l'ordre donné par 'cell_order' (voir src/core/cell_order.py).
     Mesure : nombre d'itérations, profondeur max atteinte.
+    S'arrête proprement (grille non résolue) si le budget est épuisé.
     """
-    iterations = [0]
-    max_depth = [0]
-    current_depth = [0]
-
-    def backtrack(grid):
-        iterations[0] += 1
-        current_depth[0] += 1
-        max_depth[0] = max(max_depth[0], current_depth[0])
-        empty = find_empty(grid)
-        if not empty:
-            current_depth[0] -= 1
-            return True
-
-        i, j = empty
-        for num in range(1, 10):
-            if is_valid(grid, i, j, num):
-                grid[i][j] = num
-                if backtrack(grid):
-                    current_depth[0] -= 1
-                    return True
-                grid[i][j] = 0  # Annule si échec
-        current_depth[0] -= 1
-        return False
-
-    working_grid = deepcopy(grid)
-    backtrack(working_grid)
-    return working_grid, iterations[0], max_depth[0]
+    # Copie de travail : la grille d'entrée n'est jamais modifiée
+    board = grid.copy() if isinstance(grid, BitboardGrid) else BitboardGrid(grid)
+    engine = BacktrackEngine(board, budget, cell_order)
+    engine.run()
+    return board.to_list(), engine.iterations, engine.max_depth
 
-def solve(sudoku_grid: SudokuGrid) -> Dict:
-    grid, iterations, max_depth = solve_dfs(sudoku_grid.grid)
+def solve(sudoku_grid: SudokuGrid, budget: Optional[Budget] = None, cell_order=None) -> Dict:
+    budget = budget or Budget()
+    grid, iterations, max_depth = solve_dfs(sudoku_grid.to_bitboard(), budget, cell_order)
     taux_succes = is_complete(grid)
     return {
         "grille_resolue": grid,
         "iterations": iterations,
         "taux_succes": taux_succes,
         "profondeur_max": max_depth,
-        "categorie": "recherche_aveugle"
+        "ordre_cases": get_cell_order(cell_order).name,
+        "categorie": "recherche_aveugle",
+        **budget.to_metrics()
     }
@@ -0,0 +1,246 @@
+# ==== ALGORITHME : Dancing Links / Algorithme X (Contraintes - couverture exacte) ====
+
+import threading
+from typing import Dict, List, Optional
+from src.core.grid import SudokuGrid
+from src.core.validator import is_complete
+from src.core.budget import Budget
+
+# Couverture exacte : 729 lignes (case, chiffre) x 324 contraintes
+#   0..80    : case (r, c) remplie
+#   81..161  : ligne r contient d
+#   162..242 : colonne c contient d
+#   243..323 : bloc b contient d
+NB_COLUMNS = 324
+NB_ROWS = 729
+
+def row_id(row: int, col: int, num: int) -> int:
+    """Indice de la ligne de la matrice pour le placement de 'num' en (row, col)."""
+    return (row * 9 + col) * 9 + (num - 1)
+
+def row_columns(rid: int) -> List[int]:
+    """Les 4 contraintes couvertes par une ligne de la matrice."""
+    cell, d = divmod(rid, 9)
+    r, c = divmod(cell, 9)
+    b = (r // 3) * 3 + c // 3
+    return [cell, 81 + r * 9 + d, 162 + c * 9 + d, 243 + b * 9 + d]
+
+
+class DancingLinks:
+    """
+    Structure de liens dansants stockée dans des tableaux plats (L, R, U, D, C, ROW, S).
+    Le noeud 0 est la racine, les noeuds 1..324 sont les en-têtes de colonnes,
+    les 2916 suivants sont les noeuds des 729 lignes (4 par ligne).
+    La matrice est construite une seule fois : chaque résolution recouvre puis
+    découvre ses colonnes dans l'ordre inverse, ce qui restaure exactement la structure.
+    Une résolution interrompue par une exception (TaskTimeout, KeyboardInterrupt...) laisse des
+    colonnes recouvertes : la structure est alors marquée abîmée et reconstruite à la résolution suivante.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()    # la structure est partagée : une résolution à la fois
+        self._build()
+
+    def _build(self):
+        size = 1 + NB_COLUMNS + NB_ROWS * 4
+        self.L = [0] * size
+        self.R = [0] * size
+        self.U = list(range(size))
+        self.D = list(range(size))
+        self.C = [0] * size
+        self.ROW = [-1] * size
+        self.S = [0] * (NB_COLUMNS + 1)
+        self.row_nodes = [0] * NB_ROWS  # premier noeud de chaque ligne
+        self.intact = True
+        L, R, U, D, C, ROW, S = self.L, self.R, self.U, self.D, self.C, self.ROW, self.S
+        # En-têtes chaînés horizontalement avec la racine
+        for h in range(NB_COLUMNS + 1):
+            L[h] = h - 1 if h > 0 else NB_COLUMNS
+            R[h] = h + 1 if h < NB_COLUMNS else 0
+            C[h] = h
+
+        node = NB_COLUMNS + 1
+        for rid in range(NB_ROWS):
+            first = node
+            self.row_nodes[rid] = first
+            for k, col in enumerate(row_columns(rid)):
+                h = col + 1
+                # Insertion en bas de la colonne
+                U[node] = U[h]
+                D[node] = h
+                D[U[h]] = node
+                U[h] = node
+                C[node] = h
+                ROW[node] = rid
+                S[h] += 1
+                # Chaînage circulaire des 4 noeuds de la ligne
+                L[node] = first + (k - 1) % 4
+                R[node] = first + (k + 1) % 4
+                node += 1
+
+    def _cover(self, c: int):
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+        L[R[c]] = L[c]
+        R[L[c]] = R[c]
+        i = D[c]
+        while i != c:
+            j = R[i]
+            while j != i:
+                U[D[j]] = U[j]
+                D[U[j]] = D[j]
+                S[C[j]] -= 1
+                j = R[j]
+            i = D[i]
+
+    def _uncover(self, c: int):
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+        i = U[c]
+        while i != c:
+            j = L[i]
+            while j != i:
+                S[C[j]] += 1
+                U[D[j]] = j
+                D[U[j]] = j
+                j = L[j]
+            i = U[i]
+        L[R[c]] = c
+        R[L[c]] = c
+
+    def run(self, givens: List[int], max_solutions: int = 1, budget: Optional[Budget] = None):
+        """
+        Cherche jusqu'à 'max_solutions' solutions étant donné les lignes imposées 'givens'
+        (arrêt anticipé si le budget est épuisé).
+        Retourne (première solution ou None, nb solutions, itérations, backtracks, profondeur max).
+        La structure est rendue intacte à la fin (ou reconstruite au prochain appel après une exception).
+        """
+        if not self.intact:
+            self._build()
+        try:
+            return self._run(givens, max_solutions, budget)
+        except BaseException:
+            # Interruption au milieu d'un recouvrement : les liens ne sont plus cohérents
+            self.intact = False
+            raise
+
+    def _run(self, givens: List[int], max_solutions: int, budget: Optional[Budget]):
+        covered = []
+        active = [True] * (NB_COLUMNS + 1)
+        consistent = True
+        for rid in givens:
+            heads = [col + 1 for col in row_columns(rid)]
+            if not all(active[h] for h in heads):
+                consistent = False  # deux indices se contredisent
+                break
+            for h in heads:
+                self._cover(h)
+                active[h] = False
+                covered.append(h)
+
+        state = {"solution": None, "count": 0, "iterations": 0, "backtracks": 0, "max_depth": 0,
+                 "budget": budget or Budget()}
+        if consistent:
+            self._search(0, list(givens), max_solutions, state)
+
+        for h in reversed(covered):
+            self._uncover(h)
+        return state["solution"], state["count"], state["iterations"], state["backtracks"], state["max_depth"]
+
+    def _search(self, depth: int, partial: List[int], max_solutions: int, state: Dict) -> bool:
+        """Algorithme X ; retourne True quand la limite de solutions ou le budget est atteint."""
+        R, D, C, S, ROW = self.R, self.D, self.C, self.S, self.ROW
+        if state["budget"].tick():
+            return True
+        state["iterations"] += 1
+        state["max_depth"] = max(state["max_depth"], depth)
+
+        if R[0] == 0:
+            state["count"] += 1
+            if state["solution"] is None:
+                state["solution"] = partial[:]
+                state["budget"].count(Budget.COPIES)
+            return state["count"] >= max_solutions
+
+        # Colonne de plus petite taille (heuristique S de Knuth)
+        c = R[0]
+        best = S[c]
+        j = R[c]
+        while j != 0 and best > 1:
+            if S[j] < best:
+                c, best = j, S[j]
+            j = R[j]
+        if best == 0:
+            return False
+        state["budget"].count(Budget.EXPANSIONS)
+        state["budget"].count(Budget.CANDIDATE_CHECKS, best)
+
+        self._cover(c)
+        stop = False
+        r = D[c]
+        while r != c:
+            partial.append(ROW[r])
+            j = R[r]
+            while j != r:
+                self._cover(C[j])
+                j = R[j]
+
+            stop = self._search(depth + 1, partial, max_solutions, state)
+
+            j = self.L[r]
+            while j != r:
+                self._uncover(C[j])
+                j = self.L[j]
+            partial.pop()
+            if stop:
+                break
+            state["backtracks"] += 1
+            r = D[r]
+        self._uncover(c)
+        return stop
+
+
+_ENGINE: Optional[DancingLinks] = None
+
+def get_engine() -> DancingLinks:
+    """Instance partagée (construite au premier appel puis réutilisée)."""
+    global _ENGINE
+    if _ENGINE is None:
+        _ENGINE = DancingLinks()
+    return _ENGINE
+
+def solve_dlx(grid: List[List[int]], max_solutions: int = 1, budget: Optional[Budget] = None):
+    """
+    Résout la grille par couverture exacte.
+    Retourne la solution (ou None), le nombre de solutions trouvées (plafonné à max_solutions),
+    les itérations, les backtracks et la profondeur max.
+    """
+    givens = [row_id(i, j, grid[i][j]) for i in range(9) for j in range(9) if grid[i][j] != 0]
+    engine = get_engine()
+    with engine.lock:
+        rows, count, iterations, backtracks, max_depth = engine.run(givens, max_solutions, budget)
+
+    solution = None
+    if rows is not None:
+        solution = [[0] * 9 for _ in range(9)]
+        for rid in rows:
+            cell, d = divmod(rid, 9)
+            solution[cell // 9][cell % 9] = d + 1
+    return solution, count, iterations, backtracks, max_depth
+
+def count_solutions(grid: List[List[int]], limit: int = 2) -> int:
+    """Nombre de solutions de la grille, en s'arrêtant dès que 'limit' est atteint."""
+    return solve_dlx(grid, max_solutions=limit)[1]
+
+def solve(sudoku_grid: SudokuGrid, max_solutions: int = 1, budget: Optional[Budget] = None) -> Dict:
+    budget = budget or Budget()
+    solution, count, iterations, backtracks, max_depth = solve_dlx(sudoku_grid.grid, max_solutions, budget)
+    grid = solution if solution is not None else sudoku_grid.to_list()
+    return {
+        "grille_resolue": grid,
+        "iterations": iterations,
+        "taux_succes": is_complete(grid),
+        "nb_backtracks": backtracks,
+        "profondeur_max": max_depth,
+        "nb_solutions": count,
+        "categorie": "recherche_csp",
+        **budget.to_metrics()
+    }
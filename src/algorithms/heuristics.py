@@ -0,0 +1,126 @@
+# ==== Heuristiques des recherches informées (A*, A* + Backtracking, Beam Search) ====
+#
+# Une heuristique évalue un état compact (81 octets, voir src/core/state.py).
+# Chaque noeud garde sa valeur h et une donnée auxiliaire 'aux' (compteurs de l'heuristique) :
+# un fils ne diffère de son parent que par une case, sa valeur est déduite de celle du parent
+# sans recompter la grille.
+
+from typing import Dict, List, Tuple, Union
+from src.core.bitboard import PEERS
+from src.core import state as compact
+
+
+def count_conflicts(grid: Union[List[List[int]], bytes, List[int]]) -> int:
+    """Nombre de doublons par ligne et par colonne (les cases vides comptent comme une valeur 0)."""
+    cells = grid if isinstance(grid, bytes) or len(grid) == 81 else [v for row in grid for v in row]
+    conflicts = 0
+    for i in range(9):
+        row_counts = [0] * 10
+        col_counts = [0] * 10
+        for j in range(9):
+            row_counts[cells[i * 9 + j]] += 1
+            col_counts[cells[j * 9 + i]] += 1
+        conflicts += sum(c - 1 for c in row_counts if c > 1)
+        conflicts += sum(c - 1 for c in col_counts if c > 1)
+    return conflicts
+
+
+class Heuristic:
+    """
+    Interface : 'evaluate' calcule h sur un état complet ;
+    'root' et 'child' retournent (h, aux), 'child' à partir du parent et du coup joué (case, chiffre).
+    Par défaut, 'child' réévalue tout l'état.
+    """
+
+    name = ""
+    admissible = False
+
+    def evaluate(self, state: bytes) -> int:
+        raise NotImplementedError
+
+    def root(self, state: bytes) -> Tuple[int, object]:
+        return self.evaluate(state), None
+
+    def child(self, parent: bytes, h: int, aux, cell: int, num: int, state: bytes) -> Tuple[int, object]:
+        return self.evaluate(state), None
+
+
+class ConflictHeuristic(Heuristic):
+    """
+    Conflits de lignes et de colonnes (heuristique historique, non admissible).
+    aux = nombre de cases vides de chaque ligne puis de chaque colonne (18 octets).
+    Un coup valide ne crée aucun doublon de chiffre : seuls les doublons de cases vides
+    de sa ligne et de sa colonne diminuent -> mise à jour en O(1).
+    """
+
+    name = "conflits"
+
+    def evaluate(self, state: bytes) -> int:
+        return count_conflicts(state)
+
+    def root(self, state: bytes) -> Tuple[int, bytes]:
+        empties = [0] * 18
+        for cell, value in enumerate(state):
+            if not value:
+                empties[cell // 9] += 1
+                empties[9 + cell % 9] += 1
+        return self.evaluate(state), bytes(empties)
+
+    def child(self, parent: bytes, h: int, aux: bytes, cell: int, num: int, state: bytes) -> Tuple[int, bytes]:
+        row, col = divmod(cell, 9)
+        h -= (aux[row] > 1) + (aux[9 + col] > 1)
+        empties = bytearray(aux)
+        empties[row] -= 1
+        empties[9 + col] -= 1
+        return h, bytes(empties)
+
+
+class EmptyCellsHeuristic(Heuristic):
+    """Nombre de cases vides : coût exact restant si la grille est résoluble (admissible)."""
+
+    name = "cases_vides"
+    admissible = True
+
+    def evaluate(self, state: bytes) -> int:
+        return state.count(compact.EMPTY)
+
+    def child(self, parent: bytes, h: int, aux, cell: int, num: int, state: bytes) -> Tuple[int, object]:
+        return h - 1, None
+
+
+class EmptyDomainHeuristic(Heuristic):
+    """
+    Nombre de cases vides sans aucun candidat (admissible : 0 sur tout état menant à une solution).
+    Seuls les voisins de la case jouée peuvent perdre leur dernier candidat :
+    la mise à jour ne regarde que ces 20 cases.
+    """
+
+    name = "domaines_vides"
+    admissible = True
+
+    def evaluate(self, state: bytes) -> int:
+        return sum(1 for cell in range(81) if not state[cell] and not compact.candidates(state, cell))
+
+    def child(self, parent: bytes, h: int, aux, cell: int, num: int, state: bytes) -> Tuple[int, object]:
+        bit = 1 << num
+        for peer in PEERS[cell]:
+            # Le voisin n'avait plus que 'num' comme candidat : son domaine devient vide
+            if not state[peer] and compact.candidates(parent, peer) == bit:
+                h += 1
+        return h, None
+
+
+HEURISTICS: Dict[str, Heuristic] = {
+    h.name: h for h in (ConflictHeuristic(), EmptyCellsHeuristic(), EmptyDomainHeuristic())
+}
+
+
+def get_heuristic(heuristic: Union[str, Heuristic, None] = None) -> Heuristic:
+    """Heuristique par nom (défaut : 'conflits') ou instance déjà construite."""
+    if heuristic is None:
+        return HEURISTICS[ConflictHeuristic.name]
+    if isinstance(heuristic, Heuristic):
+        return heuristic
+    if heuristic not in HEURISTICS:
+        raise ValueError(f"❌ Heuristique inconnue : {heuristic} (disponibles : {', '.join(HEURISTICS)})")
+    return HEURISTICS[heuristic]
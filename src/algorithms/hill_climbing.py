@@ -1,88 +1,37 @@
 # ==== ALGORITHME : Hill Climbing (Recherche locale) ====
 
-import random
-from copy import deepcopy
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Tuple, Optional
 from src.core.grid import SudokuGrid
+from src.core.budget import Budget
+from src.algorithms.local_search import BlockSwapState
 
-class HillClimbingSolver:
+class HillClimbingSolver(BlockSwapState):
     """
     Algorithme de résolution de Sudoku par Hill Climbing local :
-    échange des cellules non fixes au sein des blocs 3x3 pour minimiser les conflits.
+    échange des cellules non fixes au sein des blocs 3x3 pour minimiser les conflits
+    (état et voisinage fournis par BlockSwapState).
     """
 
-    def __init__(self, grid: List[List[int]]):
-        self.original_grid = deepcopy(grid)
-        self.grid = self._generate_initial_grid(grid)
-        self.fixed_cells = [[cell != 0 for cell in row] for row in grid]
-        self.iterations = 0
-        self.conflicts = self._calculate_conflicts()
-
-    def _generate_initial_grid(self, grid: List[List[int]]) -> List[List[int]]:
-        new_grid = deepcopy(grid)
-        for block_row in range(3):
-            for block_col in range(3):
-                nums = list(range(1, 10))
-                # Supprimer les valeurs déjà fixées
-                for i in range(3):
-                    for j in range(3):
-                        val = grid[block_row * 3 + i][block_col * 3 + j]
-                        if val in nums:
-                            nums.remove(val)
-                random.shuffle(nums)
-                idx = 0
-                for i in range(3):
-                    for j in range(3):
-                        r, c = block_row * 3 + i, block_col * 3 + j
-                        if new_grid[r][c] == 0:
-                            new_grid[r][c] = nums[idx]
-                            idx += 1
-        return new_grid
-
-    def _calculate_conflicts(self) -> int:
-        conflicts = 0
-        for i in range(9):
-            row_count = [0] * 10
-            col_count = [0] * 10
-            for j in range(9):
-                row_count[self.grid[i][j]] += 1
-                col_count[self.grid[j][i]] += 1
-            conflicts += sum(c - 1 for c in row_count if c > 1)
-            conflicts += sum(c - 1 for c in col_count if c > 1)
-        return conflicts
-
-    def solve(self, max_iterations: int = 10000) -> bool:
+    def solve(self, max_iterations: int = 10000, budget: Optional[Budget] = None) -> bool:
+        budget = budget or Budget()
         for _ in range(max_iterations):
+            # Itérations coûteuses : l'horloge et la mémoire sont vérifiées à chaque fois
+            if budget.tick() or budget.check():
+                break
             self.iterations += 1
+            budget.count(Budget.EXPANSIONS)
+            budget.count(Budget.CANDIDATE_CHECKS, self.nb_neighbours)
             best_swap: Optional[Tuple[int, int, int, int]] = None
             best_score = self.conflicts
 
-            for block_row in range(3):
-                for block_col in range(3):
-                    cells = [
-                        (i, j)
-                        for i in range(block_row * 3, block_row * 3 + 3)
-                        for j in range(block_col * 3, block_col * 3 + 3)
-                        if not self.fixed_cells[i][j]
-                    ]
-
-                    for idx1 in range(len(cells)):
-                        for idx2 in range(idx1 + 1, len(cells)):
-                            i1, j1 = cells[idx1]
-                            i2, j2 = cells[idx2]
-
-                            self.grid[i1][j1], self.grid[i2][j2] = self.grid[i2][j2], self.grid[i1][j1]
-                            score = self._calculate_conflicts()
-
-                            if score < best_score:
-                                best_score = score
-                                best_swap = (i1, j1, i2, j2)
-
-                            self.grid[i1][j1], self.grid[i2][j2] = self.grid[i2][j2], self.grid[i1][j1]
+            for move, delta in self.neighbours():
+                score = self.conflicts + delta
+                if score < best_score:
+                    best_score = score
+                    best_swap = move
 
             if best_swap:
-                i1, j1, i2, j2 = best_swap
-                self.grid[i1][j1], self.grid[i2][j2] = self.grid[i2][j2], self.grid[i1][j1]
+                self._apply_swap(*best_swap)
                 self.conflicts = best_score
                 if self.conflicts == 0:
                     return True
@@ -91,13 +40,15 @@ class HillClimbingSolver:
 
         return self.conflicts == 0
 
-def solve(sudoku_grid: SudokuGrid) -> Dict:
+def solve(sudoku_grid: SudokuGrid, budget: Optional[Budget] = None) -> Dict:
+    budget = budget or Budget()
     solver = HillClimbingSolver(sudoku_grid.grid)
-    success = solver.solve()
+    success = solver.solve(budget=budget)
     return {
         "grille_resolue": solver.grid,
         "iterations": solver.iterations,
         "taux_succes": success,
         "conflits_finaux": solver.conflicts,
-        "categorie": "recherche_locale"
+        "categorie": "recherche_locale",
+        **budget.to_metrics()
     }
@@ -1,12 +1,23 @@
 # ==== ALGORITHME : Hill Climbing + Restart (Recherche locale) ====
 
-from typing import Dict
+import multiprocessing
+import os
+import random
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Optional
 from src.core.grid import SudokuGrid
+from src.core.budget import Budget
 from src.algorithms.hill_climbing import HillClimbingSolver
 
+# Mêmes réglages pour les versions séquentielle et parallèle (comparaison équitable)
+MAX_RESTARTS = 10
+MAX_ITERATIONS = 1000
+
 class HillClimbingWithRestart:
-    def __init__(self, grid, max_restarts=10, max_iterations=10000):
+    def __init__(self, grid, max_restarts=10, max_iterations=10000, budget: Optional[Budget] = None):
         self.original_grid = grid
+        self.budget = budget or Budget()  # partagé par tous les restarts
         self.max_restarts = max_restarts
         self.max_iterations = max_iterations
         self.best_grid = None
@@ -17,8 +28,10 @@ class HillClimbingWithRestart:
 
     def solve(self) -> bool:
         for restart in range(self.max_restarts):
+            if self.budget.exhausted:
+                break
             solver = HillClimbingSolver(self.original_grid)
-            success = solver.solve(max_iterations=self.max_iterations)
+            success = solver.solve(max_iterations=self.max_iterations, budget=self.budget)
             self.total_iterations += solver.iterations
 
             if solver.conflicts < self.best_conflicts:
@@ -30,12 +43,142 @@ class HillClimbingWithRestart:
                 self.success = True
                 return True  # early success
 
-        self.nb_restart = self.max_restarts
+        self.nb_restart = restart if self.budget.exhausted else self.max_restarts
         self.success = (self.best_conflicts == 0)
         return self.success
 
-def solve(sudoku_grid: SudokuGrid) -> Dict:
-    solver = HillClimbingWithRestart(sudoku_grid.grid, max_restarts=10, max_iterations=1000)
+# ==== Restarts en parallèle ====
+
+_stop_event = None  # Event partagé : positionné dès qu'un worker trouve une solution
+
+def _init_worker(stop_event):
+    global _stop_event
+    _stop_event = stop_event
+
+def _worker_limits(budget: Budget, workers: int) -> Dict:
+    """Budget d'un worker : temps restant du budget parent, noeuds répartis entre les workers."""
+    limits = {"max_memory_mb": budget.max_memory_mb}
+    if budget.counters is not None:
+        limits["counters"] = {}  # compteurs du worker, renvoyés avec son résultat
+    if budget.max_time is not None:
+        limits["max_time"] = max(0.0, budget.max_time - budget.elapsed())
+    if budget.max_nodes is not None:
+        limits["max_nodes"] = max(1, (budget.max_nodes - budget.nodes) // workers)
+    return limits
+
+def _run_restarts(grid, restarts: int, max_iterations: int, seed: int, limits: Dict) -> Dict:
+    """Tâche d'un worker : ses restarts à la suite, avec sa propre graine ; s'arrête si un autre a trouvé."""
+    random.seed(seed)
+    budget = Budget(**limits)
+    best_grid, best_conflicts, iterations, done = None, float("inf"), 0, 0
+    success = False
+    for _ in range(restarts):
+        if budget.exhausted or (_stop_event is not None and _stop_event.is_set()):
+            break
+        solver = HillClimbingSolver(grid)
+        success = solver.solve(max_iterations=max_iterations, budget=budget)
+        iterations += solver.iterations
+        done += 1
+        if solver.conflicts < best_conflicts:
+            best_conflicts = solver.conflicts
+            best_grid = solver.grid
+        if success:
+            if _stop_event is not None:
+                _stop_event.set()
+            break
+    return {
+        "grid": best_grid,
+        "conflicts": best_conflicts,
+        "iterations": iterations,
+        "restarts": done,
+        "success": success,
+        "budget": budget.reason,
+        "counters": budget.counters,
+    }
+
+class ParallelHillClimbingWithRestart(HillClimbingWithRestart):
+    """
+    Restarts indépendants répartis sur un pool de processus (une graine par worker).
+    Le premier worker qui atteint zéro conflit arrête les autres ; les itérations
+    sont comptées worker par worker.
+    Dans un processus déjà worker d'un pool (mode batch, serveur), pas de pool imbriqué :
+    les restarts s'exécutent à la suite comme dans HillClimbingWithRestart.
+    """
+
+    def __init__(self, grid, max_restarts=10, max_iterations=10000, budget: Optional[Budget] = None,
+                 workers: Optional[int] = None, seed: Optional[int] = None):
+        super().__init__(grid, max_restarts, max_iterations, budget)
+        workers = workers or os.cpu_count() or 1
+        if multiprocessing.parent_process() is not None:
+            workers = 1
+        self.workers = max(1, min(workers, max_restarts))
+        self.seed = random.getrandbits(32) if seed is None else seed
+        self.worker_iterations = []
+
+    def solve(self) -> bool:
+        if self.workers == 1:
+            success = super().solve()
+            self.worker_iterations = [self.total_iterations]
+            return success
+
+        # Restarts répartis au plus juste : les premiers workers en font un de plus
+        share, extra = divmod(self.max_restarts, self.workers)
+        limits = _worker_limits(self.budget, self.workers)
+        stop_event = multiprocessing.Event()
+        self.worker_iterations = [0] * self.workers
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                 initargs=(stop_event,)) as executor:
+            futures = {
+                executor.submit(_run_restarts, self.original_grid, share + (w < extra), self.max_iterations,
+                                zlib.crc32(f"{self.seed}:{w}".encode("utf-8")), limits): w
+                for w in range(self.workers)
+            }
+            reasons = []
+            for future in as_completed(futures):
+                res = future.result()
+                w = futures[future]
+                self.worker_iterations[w] = res["iterations"]
+                self.total_iterations += res["iterations"]
+                self.nb_restart += res["restarts"]
+                for event, n in (res["counters"] or {}).items():
+                    self.budget.count(event, n)
+                if res["conflicts"] < self.best_conflicts:
+                    self.best_conflicts = res["conflicts"]
+                    self.best_grid = res["grid"]
+                if res["budget"]:
+                    reasons.append(res["budget"])
+                if res["success"]:
+                    stop_event.set()
+                    for other in futures:
+                        other.cancel()
+
+        # Le budget parent reflète le travail des workers
+        self.budget.tick(self.total_iterations)
+        if not self.budget.check() and reasons and self.best_conflicts != 0:
+            self.budget.reason = reasons[0]
+        self.success = (self.best_conflicts == 0)
+        # Restarts nécessaires avant succès (hors celui qui a réussi), comme en séquentiel
+        if self.success:
+            self.nb_restart -= 1
+        return self.success
+
+def solve(sudoku_grid: SudokuGrid, budget: Optional[Budget] = None) -> Dict:
+    solver = HillClimbingWithRestart(sudoku_grid.grid, max_restarts=MAX_RESTARTS, max_iterations=MAX_ITERATIONS,
+                                     budget=budget)
+    solver.solve()
+    return {
+        "grille_resolue": solver.best_grid,
+        "iterations": solver.total_iterations,
+        "taux_succes": solver.success,
+        "conflits_finaux": solver.best_conflicts,
+        "nb_restarts": solver.nb_restart,
+        "categorie": "recherche_locale",
+        **solver.budget.to_metrics()
+    }
+
+def solve_parallel(sudoku_grid: SudokuGrid, budget: Optional[Budget] = None, workers: Optional[int] = None) -> Dict:
+    solver = ParallelHillClimbingWithRestart(sudoku_grid.grid, max_restarts=MAX_RESTARTS,
+                                             max_iterations=MAX_ITERATIONS, budget=budget, workers=workers)
     solver.solve()
     return {
         "grille_resolue": solver.best_grid,
@@ -43,5 +186,10 @@ def solve(sudoku_grid: SudokuGrid) -> Dict:
         "taux_succes": solver.success,
         "conflits_finaux": solver.best_conflicts,
         "nb_restarts": solver.nb_restart,
-        "categorie": "recherche_locale"
+        "nb_workers": solver.workers,
+        # False : restarts exécutés à la suite (déjà dans un worker, ou un seul coeur)
+        "parallele": solver.workers > 1,
+        "iterations_par_worker": solver.worker_iterations,
+        "categorie": "recherche_locale",
+        **solver.budget.to_metrics()
     }
@@ -0,0 +1,96 @@
+# ==== ALGORITHME : IDA* (Recherche informée, mémoire bornée) ====
+
+from typing import Dict, Optional
+from src.core.validator import is_complete
+from src.core import state as compact
+from src.algorithms.a_star import AStarSolver
+from src.algorithms.heuristics import count_conflicts
+from src.core.budget import Budget
+from src.core.grid import SudokuGrid
+
+FOUND = -1
+INF = float("inf")
+
+class IDAStarSolver(AStarSolver):
+    """
+    A* par approfondissement itératif : parcours en profondeur limité par un seuil sur f = g + h,
+    relancé avec le plus petit f ayant dépassé le seuil. Seul le chemin courant est en mémoire.
+    Table de transposition de taille fixe (adressage direct, remplacement systématique) :
+    pour un état dont le sous-arbre a échoué, elle garde le plus petit f qui a dépassé le seuil,
+    ce qui évite de réexplorer ce sous-arbre tant que le seuil reste en dessous.
+    """
+
+    def __init__(self, grid, budget: Optional[Budget] = None, heuristic=None, table_size: int = 1 << 16,
+                 cell_order=None):
+        super().__init__(grid, budget, heuristic, cell_order)
+        size = 1
+        while size < table_size:
+            size <<= 1
+        self.table_mask = size - 1
+        self.table_keys = [None] * size
+        self.table_bounds = [0] * size
+        self.nb_thresholds = 0
+        self.table_hits = 0
+
+    def _search(self, state: bytes, g: int, h: int, aux, threshold, depth: int):
+        """Retourne FOUND, le plus petit f au-delà du seuil, ou None si le budget est épuisé."""
+        f = g + h
+        if f > threshold:
+            return f
+        if self.budget.tick():
+            return None
+        self.iterations += 1
+        self.visited_count += 1
+        self.max_heap_size = max(self.max_heap_size, depth + 1)
+
+        if compact.is_complete(state):
+            self.solution = state
+            return FOUND
+
+        slot = hash(state) & self.table_mask
+        if self.table_keys[slot] == state and self.table_bounds[slot] > threshold:
+            self.table_hits += 1
+            return self.table_bounds[slot]
+
+        next_bound = INF
+        for cell, num, child in self.get_next_states(state):
+            hn, aux_n = self.h.child(state, h, aux, cell, num, child)
+            t = self._search(child, g + 1, hn, aux_n, threshold, depth + 1)
+            if t is None or t == FOUND:
+                return t
+            next_bound = min(next_bound, t)
+
+        self.table_keys[slot] = state
+        self.table_bounds[slot] = next_bound
+        return next_bound
+
+    def solve(self):
+        h, aux = self.h.root(self.original_grid)
+        threshold = h
+        while True:
+            self.nb_thresholds += 1
+            self.visited_count = 0  # états développés lors de la dernière passe
+            t = self._search(self.original_grid, 0, h, aux, threshold, 0)
+            if t == FOUND:
+                return True
+            if t is None or t == INF:
+                return False
+            threshold = t
+
+def solve(sudoku_grid: SudokuGrid, budget: Optional[Budget] = None, heuristic=None, cell_order=None) -> Dict:
+    solver = IDAStarSolver(sudoku_grid.grid, budget, heuristic, cell_order=cell_order)
+    solver.solve()
+    taux_succes = is_complete(solver.grid)
+    return {
+        "grille_resolue": solver.grid,
+        "iterations": solver.iterations,
+        "taux_succes": taux_succes,
+        "conflits_heuristique": count_conflicts(solver.grid),
+        "heuristique": solver.h.name,
+        "ordre_cases": solver.order.name,
+        "etats_explores": solver.visited_count,
+        "memoire_max_file": solver.max_heap_size,
+        "nb_seuils": solver.nb_thresholds,
+        "categorie": "recherche_informee",
+        **solver.budget.to_metrics()
+    }
@@ -0,0 +1,123 @@
+# ==== Moteur commun de recherche locale (échanges dans les blocs 3x3) ====
+
+import random
+from copy import deepcopy
+from typing import List, Tuple
+
+Swap = Tuple[int, int, int, int]
+
+class BlockSwapState:
+    """
+    État d'une recherche locale sur le Sudoku :
+    chaque bloc 3x3 contient les chiffres 1..9 une seule fois (les cases fixes sont conservées),
+    un mouvement échange deux cases non fixes d'un même bloc, seuls les conflits
+    de lignes et de colonnes restent à éliminer.
+    Les occurrences de chaque valeur par ligne et par colonne sont tenues à jour :
+    la variation de conflits d'un échange se calcule sur 2 lignes et 2 colonnes, en O(1).
+    """
+
+    def __init__(self, grid: List[List[int]]):
+        self.original_grid = deepcopy(grid)
+        self.grid = self._generate_initial_grid(grid)
+        self.fixed_cells = [[cell != 0 for cell in row] for row in grid]
+        self.iterations = 0
+        self.row_counts = [[0] * 10 for _ in range(9)]
+        self.col_counts = [[0] * 10 for _ in range(9)]
+        for i in range(9):
+            for j in range(9):
+                self.row_counts[i][self.grid[i][j]] += 1
+                self.col_counts[j][self.grid[i][j]] += 1
+        self.conflicts = self._calculate_conflicts()
+        # Cases échangeables de chaque bloc (fixes une fois pour toutes)
+        self.block_cells = [
+            [
+                (i, j)
+                for i in range(block_row * 3, block_row * 3 + 3)
+                for j in range(block_col * 3, block_col * 3 + 3)
+                if not self.fixed_cells[i][j]
+            ]
+            for block_row in range(3)
+            for block_col in range(3)
+        ]
+        # Blocs où un échange est possible (au moins deux cases libres)
+        self.movable_blocks = [cells for cells in self.block_cells if len(cells) >= 2]
+        # Taille du voisinage complet (échanges évalués par neighbours())
+        self.nb_neighbours = sum(len(cells) * (len(cells) - 1) // 2 for cells in self.block_cells)
+
+    def _generate_initial_grid(self, grid: List[List[int]]) -> List[List[int]]:
+        new_grid = deepcopy(grid)
+        for block_row in range(3):
+            for block_col in range(3):
+                nums = list(range(1, 10))
+                # Supprimer les valeurs déjà fixées
+                for i in range(3):
+                    for j in range(3):
+                        val = grid[block_row * 3 + i][block_col * 3 + j]
+                        if val in nums:
+                            nums.remove(val)
+                random.shuffle(nums)
+                idx = 0
+                for i in range(3):
+                    for j in range(3):
+                        r, c = block_row * 3 + i, block_col * 3 + j
+                        if new_grid[r][c] == 0:
+                            new_grid[r][c] = nums[idx]
+                            idx += 1
+        return new_grid
+
+    def _calculate_conflicts(self) -> int:
+        """Recalcul complet à partir des compteurs (état initial)."""
+        conflicts = 0
+        for counts in self.row_counts + self.col_counts:
+            conflicts += sum(c - 1 for c in counts if c > 1)
+        return conflicts
+
+    @staticmethod
+    def _move_delta(counts: List[int], old: int, new: int) -> int:
+        """Variation des conflits d'une unité quand une valeur 'old' y devient 'new' (old != new)."""
+        return (counts[new] > 0) - (counts[old] > 1)
+
+    def _swap_delta(self, i1: int, j1: int, i2: int, j2: int) -> int:
+        """Variation des conflits si l'on échange (i1, j1) et (i2, j2), sans modifier la grille."""
+        v1, v2 = self.grid[i1][j1], self.grid[i2][j2]
+        if v1 == v2:
+            return 0
+        delta = 0
+        if i1 != i2:
+            delta += self._move_delta(self.row_counts[i1], v1, v2) + self._move_delta(self.row_counts[i2], v2, v1)
+        if j1 != j2:
+            delta += self._move_delta(self.col_counts[j1], v1, v2) + self._move_delta(self.col_counts[j2], v2, v1)
+        return delta
+
+    def _apply_swap(self, i1: int, j1: int, i2: int, j2: int):
+        """Effectue l'échange et met les compteurs à jour (self.conflicts est géré par l'appelant)."""
+        v1, v2 = self.grid[i1][j1], self.grid[i2][j2]
+        self.grid[i1][j1], self.grid[i2][j2] = v2, v1
+        for counts, old, new in ((self.row_counts[i1], v1, v2), (self.row_counts[i2], v2, v1),
+                                 (self.col_counts[j1], v1, v2), (self.col_counts[j2], v2, v1)):
+            counts[old] -= 1
+            counts[new] += 1
+
+    def neighbours(self):
+        """Tous les échanges possibles, bloc par bloc : itère sur (swap, variation des conflits)."""
+        for cells in self.block_cells:
+            for idx1 in range(len(cells)):
+                i1, j1 = cells[idx1]
+                for idx2 in range(idx1 + 1, len(cells)):
+                    i2, j2 = cells[idx2]
+                    yield (i1, j1, i2, j2), self._swap_delta(i1, j1, i2, j2)
+
+    def random_swap(self) -> Swap:
+        """Un échange tiré au hasard (None si aucun bloc n'a deux cases libres)."""
+        if not self.movable_blocks:
+            return None
+        (i1, j1), (i2, j2) = random.sample(random.choice(self.movable_blocks), 2)
+        return i1, j1, i2, j2
+
+    def swap(self, move: Swap, delta: int):
+        """Applique un échange dont la variation est connue."""
+        self._apply_swap(*move)
+        self.conflicts += delta
+
+    def snapshot(self) -> List[List[int]]:
+        return [row[:] for row in self.grid]
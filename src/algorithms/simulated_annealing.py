@@ -0,0 +1,92 @@
+# ==== ALGORITHME : Recuit simulé avec réchauffe adaptative (Recherche locale) ====
+
+import math
+import random
+import statistics
+from typing import Dict, List, Optional
+from src.core.grid import SudokuGrid
+from src.core.budget import Budget
+from src.algorithms.local_search import BlockSwapState
+
+class SimulatedAnnealingSolver(BlockSwapState):
+    """
+    Recuit simulé sur le voisinage des échanges dans les blocs :
+    un échange aléatoire est accepté s'il n'aggrave pas les conflits,
+    sinon avec la probabilité exp(-delta / T).
+    La température baisse d'un facteur 'cooling' après chaque palier de
+    'chain_length' mouvements ; si le meilleur score stagne pendant 'reheat_after'
+    paliers, la température est remontée (réchauffe), d'autant plus haut que
+    les réchauffes précédentes ont échoué.
+    """
+
+    def __init__(self, grid: List[List[int]], cooling: float = 0.99, reheat_after: int = 150):
+        super().__init__(grid)
+        self.cooling = cooling
+        self.reheat_after = reheat_after
+        self.chain_length = max(1, sum(len(c) * (len(c) - 1) // 2 for c in self.block_cells))
+        self.initial_temperature = self._initial_temperature()
+        self.temperature = self.initial_temperature
+        self.best_grid = self.snapshot()
+        self.best_conflicts = self.conflicts
+        self.nb_reheats = 0
+
+    def _initial_temperature(self, samples: int = 200) -> float:
+        """Écart-type des variations de conflits sur des échanges aléatoires (sans les appliquer)."""
+        deltas = []
+        for _ in range(samples):
+            move = self.random_swap()
+            if move is None:
+                break
+            deltas.append(self._swap_delta(*move))
+        return max(0.5, statistics.pstdev(deltas)) if len(deltas) > 1 else 0.5
+
+    def solve(self, max_iterations: int = 500000, budget: Optional[Budget] = None) -> bool:
+        budget = budget or Budget()
+        if self.conflicts == 0 or not self.movable_blocks:
+            return self.conflicts == 0
+
+        stagnation = 0
+        while self.iterations < max_iterations:
+            improved = False
+            for _ in range(self.chain_length):
+                if budget.tick():
+                    return self.best_conflicts == 0
+                self.iterations += 1
+                budget.count(Budget.CANDIDATE_CHECKS)
+                move = self.random_swap()
+                delta = self._swap_delta(*move)
+                if delta <= 0 or random.random() < math.exp(-delta / self.temperature):
+                    self.swap(move, delta)
+                    if self.conflicts < self.best_conflicts:
+                        self.best_conflicts = self.conflicts
+                        self.best_grid = self.snapshot()
+                        budget.count(Budget.COPIES)
+                        improved = True
+                        if self.conflicts == 0:
+                            return True
+
+            stagnation = 0 if improved else stagnation + 1
+            if stagnation >= self.reheat_after:
+                # Réchauffe adaptative : repart d'autant plus chaud que les réchauffes s'enchaînent
+                self.nb_reheats += 1
+                self.temperature = self.initial_temperature * min(1.0, 0.3 + 0.1 * self.nb_reheats)
+                stagnation = 0
+            else:
+                self.temperature = max(1e-3, self.temperature * self.cooling)
+
+        return self.best_conflicts == 0
+
+def solve(sudoku_grid: SudokuGrid, budget: Optional[Budget] = None) -> Dict:
+    budget = budget or Budget()
+    solver = SimulatedAnnealingSolver(sudoku_grid.grid)
+    success = solver.solve(budget=budget)
+    return {
+        "grille_resolue": solver.best_grid,
+        "iterations": solver.iterations,
+        "taux_succes": success,
+        "conflits_finaux": solver.best_conflicts,
+        "nb_rechauffes": solver.nb_reheats,
+        "temperature_finale": round(solver.temperature, 4),
+        "categorie": "recherche_locale",
+        **budget.to_metrics()
+    }
@@ -0,0 +1,152 @@
+# ==== ALGORITHME : SMA* (Recherche informée, mémoire bornée) ====
+
+import heapq
+from itertools import count
+from typing import Dict, Optional
+from src.core.validator import is_complete
+from src.core import state as compact
+from src.algorithms.a_star import AStarSolver
+from src.algorithms.heuristics import count_conflicts
+from src.core.budget import Budget
+from src.core.grid import SudokuGrid
+
+INF = float("inf")
+
+class _Node:
+    __slots__ = ("state", "g", "h", "aux", "f", "parent", "children", "forgotten", "version")
+
+    def __init__(self, state, g, h, aux, f, parent):
+        self.state = state
+        self.g = g
+        self.h = h
+        self.aux = aux
+        self.f = f
+        self.parent = parent
+        self.children = 0      # fils encore en mémoire
+        self.forgotten = INF   # plus petit f parmi les fils oubliés
+        self.version = 0       # invalide les anciennes entrées des tas
+
+class SMAStarSolver(AStarSolver):
+    """
+    A* à mémoire bornée simplifié : au plus 'max_nodes' noeuds en mémoire (arbre de recherche).
+    Quand la limite est dépassée, la feuille de plus grand f (la moins profonde en cas d'égalité)
+    est oubliée et son parent retient le plus petit f oublié. Un parent dont tous les fils ont
+    été oubliés redevient une feuille de f = ce minimum, et sera redéveloppé si nécessaire.
+    Les feuilles sont dans deux tas (meilleure / pire) avec suppression paresseuse.
+    L'expansion d'une case choisie d'après le seul état donne un arbre : pas d'ensemble des visités.
+    """
+
+    def __init__(self, grid, budget: Optional[Budget] = None, heuristic=None, max_nodes: int = 50000,
+                 cell_order=None):
+        super().__init__(grid, budget, heuristic, cell_order)
+        self.max_nodes = max(20, max_nodes)  # au moins une expansion complète (9 fils) en mémoire
+        self.nb_forgotten = 0
+        self._ids = count()
+
+    def _push(self, best, worst, node):
+        node.version += 1
+        heapq.heappush(best, (node.f, -node.g, next(self._ids), node.version, node))
+        heapq.heappush(worst, (-node.f, node.g, next(self._ids), node.version, node))
+
+    @staticmethod
+    def _pop_valid(heap):
+        while heap:
+            entry = heapq.heappop(heap)
+            node = entry[-1]
+            if entry[-2] == node.version:
+                node.version += 1  # retirée des deux tas
+                return node
+        return None
+
+    def _compact(self, best, worst):
+        """Retire les entrées périmées des tas (sinon ils grossissent au-delà de la limite de noeuds)."""
+        for heap in (best, worst):
+            heap[:] = [entry for entry in heap if entry[-2] == entry[-1].version]
+            heapq.heapify(heap)
+
+    def _release(self, node, best, worst):
+        """Retire une feuille de l'arbre ; le parent devient une feuille s'il n'a plus de fils."""
+        self.nodes_in_memory -= 1
+        parent = node.parent
+        while parent is not None:
+            parent.children -= 1
+            if node.f < INF:
+                parent.forgotten = min(parent.forgotten, node.f)
+            if parent.children > 0:
+                return
+            if parent.forgotten < INF:
+                parent.f = parent.forgotten
+                parent.forgotten = INF
+                self._push(best, worst, parent)
+                return
+            # Tous les fils sont des impasses : le parent en est une aussi
+            self.nodes_in_memory -= 1
+            parent.f = INF
+            node, parent = parent, parent.parent
+
+    def solve(self):
+        h, aux = self.h.root(self.original_grid)
+        root = _Node(self.original_grid, 0, h, aux, h, None)
+        best, worst = [], []
+        self._push(best, worst, root)
+        self.nodes_in_memory = 1
+
+        while True:
+            node = self._pop_valid(best)
+            if node is None or node.f == INF:
+                return False
+            if self.budget.tick():
+                return False
+            self.iterations += 1
+
+            if compact.is_complete(node.state):
+                self.solution = node.state
+                return True
+
+            children = []
+            for cell, num, child_state in self.get_next_states(node.state):
+                hn, aux_n = self.h.child(node.state, node.h, node.aux, cell, num, child_state)
+                g = node.g + 1
+                # Pathmax : f ne décroît pas le long d'un chemin
+                children.append(_Node(child_state, g, hn, aux_n, max(node.f, g + hn), node))
+            self.visited_count += len(children)
+
+            if not children:
+                node.f = INF
+                self._release(node, best, worst)
+                continue
+
+            node.children = len(children)
+            self.nodes_in_memory += len(children)
+            for child in children:
+                self._push(best, worst, child)
+
+            # Mémoire pleine : oublie les pires feuilles
+            while self.nodes_in_memory > self.max_nodes:
+                leaf = self._pop_valid(worst)
+                if leaf is None or leaf.parent is None:
+                    break
+                self.nb_forgotten += 1
+                self._release(leaf, best, worst)
+            self.max_heap_size = max(self.max_heap_size, self.nodes_in_memory)
+            if len(best) + len(worst) > 4 * self.nodes_in_memory + 64:
+                self._compact(best, worst)
+
+def solve(sudoku_grid: SudokuGrid, budget: Optional[Budget] = None, heuristic=None,
+          max_nodes: int = 50000, cell_order=None) -> Dict:
+    solver = SMAStarSolver(sudoku_grid.grid, budget, heuristic, max_nodes, cell_order)
+    solver.solve()
+    taux_succes = is_complete(solver.grid)
+    return {
+        "grille_resolue": solver.grid,
+        "iterations": solver.iterations,
+        "taux_succes": taux_succes,
+        "conflits_heuristique": count_conflicts(solver.grid),
+        "heuristique": solver.h.name,
+        "ordre_cases": solver.order.name,
+        "etats_explores": solver.visited_count,
+        "memoire_max_file": solver.max_heap_size,
+        "nb_oublis": solver.nb_forgotten,
+        "categorie": "recherche_informee",
+        **solver.budget.to_metrics()
+    }
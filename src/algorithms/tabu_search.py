@@ -0,0 +1,90 @@
+# ==== ALGORITHME : Recherche tabou avec aspiration (Recherche locale) ====
+
+import random
+from typing import Dict, List, Optional
+from src.core.grid import SudokuGrid
+from src.core.budget import Budget
+from src.algorithms.local_search import BlockSwapState
+
+class TabuSearchSolver(BlockSwapState):
+    """
+    Recherche tabou sur le voisinage des échanges dans les blocs :
+    à chaque itération, le meilleur échange non tabou est appliqué, même s'il aggrave les conflits.
+    Après un échange, remettre l'une des deux valeurs dans la case qu'elle vient de quitter
+    est tabou pendant 'tenure' itérations (+ un petit tirage aléatoire).
+    Aspiration : un échange tabou est autorisé s'il donne un score meilleur que le meilleur connu.
+    """
+
+    def __init__(self, grid: List[List[int]], tenure: int = 10):
+        super().__init__(grid)
+        self.tenure = tenure
+        self.tabu = {}  # (ligne, colonne, valeur) -> dernière itération où c'est interdit
+        self.best_grid = self.snapshot()
+        self.best_conflicts = self.conflicts
+        self.nb_aspirations = 0
+
+    def _is_tabu(self, i: int, j: int, value: int) -> bool:
+        return self.tabu.get((i, j, value), 0) >= self.iterations
+
+    def solve(self, max_iterations: int = 20000, budget: Optional[Budget] = None) -> bool:
+        budget = budget or Budget()
+        if self.conflicts == 0 or not self.movable_blocks:
+            return self.conflicts == 0
+
+        grid = self.grid
+        for _ in range(max_iterations):
+            # Itérations coûteuses : l'horloge et la mémoire sont vérifiées à chaque fois
+            if budget.tick() or budget.check():
+                break
+            self.iterations += 1
+            budget.count(Budget.EXPANSIONS)
+            budget.count(Budget.CANDIDATE_CHECKS, self.nb_neighbours)
+
+            best_moves, best_delta, aspiration = [], None, False
+            for move, delta in self.neighbours():
+                i1, j1, i2, j2 = move
+                # Tabou si l'une des valeurs revient dans une case qu'elle a quittée récemment
+                tabu = self._is_tabu(i1, j1, grid[i2][j2]) or self._is_tabu(i2, j2, grid[i1][j1])
+                if tabu:
+                    if self.conflicts + delta >= self.best_conflicts:
+                        continue
+                if best_delta is None or delta < best_delta:
+                    best_moves, best_delta, aspiration = [move], delta, tabu
+                elif delta == best_delta:
+                    best_moves.append(move)
+                    aspiration = aspiration and tabu
+
+            if not best_moves:
+                continue  # tout le voisinage est tabou : on attend que des interdictions expirent
+
+            move = random.choice(best_moves)
+            i1, j1, i2, j2 = move
+            if aspiration:
+                self.nb_aspirations += 1
+            expires = self.iterations + self.tenure + random.randint(0, 2)
+            self.tabu[(i1, j1, grid[i1][j1])] = expires
+            self.tabu[(i2, j2, grid[i2][j2])] = expires
+            self.swap(move, best_delta)
+
+            if self.conflicts < self.best_conflicts:
+                self.best_conflicts = self.conflicts
+                self.best_grid = self.snapshot()
+                budget.count(Budget.COPIES)
+                if self.conflicts == 0:
+                    return True
+
+        return self.best_conflicts == 0
+
+def solve(sudoku_grid: SudokuGrid, budget: Optional[Budget] = None) -> Dict:
+    budget = budget or Budget()
+    solver = TabuSearchSolver(sudoku_grid.grid)
+    success = solver.solve(budget=budget)
+    return {
+        "grille_resolue": solver.best_grid,
+        "iterations": solver.iterations,
+        "taux_succes": success,
+        "conflits_finaux": solver.best_conflicts,
+        "nb_aspirations": solver.nb_aspirations,
+        "categorie": "recherche_locale",
+        **budget.to_metrics()
+    }
@@ -0,0 +1,92 @@
+from collections import namedtuple
+
+try:
+    import numpy as np
+except ImportError:  # dépendance optionnelle (pip install numpy)
+    np = None
+
+# ==== Vérification vectorisée d'un lot de grilles (NumPy) ====
+#
+# Entrée : tableau (N, 9, 9) d'uint8 (0 = case vide), ou tout ce que to_array accepte.
+# Pour chaque case, on lit combien de fois sa valeur apparaît dans sa ligne, sa colonne et son bloc
+# (comptages par histogramme puis take_along_axis) : aucune boucle Python par grille ou par case.
+# Mêmes règles que les fonctions unitaires :
+#   conflits      -> SudokuGrid.count_conflicts (cases remplies en doublon)
+#   cases fausses -> count_false_cells (cases vides + cases remplies en conflit)
+#   validité      -> validator.is_valid_sudoku (grille complète, chiffres 1..9, sans doublon)
+
+BatchValidation = namedtuple("BatchValidation", ["valid", "conflicts", "error_mask"])
+
+# Nombre de grilles traitées à la fois (borne la mémoire des tableaux intermédiaires)
+CHUNK_SIZE = 16384
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("❌ NumPy est requis pour la vérification par lot (pip install numpy).")
+
+
+def to_array(grids) -> "np.ndarray":
+    """
+    Convertit un lot de grilles en tableau (N, 9, 9) uint8.
+    Accepte un tableau NumPy, une liste de grilles 9x9 ou une liste de chaînes de 81 chiffres.
+    """
+    _require_numpy()
+    if isinstance(grids, np.ndarray):
+        array = grids.astype(np.uint8, copy=False)
+    elif len(grids) and isinstance(grids[0], str):
+        raw = np.frombuffer("".join(grids).encode("ascii"), dtype=np.uint8)
+        array = raw - ord("0")
+    else:
+        array = np.asarray(grids, dtype=np.uint8)
+    return array.reshape(-1, 9, 9)
+
+
+def _duplicate_mask(grids: "np.ndarray") -> "np.ndarray":
+    """Cases dont la valeur apparaît ailleurs dans la ligne, la colonne ou le bloc."""
+    n = grids.shape[0]
+    # Valeurs hors 0..9 ramenées à 10 : une classe à part, signalée comme erreur par l'appelant
+    values = np.minimum(grids, 10).astype(np.intp)
+    onehot = values[..., None] == np.arange(11)                       # (N, 9, 9, 11)
+
+    row_counts = onehot.sum(axis=2, dtype=np.uint8)                    # (N, 9, 11)
+    col_counts = onehot.sum(axis=1, dtype=np.uint8)                    # (N, 9, 11)
+    box_counts = onehot.reshape(n, 3, 3, 3, 3, 11).sum(axis=(2, 4), dtype=np.uint8)  # (N, 3, 3, 11)
+
+    in_row = np.take_along_axis(row_counts, values, axis=2)
+    in_col = np.take_along_axis(col_counts, values.transpose(0, 2, 1), axis=2).transpose(0, 2, 1)
+    box_cells = box_counts.repeat(3, axis=1).repeat(3, axis=2)         # (N, 9, 9, 11)
+    in_box = np.take_along_axis(box_cells, values[..., None], axis=3)[..., 0]
+    return (in_row > 1) | (in_col > 1) | (in_box > 1)
+
+
+def _validate_chunk(grids):
+    duplicates = _duplicate_mask(grids)
+    filled = grids != 0
+    out_of_range = grids > 9
+    error_mask = (duplicates & filled) | out_of_range
+    conflicts = error_mask.sum(axis=(1, 2))
+    valid = filled.all(axis=(1, 2)) & (conflicts == 0)
+    return valid, conflicts, error_mask
+
+
+def validate_batch(grids) -> BatchValidation:
+    """
+    Vérifie N grilles d'un coup.
+    Returns:
+        BatchValidation(valid (N,) bool, conflicts (N,) int, error_mask (N, 9, 9) bool)
+        error_mask marque les cases remplies en conflit (ou hors 1..9).
+    """
+    grids = to_array(grids)
+    parts = [_validate_chunk(grids[i:i + CHUNK_SIZE]) for i in range(0, len(grids), CHUNK_SIZE)]
+    if not parts:
+        return BatchValidation(np.zeros(0, bool), np.zeros(0, np.int64), np.zeros((0, 9, 9), bool))
+    valid, conflicts, error_mask = (np.concatenate(p) for p in zip(*parts))
+    return BatchValidation(valid, conflicts, error_mask)
+
+
+def count_false_cells_batch(grids) -> "np.ndarray":
+    """Équivalent vectorisé de count_false_cells : (N,) nombre de cases vides ou en conflit."""
+    grids = to_array(grids)
+    result = validate_batch(grids)
+    return result.conflicts + (grids == 0).sum(axis=(1, 2))
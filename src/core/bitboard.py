@@ -0,0 +1,127 @@
+from typing import List, Optional, Tuple
+
+# Bits 1..9 utilisés : le bit n représente le chiffre n
+FULL_MASK = 0x3FE
+
+# Index du bloc 3x3 pour chaque case (ligne * 9 + colonne)
+BOX_INDEX = [(i // 3) * 3 + (j // 3) for i in range(9) for j in range(9)]
+
+# Liste des chiffres contenus dans chaque masque (0..1023)
+MASK_DIGITS = [[n for n in range(1, 10) if mask & (1 << n)] for mask in range(1 << 10)]
+
+# Nombre de chiffres contenus dans chaque masque
+POPCOUNT = [len(d) for d in MASK_DIGITS]
+
+# Unités (9 lignes, 9 colonnes, 9 blocs) et voisins de chaque case, en indices plats
+UNITS = (
+    [[i * 9 + j for j in range(9)] for i in range(9)]
+    + [[i * 9 + j for i in range(9)] for j in range(9)]
+    + [[(b // 3) * 27 + (b % 3) * 3 + i * 9 + j for i in range(3) for j in range(3)] for b in range(9)]
+)
+PEERS = [
+    sorted({c for unit in UNITS if idx in unit for c in unit} - {idx})
+    for idx in range(81)
+]
+
+
+class BitboardGrid:
+    """
+    Représentation compacte d'une grille Sudoku.
+    Les 81 cases sont stockées à plat et chaque ligne, colonne et bloc 3x3
+    garde un masque des chiffres déjà placés, mis à jour à chaque place/unplace.
+    Le test de validité d'un coup devient O(1).
+    """
+
+    __slots__ = ("cells", "rows", "cols", "boxes", "empty_count")
+
+    def __init__(self, grid: Optional[List[List[int]]] = None):
+        """
+        :param grid: liste de listes 9x9 avec des entiers (0 = case vide), ou None pour une grille vide
+        """
+        self.cells = [0] * 81
+        self.rows = [0] * 9
+        self.cols = [0] * 9
+        self.boxes = [0] * 9
+        self.empty_count = 81
+        if grid is not None:
+            if len(grid) != 9 or any(len(row) != 9 for row in grid):
+                raise ValueError("La grille doit être une matrice 9x9.")
+            for i in range(9):
+                for j in range(9):
+                    if grid[i][j] != 0:
+                        self.place(i, j, grid[i][j])
+
+    def copy(self) -> "BitboardGrid":
+        """Copie peu coûteuse (quatre listes plates) à la place d'un deepcopy."""
+        clone = BitboardGrid.__new__(BitboardGrid)
+        clone.cells = self.cells[:]
+        clone.rows = self.rows[:]
+        clone.cols = self.cols[:]
+        clone.boxes = self.boxes[:]
+        clone.empty_count = self.empty_count
+        return clone
+
+    def __lt__(self, other: "BitboardGrid") -> bool:
+        # Ordre lexicographique des cases : départage les égalités dans un tas (heapq)
+        return self.cells < other.cells
+
+    def get(self, row: int, col: int) -> int:
+        return self.cells[row * 9 + col]
+
+    def place(self, row: int, col: int, num: int) -> None:
+        """Place 'num' en (row, col) et met à jour les masques (sans vérification)."""
+        idx = row * 9 + col
+        bit = 1 << num
+        self.cells[idx] = num
+        self.rows[row] |= bit
+        self.cols[col] |= bit
+        self.boxes[BOX_INDEX[idx]] |= bit
+        self.empty_count -= 1
+
+    def unplace(self, row: int, col: int) -> None:
+        """Vide la case (row, col) et retire son chiffre des masques."""
+        idx = row * 9 + col
+        num = self.cells[idx]
+        if num == 0:
+            return
+        mask = ~(1 << num)
+        self.cells[idx] = 0
+        self.rows[row] &= mask
+        self.cols[col] &= mask
+        self.boxes[BOX_INDEX[idx]] &= mask
+        self.empty_count += 1
+
+    def candidates(self, row: int, col: int) -> int:
+        """Retourne le masque des chiffres encore autorisés en (row, col)."""
+        idx = row * 9 + col
+        if self.cells[idx] != 0:
+            return 0
+        return FULL_MASK & ~(self.rows[row] | self.cols[col] | self.boxes[BOX_INDEX[idx]])
+
+    def is_valid(self, row: int, col: int, num: int) -> bool:
+        """Équivalent O(1) de validator.is_valid."""
+        idx = row * 9 + col
+        if self.cells[idx] != 0:
+            return False
+        used = self.rows[row] | self.cols[col] | self.boxes[BOX_INDEX[idx]]
+        return not (used >> num) & 1
+
+    def is_complete(self) -> bool:
+        return self.empty_count == 0
+
+    def find_empty(self) -> Optional[Tuple[int, int]]:
+        """Retourne la première case vide (ordre ligne par ligne) ou None."""
+        if self.empty_count == 0:
+            return None
+        idx = self.cells.index(0)
+        return divmod(idx, 9)
+
+    def to_list(self) -> List[List[int]]:
+        """Retourne la grille sous forme de liste de listes"""
+        cells = self.cells
+        return [cells[i * 9:i * 9 + 9] for i in range(9)]
+
+
+def digits(mask: int) -> List[int]:
+    """Retourne les chiffres (croissants) présents dans un masque."""
+    return MASK_DIGITS[mask]
@@ -0,0 +1,110 @@
+import os
+import sys
+import time
+from typing import Dict, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+def current_rss_bytes() -> Optional[int]:
+    """
+    Mémoire résidente du processus en octets.
+    Linux : valeur courante (/proc/self/statm) ; ailleurs : pic via getrusage ; None si indisponible.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    if resource is not None:
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss if sys.platform == "darwin" else rss * 1024
+    return None
+
+
+def current_rss_mb() -> Optional[float]:
+    """Mémoire résidente du processus en Mo (voir current_rss_bytes)."""
+    rss = current_rss_bytes()
+    return rss / (1024 * 1024) if rss is not None else None
+
+
+class Budget:
+    """
+    Budget d'exécution d'un solveur : temps (secondes), noeuds/itérations et mémoire
+    (Mo de RSS en plus de la valeur au démarrage). None = pas de limite.
+    Le solveur appelle tick() à chaque noeud et s'arrête proprement dès qu'il renvoie True ;
+    l'horloge et la mémoire ne sont lues que toutes les 'check_every' itérations.
+    Compteurs d'évènements optionnels : count(évènement, n) ne fait rien si 'counters' est None
+    (mesures détaillées demandées par src/utils/measure.py).
+    """
+
+    TIME = "temps"
+    NODES = "noeuds"
+    MEMORY = "memoire"
+
+    # Évènements du chemin critique des solveurs
+    EXPANSIONS = "expansions"            # noeuds développés
+    CANDIDATE_CHECKS = "tests_candidats" # (case, chiffre) essayés ou évalués
+    COPIES = "copies"                    # copies complètes d'un état
+
+    def __init__(self, max_time: Optional[float] = None, max_nodes: Optional[int] = None,
+                 max_memory_mb: Optional[float] = None, check_every: int = 128,
+                 counters: Optional[Dict[str, int]] = None):
+        self.max_time = max_time
+        self.max_nodes = max_nodes
+        self.max_memory_mb = max_memory_mb
+        self.check_every = check_every
+        self.counters = counters
+        self.nodes = 0
+        self.reason = None
+        self._countdown = check_every
+        self.start = time.perf_counter()
+        self.rss_start = current_rss_mb() if max_memory_mb is not None else None
+
+    @property
+    def exhausted(self) -> bool:
+        return self.reason is not None
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start
+
+    def tick(self, n: int = 1) -> bool:
+        """Compte 'n' noeuds ; retourne True si le budget est épuisé."""
+        if self.reason is not None:
+            return True
+        self.nodes += n
+        if self.max_nodes is not None and self.nodes > self.max_nodes:
+            self.reason = self.NODES
+            return True
+        self._countdown -= n
+        if self._countdown <= 0:
+            self._countdown = self.check_every
+            return self.check()
+        return False
+
+    def count(self, event: str, n: int = 1) -> None:
+        """Ajoute 'n' à un compteur d'évènements (sans effet si les compteurs sont désactivés)."""
+        if self.counters is not None:
+            self.counters[event] = self.counters.get(event, 0) + n
+
+    def check(self) -> bool:
+        """Vérifie le temps et la mémoire ; retourne True si le budget est épuisé."""
+        if self.reason is not None:
+            return True
+        if self.max_time is not None and self.elapsed() > self.max_time:
+            self.reason = self.TIME
+        elif self.max_memory_mb is not None and self.rss_start is not None:
+            rss = current_rss_mb()
+            if rss is not None and rss - self.rss_start > self.max_memory_mb:
+                self.reason = self.MEMORY
+        return self.reason is not None
+
+    def to_metrics(self) -> Dict:
+        """Champs ajoutés au dictionnaire de mesures du solveur."""
+        metrics = {"timeout": self.exhausted}
+        if self.exhausted:
+            metrics["budget_depasse"] = self.reason
+        return metrics
@@ -0,0 +1,208 @@
+from collections import namedtuple
+from itertools import permutations, product
+from typing import List, Tuple
+
+# ==== Forme canonique d'une grille sous les symétries du Sudoku ====
+#
+# Transformations qui conservent les règles (et le nombre de solutions) :
+#   transposition, permutation des bandes (3 lignes de blocs) et des lignes dans chaque bande,
+#   permutation des piles (3 colonnes de blocs) et des colonnes dans chaque pile, renommage des chiffres.
+# Forme canonique = la plus petite chaîne de 81 chiffres (ordre lexicographique, 0 = vide) parmi
+# toutes les grilles équivalentes, les chiffres étant renommés 1, 2, 3... dans leur ordre d'apparition.
+# Deux grilles sont équivalentes si et seulement si elles ont la même forme canonique.
+#
+# Recherche ligne par ligne : on garde tous les candidats (transposition, lignes déjà choisies,
+# ordre des colonnes, renommage) qui donnent le plus petit préfixe.
+#   - Ligne 0 : ses chiffres sont distincts, renommés 1..k dans l'ordre : seule la position des
+#     cases vides compte. Le minimum place les piles les moins remplies d'abord et, dans chaque pile,
+#     les cases vides d'abord ; seuls les ordres de colonnes qui l'atteignent sont énumérés.
+#   - Lignes suivantes : ordre des colonnes fixé, on essaie les lignes autorisées
+#     (même bande, ou première ligne d'une bande pas encore utilisée) et on garde le minimum.
+# Les candidats dont la suite est identique (mêmes lignes restantes une fois transformées) sont
+# fusionnés : une grille très symétrique ne fait pas exploser leur nombre.
+
+# Transformation : grille'[i][j] = digits[source[rows[i]][cols[j]]], source = grille transposée si 'transpose'
+Transform = namedtuple("Transform", ["transpose", "rows", "cols", "digits"])
+
+# Au-delà, les candidats équivalents sont fusionnés (le calcul de la clé coûte plus que de petites listes)
+_MERGE_ABOVE = 32
+
+
+def _cells(grid) -> Tuple[int, ...]:
+    """Grille 9x9, 81 valeurs ou chaîne de 81 chiffres -> tuple de 81 entiers."""
+    if isinstance(grid, str):
+        if len(grid) != 81 or not grid.isdigit():
+            raise ValueError("❌ Format de grille invalide (81 chiffres requis).")
+        return tuple(map(int, grid))
+    if len(grid) == 81:
+        return tuple(grid)
+    return tuple(v for row in grid for v in row)
+
+
+def _first_row_orders(row) -> Tuple[tuple, List[tuple]]:
+    """
+    Motif minimal (cases vides / remplies) de la première ligne et ordres de colonnes qui l'atteignent.
+    """
+    stacks = [[c for c in range(s * 3, s * 3 + 3)] for s in range(3)]
+    filled = [sum(1 for c in stack if row[c]) for stack in stacks]
+    pattern = tuple(0 if k < 3 - n else 1 for n in sorted(filled) for k in range(3))
+
+    stack_orders = [order for order in permutations(range(3))
+                    if [filled[s] for s in order] == sorted(filled)]
+    # Dans chaque pile : cases vides d'abord, dans n'importe quel ordre, puis cases remplies
+    inner = []
+    for stack in stacks:
+        empties = [c for c in stack if not row[c]]
+        givens = [c for c in stack if row[c]]
+        inner.append([e + g for e in permutations(empties) for g in permutations(givens)])
+    orders = [sum(choice, ()) for order in stack_orders for choice in product(*(inner[s] for s in order))]
+    return pattern, orders
+
+
+def _relabel(row, cols, labels, next_label, bound=None):
+    """
+    Ligne vue à travers l'ordre des colonnes, chiffres renommés ; complète le renommage en place.
+    Abandonne (None) dès que la ligne dépasse 'bound' : seules les lignes minimales sont utiles.
+    """
+    out = []
+    tight = bound is not None
+    for j, c in enumerate(cols):
+        v = row[c]
+        if v:
+            if not labels[v]:
+                labels[v] = next_label
+                next_label += 1
+            v = labels[v]
+        if tight and v != bound[j]:
+            if v > bound[j]:
+                return None, next_label
+            tight = False
+        out.append(v)
+    return tuple(out), next_label
+
+
+def _allowed_rows(order: List[int]) -> List[int]:
+    k = len(order)
+    if k % 3:
+        band = order[-1] // 3
+        return [r for r in range(band * 3, band * 3 + 3) if r not in order]
+    used = {r // 3 for r in order}
+    return [r for r in range(9) if r // 3 not in used]
+
+
+def _merge_key(rows, order, cols, labels):
+    """Lignes restantes transformées (chiffres non encore vus gardés à part) : même clé = même suite."""
+    def view(r):
+        return tuple(labels[rows[r][c]] if labels[rows[r][c]] else 10 + rows[r][c] if rows[r][c] else 0
+                     for c in cols)
+    # Ordre libre dans la bande en cours et entre les bandes restantes : multiensembles triés
+    current = tuple(sorted(view(r) for r in _allowed_rows(order))) if len(order) % 3 else ()
+    used = {r // 3 for r in order}
+    bands = tuple(sorted(tuple(sorted(view(r) for r in range(b * 3, b * 3 + 3))) for b in range(3) if b not in used))
+    return current, bands
+
+
+def _merge(candidates):
+    if len(candidates) <= _MERGE_ABOVE:
+        return candidates
+    merged = {}
+    for candidate in candidates:
+        merged.setdefault(_merge_key(candidate[1], candidate[2], candidate[3], candidate[4]), candidate)
+    return list(merged.values())
+
+
+def canonicalize(grid) -> Tuple[str, Transform]:
+    """
+    Forme canonique (chaîne de 81 chiffres) et transformation qui y mène depuis 'grid'
+    (apply_transform(grid, t) == forme canonique).
+    """
+    cells = _cells(grid)
+    variants = (
+        (False, [cells[r * 9:r * 9 + 9] for r in range(9)]),
+        (True, [cells[r::9] for r in range(9)]),
+    )
+
+    # Ligne 0 : motif minimal sur les 2 x 9 lignes sources possibles
+    firsts = []
+    for transpose, rows in variants:
+        for r in range(9):
+            pattern, orders = _first_row_orders(rows[r])
+            firsts.append((pattern, transpose, rows, r, orders))
+    best_pattern = min(f[0] for f in firsts)
+
+    best, candidates = None, []
+    for pattern, transpose, rows, r, orders in firsts:
+        if pattern != best_pattern:
+            continue
+        for cols in orders:
+            labels = [0] * 10
+            out, next_label = _relabel(rows[r], cols, labels, 1, best)
+            if out is None:
+                continue
+            if best is None or out < best:
+                best, candidates = out, []
+            if out == best:
+                candidates.append((transpose, rows, [r], cols, labels, next_label))
+    prefix = [best]
+
+    # Lignes 1 à 8
+    for _ in range(8):
+        best, expanded = None, []
+        for transpose, rows, order, cols, labels, next_label in candidates:
+            for r in _allowed_rows(order):
+                new_labels = labels[:]
+                out, new_next = _relabel(rows[r], cols, new_labels, next_label, best)
+                if out is None:
+                    continue
+                if best is None or out < best:
+                    best, expanded = out, []
+                if out == best:
+                    expanded.append((transpose, rows, order + [r], cols, new_labels, new_next))
+        prefix.append(best)
+        candidates = _merge(expanded)
+
+    transpose, _, order, cols, labels, next_label = candidates[0]
+    # Chiffres absents de la grille : étiquettes restantes dans l'ordre, pour une permutation complète
+    for v in range(1, 10):
+        if not labels[v]:
+            labels[v] = next_label
+            next_label += 1
+    canonical = "".join(str(v) for row in prefix for v in row)
+    return canonical, Transform(transpose, tuple(order), tuple(cols), tuple(labels))
+
+
+def canonical_form(grid) -> str:
+    """Représentant canonique de la classe d'équivalence de la grille (clé de cache / déduplication)."""
+    return canonicalize(grid)[0]
+
+
+def are_equivalent(a, b) -> bool:
+    return canonical_form(a) == canonical_form(b)
+
+
+def apply_transform(grid, transform: Transform) -> List[List[int]]:
+    """Applique une transformation à une grille (ex : la solution d'une grille équivalente)."""
+    cells = _cells(grid)
+    if transform.transpose:
+        cells = tuple(cells[(i % 9) * 9 + i // 9] for i in range(81))
+    digits = transform.digits
+    return [[digits[cells[r * 9 + c]] for c in transform.cols] for r in transform.rows]
+
+
+def invert_transform(transform: Transform) -> Transform:
+    """
+    Transformation inverse : apply_transform(apply_transform(g, t), invert_transform(t)) == g.
+    """
+    rows = [0] * 9
+    cols = [0] * 9
+    for i, r in enumerate(transform.rows):
+        rows[r] = i
+    for j, c in enumerate(transform.cols):
+        cols[c] = j
+    digits = [0] * 10
+    for v in range(1, 10):
+        digits[transform.digits[v]] = v
+    if transform.transpose:
+        # (T puis permutations)^-1 = permutations inverses (échangées par la transposition) puis T
+        return Transform(True, tuple(cols), tuple(rows), tuple(digits))
+    return Transform(False, tuple(rows), tuple(cols), tuple(digits))
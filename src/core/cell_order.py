@@ -0,0 +1,249 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Tuple, Union
+
+from src.core.bitboard import BOX_INDEX, FULL_MASK, PEERS, POPCOUNT
+from src.core import state as compact
+
+# ==== Choix de la prochaine case à remplir (recherches aveugles et informées) ====
+#
+# Stratégies (nom -> règle), départage par l'ordre interne des cases vides :
+#   statique  : première case vide, ligne par ligne (comportement historique)
+#   mrv       : case au plus petit nombre de candidats (Minimum Remaining Values)
+#   degre     : case au plus grand nombre de voisins vides (celle qui contraint le plus la suite)
+#   mrv_degre : MRV, égalités départagées par le degré
+#
+# Deux usages :
+#   - grille modifiée en place (BitboardGrid : Backtracking, DFS) : EmptyCells garde l'ensemble des
+#     cases vides à jour (retrait / remise en O(1), dans l'ordre inverse) au lieu de reparcourir
+#     la grille depuis (0, 0) à chaque noeud ; 'select' ne regarde que les cases encore vides ;
+#   - états compacts immuables (BFS, Beam, A* et dérivés) : 'select_state' travaille sur l'état.
+# Les deux retournent (case, masque de ses candidats), case = -1 si la grille est pleine.
+
+ROW_OF = [idx // 9 for idx in range(81)]
+COL_OF = [idx % 9 for idx in range(81)]
+
+
+class EmptyCells:
+    """
+    Ensemble des cases vides d'une grille (ensemble creux : tableau dense + position de chaque case).
+    Les 'size' premières cases de 'dense' sont vides. Retirer une case l'échange avec la dernière
+    case vide ; les remises se font dans l'ordre inverse des retraits (pile de la recherche),
+    une remise se contente donc d'agrandir la zone.
+    Avec track_degree, free_peers[c] = nombre de voisins vides de c (mis à jour à chaque retrait).
+    """
+
+    __slots__ = ("dense", "pos", "size", "free_peers")
+
+    def __init__(self, cells, track_degree: bool = False):
+        """:param cells: 81 valeurs (0 = vide), ex : BitboardGrid.cells ou un état compact"""
+        # Ordre inverse : la dernière case de la zone est la première case vide (stratégie statique)
+        self.dense = [idx for idx in range(80, -1, -1) if not cells[idx]]
+        self.size = len(self.dense)
+        self.dense += [idx for idx in range(80, -1, -1) if cells[idx]]
+        self.pos = [0] * 81
+        for i, idx in enumerate(self.dense):
+            self.pos[idx] = i
+        self.free_peers = None
+        if track_degree:
+            self.free_peers = [sum(1 for p in PEERS[idx] if not cells[p]) for idx in range(81)]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, cell: int) -> bool:
+        return self.pos[cell] < self.size
+
+    def cells(self) -> List[int]:
+        return self.dense[:self.size]
+
+    def remove(self, cell: int) -> None:
+        """Marque la case comme remplie (à appeler après l'avoir choisie)."""
+        dense, pos = self.dense, self.pos
+        last = self.size - 1
+        i = pos[cell]
+        other = dense[last]
+        dense[i], dense[last] = other, cell
+        pos[other], pos[cell] = i, last
+        self.size = last
+        if self.free_peers is not None:
+            free_peers = self.free_peers
+            for p in PEERS[cell]:
+                free_peers[p] -= 1
+
+    def set_order(self, dense: List[int]) -> None:
+        """Réimpose l'ordre interne des 81 cases (reprise d'une recherche sauvegardée)."""
+        if sorted(dense) != list(range(81)):
+            raise ValueError("❌ Ordre des cases invalide (permutation de 0..80 attendue).")
+        self.dense = list(dense)
+        for i, idx in enumerate(self.dense):
+            self.pos[idx] = i
+
+    def restore(self, cell: int) -> None:
+        """Remet la dernière case retirée (retour arrière)."""
+        self.size += 1
+        if self.free_peers is not None:
+            free_peers = self.free_peers
+            for p in PEERS[cell]:
+                free_peers[p] += 1
+
+
+def board_candidates(board, cell: int) -> int:
+    """Masque des candidats d'une case vide d'un BitboardGrid, par indice plat."""
+    return FULL_MASK & ~(board.rows[ROW_OF[cell]] | board.cols[COL_OF[cell]] | board.boxes[BOX_INDEX[cell]])
+
+
+def _free_peers(state: bytes, cell: int) -> int:
+    return sum(1 for p in PEERS[cell] if not state[p])
+
+
+class CellOrder(ABC):
+    """Interface : 'select' (grille en place + EmptyCells) et 'select_state' (état compact)."""
+
+    name = ""
+    track_degree = False
+
+    def empty_cells(self, cells) -> EmptyCells:
+        return EmptyCells(cells, self.track_degree)
+
+    @abstractmethod
+    def select(self, board, empties: EmptyCells) -> Tuple[int, int]:
+        ...
+
+    @abstractmethod
+    def select_state(self, state: bytes) -> Tuple[int, int]:
+        ...
+
+
+class StaticOrder(CellOrder):
+    """Première case vide (ligne par ligne) : O(1) avec EmptyCells."""
+
+    name = "statique"
+
+    def select(self, board, empties: EmptyCells) -> Tuple[int, int]:
+        if not empties.size:
+            return -1, 0
+        cell = empties.dense[empties.size - 1]
+        return cell, board_candidates(board, cell)
+
+    def select_state(self, state: bytes) -> Tuple[int, int]:
+        cell = compact.first_empty(state)
+        if cell < 0:
+            return -1, 0
+        return cell, compact.candidates(state, cell)
+
+
+class MRVOrder(CellOrder):
+    """Case au plus petit domaine ; arrêt immédiat sur un domaine vide (impasse) ou unique (coup forcé)."""
+
+    name = "mrv"
+
+    def select(self, board, empties: EmptyCells) -> Tuple[int, int]:
+        rows, cols, boxes = board.rows, board.cols, board.boxes
+        best, best_mask, best_count = -1, 0, 10
+        dense = empties.dense
+        for i in range(empties.size):
+            cell = dense[i]
+            mask = FULL_MASK & ~(rows[ROW_OF[cell]] | cols[COL_OF[cell]] | boxes[BOX_INDEX[cell]])
+            n = POPCOUNT[mask]
+            if n < best_count:
+                best, best_mask, best_count = cell, mask, n
+                if n <= 1:
+                    break
+        return best, best_mask
+
+    def select_state(self, state: bytes) -> Tuple[int, int]:
+        best, best_mask, best_count = -1, 0, 10
+        cell = state.find(compact.EMPTY)
+        while cell >= 0:
+            mask = compact.candidates(state, cell)
+            n = POPCOUNT[mask]
+            if n < best_count:
+                best, best_mask, best_count = cell, mask, n
+                if n <= 1:
+                    break
+            cell = state.find(compact.EMPTY, cell + 1)
+        return best, best_mask
+
+
+class DegreeOrder(CellOrder):
+    """Case au plus grand nombre de voisins vides (degré tenu à jour par EmptyCells)."""
+
+    name = "degre"
+    track_degree = True
+
+    def select(self, board, empties: EmptyCells) -> Tuple[int, int]:
+        if not empties.size:
+            return -1, 0
+        free_peers = empties.free_peers
+        dense = empties.dense
+        best = dense[0]
+        for i in range(1, empties.size):
+            cell = dense[i]
+            if free_peers[cell] > free_peers[best]:
+                best = cell
+        return best, board_candidates(board, best)
+
+    def select_state(self, state: bytes) -> Tuple[int, int]:
+        best, best_degree = -1, -1
+        cell = state.find(compact.EMPTY)
+        while cell >= 0:
+            degree = _free_peers(state, cell)
+            if degree > best_degree:
+                best, best_degree = cell, degree
+            cell = state.find(compact.EMPTY, cell + 1)
+        if best < 0:
+            return -1, 0
+        return best, compact.candidates(state, best)
+
+
+class MRVDegreeOrder(CellOrder):
+    """MRV, égalités départagées par le plus grand degré ; arrêt immédiat sur un domaine vide."""
+
+    name = "mrv_degre"
+    track_degree = True
+
+    def select(self, board, empties: EmptyCells) -> Tuple[int, int]:
+        rows, cols, boxes = board.rows, board.cols, board.boxes
+        free_peers = empties.free_peers
+        best, best_mask, best_count, best_degree = -1, 0, 10, -1
+        dense = empties.dense
+        for i in range(empties.size):
+            cell = dense[i]
+            mask = FULL_MASK & ~(rows[ROW_OF[cell]] | cols[COL_OF[cell]] | boxes[BOX_INDEX[cell]])
+            n = POPCOUNT[mask]
+            if n < best_count or (n == best_count and free_peers[cell] > best_degree):
+                best, best_mask, best_count, best_degree = cell, mask, n, free_peers[cell]
+                if n == 0:
+                    break
+        return best, best_mask
+
+    def select_state(self, state: bytes) -> Tuple[int, int]:
+        best, best_mask, best_count, best_degree = -1, 0, 10, -1
+        cell = state.find(compact.EMPTY)
+        while cell >= 0:
+            mask = compact.candidates(state, cell)
+            n = POPCOUNT[mask]
+            if n <= best_count:
+                degree = _free_peers(state, cell)
+                if n < best_count or degree > best_degree:
+                    best, best_mask, best_count, best_degree = cell, mask, n, degree
+                    if n == 0:
+                        break
+            cell = state.find(compact.EMPTY, cell + 1)
+        return best, best_mask
+
+
+CELL_ORDERS: Dict[str, CellOrder] = {
+    o.name: o for o in (StaticOrder(), MRVOrder(), DegreeOrder(), MRVDegreeOrder())
+}
+
+
+def get_cell_order(order: Union[str, CellOrder, None] = None) -> CellOrder:
+    """Stratégie par nom (défaut : 'statique') ou instance déjà construite."""
+    if order is None:
+        return CELL_ORDERS[StaticOrder.name]
+    if isinstance(order, CellOrder):
+        return order
+    if order not in CELL_ORDERS:
+        raise ValueError(f"❌ Ordre des cases inconnu : {order} (disponibles : {', '.join(CELL_ORDERS)})")
+    return CELL_ORDERS[order]
@@ -1,3 +1,6 @@
+from src.core.bitboard import BitboardGrid
+
+
 class SudokuGrid:
     def __init__(self, grid):
         """
@@ -52,6 +55,10 @@ class SudokuGrid:
         """Retourne la grille sous forme de liste de listes"""
         return [row[:] for row in self._grid]
 
+    def to_bitboard(self):
+        """Retourne la grille sous forme de BitboardGrid (masques ligne/colonne/bloc)"""
+        return BitboardGrid(self._grid)
+
     def is_valid_value(self, row, col, value):
         """Vérifie si une valeur est autorisée à la position (row, col)"""
         return (
@@ -60,15 +67,20 @@ class SudokuGrid:
             and value not in self.get_block(row, col)
         )
 
+    def has_duplicate(self, row, col):
+        """Vrai si la valeur de (row, col) apparaît ailleurs dans sa ligne, sa colonne ou son bloc"""
+        val = self._grid[row][col]
+        return (
+            self.get_row(row).count(val) > 1
+            or self.get_column(col).count(val) > 1
+            or self.get_block(row, col).count(val) > 1
+        )
+
     def count_conflicts(self):
-        """Compte le nombre total de conflits dans la grille actuelle"""
-        conflicts = 0
-        for i in range(9):
-            for j in range(9):
-                val = self._grid[i][j]
-                if val != 0:
-                    self._grid[i][j] = 0  # Temporarily clear
-                    if not self.is_valid_value(i, j, val):
-                        conflicts += 1
-                    self._grid[i][j] = val
-        return conflicts
+        """Compte le nombre total de conflits dans la grille actuelle (sans la modifier)"""
+        return sum(
+            1
+            for i in range(9)
+            for j in range(9)
+            if self._grid[i][j] != 0 and self.has_duplicate(i, j)
+        )
@@ -0,0 +1,51 @@
+from typing import List
+
+from src.core.bitboard import FULL_MASK, PEERS
+
+# ==== États compacts pour les recherches qui gardent beaucoup de grilles (BFS, A*, Beam) ====
+#
+# Un état est un objet bytes de 81 octets (un chiffre par case, 0 = vide, ordre ligne par ligne).
+# Immuable et hachable : il sert directement de clé dans les ensembles de visités,
+# et se compare comme la liste de ses cases (départage des égalités dans un tas).
+# Environ 114 octets par état contre plus d'un Ko pour un BitboardGrid (5 listes).
+
+EMPTY = 0
+
+# Octet de chaque chiffre, pour dériver un fils sans conversion
+_DIGIT_BYTES = [bytes((n,)) for n in range(10)]
+
+
+def from_grid(grid) -> bytes:
+    """Liste de listes 9x9 (ou liste plate de 81 cases) -> état compact."""
+    if len(grid) == 81:
+        return bytes(grid)
+    return bytes(v for row in grid for v in row)
+
+
+def to_list(state: bytes) -> List[List[int]]:
+    """État compact -> liste de listes 9x9."""
+    return [list(state[i * 9:i * 9 + 9]) for i in range(9)]
+
+
+def first_empty(state: bytes) -> int:
+    """Indice de la première case vide (ordre ligne par ligne), -1 si la grille est pleine."""
+    return state.find(EMPTY)
+
+
+def is_complete(state: bytes) -> bool:
+    return state.find(EMPTY) == -1
+
+
+def candidates(state: bytes, cell: int) -> int:
+    """Masque des chiffres autorisés dans la case (bit n = chiffre n), d'après ses 20 voisins."""
+    if state[cell]:
+        return 0
+    used = 0
+    for peer in PEERS[cell]:
+        used |= 1 << state[peer]
+    return FULL_MASK & ~used
+
+
+def place(state: bytes, cell: int, num: int) -> bytes:
+    """Nouvel état avec 'num' dans la case (l'état d'origine est inchangé)."""
+    return state[:cell] + _DIGIT_BYTES[num] + state[cell + 1:]
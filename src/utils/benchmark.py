@@ -0,0 +1,500 @@
+import time
+import json
+import random
+import signal
+import statistics
+import sys
+import threading
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+from src.core.grid import SudokuGrid
+from src.core.validator import is_valid_sudoku
+from src.core.budget import Budget
+from src.utils.measure import measure_call
+from src.utils.profiling import DEFAULT_TOP, profile_call, write_profile
+
+from src.algorithms import ALGORITHMS, OWN_POOL, STOCHASTIC  # Import centralisé
+from src.utils.loader import load_grid_from_dataset, load_all_grids
+
+# Base du projet (2 niveaux au-dessus de ce fichier)
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DATA_DIR = PROJECT_ROOT / "data"
+RESULTS_DIR = PROJECT_ROOT / "web_interface" / "data"
+
+# Budget appliqué par défaut à chaque solveur (voir src/core/budget.py)
+DEFAULT_LIMITS = {"max_time": 30.0}
+
+
+def run_algorithm(name, solver, grid_initial: SudokuGrid, limits=None,
+                  trace_memory: bool = True, count_events: bool = True,
+                  profile_dir=None, profile_top: int = DEFAULT_TOP) -> dict:
+    """
+    Exécute un solveur sur une copie de la grille et complète son dictionnaire de mesures.
+    Les temps (temps, temps_cpu) viennent toujours d'une exécution sans tracemalloc.
+    :param limits: arguments de Budget (max_time, max_nodes, max_memory_mb) ; None = illimité
+    :param trace_memory: pic d'allocations (memoire_pic_octets) relevé par une seconde exécution,
+                         sous tracemalloc (voir traced_peak) ; sans effet sur les temps
+    :param count_events: compteurs d'évènements du solveur (expansions, tests de candidats, copies)
+    :param profile_dir: exécute le solveur sous cProfile et y écrit <algo>.pstats et <algo>.folded
+                        (voir src/utils/profiling.py) ; res["profil"] liste les 'profile_top' fonctions
+                        les plus coûteuses
+    """
+    grid_copy = SudokuGrid(grid_initial.to_list())
+    counters = {} if count_events else None
+    budget = Budget(**(limits or {}), counters=counters)
+    random_state = random.getstate()
+    # --- Attendu : chaque solveur retourne un DICO de mesures ---
+    if profile_dir is None:
+        res, measures = measure_call(solver, grid_copy, budget=budget, trace_memory=False)
+    else:
+        (res, profiler), measures = measure_call(profile_call, solver, grid_copy, budget=budget,
+                                                 trace_memory=False)
+        res["profil"] = write_profile(profiler, profile_dir, name, profile_top)
+    # Ajoute les infos de temps, nom algo, grille initiale, etc.
+    res["algorithme"] = name
+    res["temps"] = round(measures["temps_ns"] / 1e9, 4)
+    res.update(measures)
+    if counters is not None:
+        res["compteurs"] = counters
+    res["grille_initiale"] = grid_initial.to_list()
+    # Budget épuisé : une exécution tracée (plus lente) le serait aussi, on ne la lance pas
+    if trace_memory and not res.get("timeout"):
+        add_traced_peak(res, solver, grid_initial, limits, random_state)
+
+    # Optionnel : vérification manuelle de succès (si non déjà dans res)
+    if "taux_succes" not in res:
+        res["taux_succes"] = is_valid_sudoku(SudokuGrid(res["grille_resolue"]))
+
+    # Optionnel : nombre de cases fausses (utile pour visualisation)
+    if "cases_fausses" not in res and not res.get("taux_succes", False):
+        res["cases_fausses"] = count_false_cells(SudokuGrid(res["grille_resolue"]))
+    else:
+        res["cases_fausses"] = 0
+    return res
+
+
+def traced_peak(solver, grid_initial: SudokuGrid, limits=None, random_state=None):
+    """
+    Pic d'allocations (octets) d'une exécution à part sous tracemalloc : même grille, même budget
+    et, si 'random_state' est donné, même graine que l'exécution chronométrée.
+    tracemalloc ralentit le solveur (x2 à x8) : cette exécution consomme son budget temps plus vite.
+    """
+    after = random.getstate()
+    if random_state is not None:
+        random.setstate(random_state)
+    try:
+        _, measures = measure_call(solver, SudokuGrid(grid_initial.to_list()), budget=Budget(**(limits or {})),
+                                   trace_memory=True)
+    finally:
+        # L'état aléatoire reste celui laissé par l'exécution chronométrée
+        random.setstate(after)
+    return measures["memoire_pic_octets"]
+
+
+def add_traced_peak(res: dict, solver, grid_initial: SudokuGrid, limits=None, random_state=None) -> dict:
+    """Complète res avec memoire_pic_octets (exécution tracée séparée, voir traced_peak)."""
+    res["memoire_pic_octets"] = traced_peak(solver, grid_initial, limits, random_state)
+    res["memoire_pic_mesure"] = "execution_separee"
+    return res
+
+
+def save_results(results, difficulty: str):
+    """
+    Écrit les résultats dans web_interface/data/results_<niveau>.json.
+    Fusion par nom d'algorithme avec le fichier existant, sur la même grille seulement : une exécution
+    sur une partie des algorithmes ne remplace que leurs entrées, celles des autres solveurs sont
+    conservées si elles portent sur la même grille initiale (sinon le fichier est remplacé, le tableau
+    de bord ne compare que des résultats obtenus sur une même grille).
+    """
+    # Sauvegarde des résultats DANS le bon dossier à la racine du projet
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    output_file = RESULTS_DIR / f"results_{difficulty.lower()}.json"
+
+    grids = [r.get("grille_initiale") for r in results]
+    by_name = {}
+    if output_file.exists():
+        try:
+            with open(output_file, encoding="utf-8") as f:
+                by_name = {r["algorithme"]: r for r in json.load(f)
+                           if "algorithme" in r and r.get("grille_initiale") in grids}
+        except (json.JSONDecodeError, TypeError):
+            print(f"⚠️ {output_file} illisible : il est remplacé")
+    by_name.update((r["algorithme"], r) for r in results)
+    # Ordre de ALGORITHMS ; les algorithmes qui n'existent plus sont retirés
+    results = [by_name[name] for name in ALGORITHMS if name in by_name]
+
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+    print(f"\n✅ Résultats sauvegardés dans : {output_file}")
+    return output_file
+
+
+def run_named_algorithm(name: str, grid, limits=None, trace_memory: bool = True,
+                        profile_dir=None, profile_top: int = DEFAULT_TOP) -> dict:
+    """Version picklable de run_algorithm (nom + grille brute), exécutable dans un pool de processus."""
+    return run_algorithm(name, ALGORITHMS[name], SudokuGrid(grid), limits, trace_memory,
+                         profile_dir=profile_dir, profile_top=profile_top)
+
+
+def _report(name, res):
+    if res.get("timeout"):
+        print(f"⏱️ {name} : budget épuisé ({res.get('budget_depasse')}), résultat partiel.")
+    elif not res.get("taux_succes", False):
+        print(f"⚠️ {name} a généré une solution invalide.")
+
+
+def run_all_algorithms(difficulty: str, limits=None, on_progress=None, grid=None,
+                       algorithms=None, executor=None, save=True, cache=None, trace_memory=True,
+                       profile=False, profile_top: int = DEFAULT_TOP):
+    """
+    Exécute les algorithmes sur une grille et retourne la liste des résultats (en mémoire).
+    :param difficulty: niveau ; la grille est tirée au hasard dans data/<niveau>.csv si 'grid' est None
+    :param limits: budget de chaque solveur (voir run_algorithm)
+    :param on_progress: appelé avec un évènement (dict) après chaque algorithme
+    :param grid: grille à résoudre (9x9 ou SudokuGrid) à la place d'un tirage dans le CSV
+    :param algorithms: noms des algorithmes à exécuter (défaut : tous ceux de ALGORITHMS)
+    :param executor: pool (ex : ProcessPoolExecutor déjà démarré) où exécuter les algorithmes,
+                     un à la fois (workers réutilisés d'une requête à l'autre)
+    :param save: écrit aussi web_interface/data/results_<niveau>.json
+    :param cache: ResultCache (src/utils/result_cache.py) ; les solveurs déterministes déjà exécutés
+                  sur cette grille sont servis depuis le cache, les stochastiques sont relancés
+    :param trace_memory: pic d'allocations de chaque solveur, relevé par une exécution tracée séparée (temps non affectés)
+    :param profile: profile chaque solveur (cProfile) ; .pstats et piles repliées dans
+                    web_interface/data/profiles_<niveau>/, 'profile_top' fonctions dans res["profil"].
+                    Le cache n'est alors ni lu ni écrit (les temps profilés ne sont pas comparables)
+    """
+    if grid is None:
+        data_path = DATA_DIR / f"{difficulty.lower()}.csv"
+        if not data_path.exists():
+            raise FileNotFoundError(f"❌ Fichier introuvable : {data_path}")
+        grid = load_grid_from_dataset(data_path)
+    grid_initial = grid if isinstance(grid, SudokuGrid) else SudokuGrid(grid)
+
+    names = list(algorithms) if algorithms is not None else list(ALGORITHMS)
+    unknown = [name for name in names if name not in ALGORITHMS]
+    if unknown:
+        raise ValueError(f"❌ Algorithme(s) inconnu(s) : {', '.join(unknown)}")
+
+    by_name = {}
+    profile_dir = RESULTS_DIR / f"profiles_{difficulty.lower()}" if profile else None
+    if profile:
+        cache = None
+
+    def record(index, name, res=None, error=None):
+        event = {"niveau": difficulty, "algorithme": name, "index": index, "total": len(names)}
+        if error is None:
+            by_name[name] = res
+            event.update(temps=res["temps"], taux_succes=res.get("taux_succes", False),
+                         timeout=res.get("timeout", False))
+            _report(name, res)
+        else:
+            print(f"❌ Erreur avec {name} : {error}")
+            event["erreur"] = str(error)
+        if on_progress is not None:
+            on_progress(event)
+
+    mode = measure_mode(trace_memory)
+    done = 0
+    to_run = []
+    for name in names:
+        cached = None
+        if cache is not None and name not in STOCHASTIC:
+            cached = cache.get(name, ALGORITHMS[name], grid_initial.grid, limits, mode=mode)
+        if cached is None:
+            to_run.append(name)
+        else:
+            done += 1
+            print(f"💾 {name} : résultat servi depuis le cache")
+            record(done, name, cached)
+
+    def finish(name, res):
+        if cache is not None and name not in STOCHASTIC:
+            cache.put(name, ALGORITHMS[name], grid_initial.grid, res, limits, mode=mode)
+        record(done, name, res)
+
+    # Un solveur à la fois, y compris sur le pool (workers déjà préchauffés) : temps, temps CPU et
+    # mémoire sont mesurés sans autre solveur en cours, comparables à une exécution séquentielle
+    for name in to_run:
+        print(f"▶️ Exécution de l'algorithme : {name}")
+        done += 1
+        try:
+            # Solveurs à pool propre : dans ce processus, sinon leurs restarts passeraient en séquentiel
+            if executor is None or name in OWN_POOL:
+                res = run_algorithm(name, ALGORITHMS[name], grid_initial, limits, trace_memory,
+                                    profile_dir=profile_dir, profile_top=profile_top)
+            else:
+                res = executor.submit(run_named_algorithm, name, grid_initial.to_list(), limits, trace_memory,
+                                      profile_dir, profile_top).result()
+            finish(name, res)
+        except BrokenProcessPool as e:
+            # Worker tué pendant ce solveur (ex : mémoire épuisée) : pool recréé pour les suivants
+            record(done, name, error=e)
+            if hasattr(executor, "restart"):
+                executor.restart()
+        except Exception as e:
+            record(done, name, error=e)
+
+    # Ordre stable (celui de ALGORITHMS), cache compris
+    results = [by_name[name] for name in names if name in by_name]
+    if save:
+        save_results(results, difficulty)
+    return results
+
+
+def _warm_up_worker():
+    """Importe les solveurs et initialise leurs structures partagées (ex : matrice DLX)."""
+    from src.algorithms.dlx import get_engine
+    get_engine()
+    return True
+
+
+def warm_up(executor, workers: int):
+    """Fait démarrer et préchauffer les workers d'un pool avant la première requête."""
+    for future in [executor.submit(_warm_up_worker) for _ in range(workers)]:
+        future.result()
+
+
+class SolverPool:
+    """
+    Pool de processus préchauffé, utilisable comme 'executor' de run_all_algorithms.
+    Si un worker meurt (BrokenProcessPool), 'restart' remplace le pool : les exécutions
+    suivantes repartent sur des workers neufs au lieu d'échouer jusqu'au redémarrage du serveur.
+    """
+
+    def __init__(self, workers: int = 1):
+        self.workers = workers
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _current(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+                warm_up(self._executor, self.workers)
+            return self._executor
+
+    def start(self):
+        """Démarre et préchauffe les workers (sinon fait à la première soumission)."""
+        self._current()
+
+    def submit(self, fn, *args, **kwargs):
+        return self._current().submit(fn, *args, **kwargs)
+
+    def restart(self):
+        with self._lock:
+            broken, self._executor = self._executor, None
+        if broken is not None:
+            broken.shutdown(wait=False, cancel_futures=True)
+        print("♻️ Pool de solveurs recréé (worker perdu)")
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+# ==== Mode batch : toutes les grilles d'un CSV x tous les algorithmes ====
+
+class TaskTimeout(Exception):
+    """Levée dans un worker quand une tâche dépasse son temps imparti."""
+
+
+def _raise_timeout(signum, frame):
+    raise TaskTimeout()
+
+
+def task_seed(seed: int, puzzle_id, name: str) -> int:
+    """Graine stable (indépendante du processus et de PYTHONHASHSEED) pour une tâche."""
+    return zlib.crc32(f"{seed}:{puzzle_id}:{name}".encode("utf-8"))
+
+
+def _run_task(name: str, puzzle_id, grid, seed: int, timeout, limits=None, trace_memory=True):
+    """
+    Tâche exécutée dans un worker : une grille, un algorithme.
+    'timeout' s'applique à l'exécution chronométrée, puis à part à l'exécution tracée (pic d'allocations).
+    """
+    random.seed(task_seed(seed, puzzle_id, name))
+    use_alarm = timeout and hasattr(signal, "setitimer")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    start = time.perf_counter()
+    random_state = random.getstate()
+    try:
+        res = run_algorithm(name, ALGORITHMS[name], SudokuGrid(grid), limits, trace_memory=False)
+    except TaskTimeout:
+        res = {
+            "algorithme": name,
+            "temps": round(time.perf_counter() - start, 4),
+            "taux_succes": False,
+            "timeout": True,
+        }
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+    if trace_memory and not res.get("timeout"):
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+        try:
+            add_traced_peak(res, ALGORITHMS[name], SudokuGrid(grid), limits, random_state)
+        except TaskTimeout:
+            res["memoire_pic_octets"] = None
+        finally:
+            if use_alarm:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+    res["puzzle_id"] = puzzle_id
+    return res
+
+
+def percentile(values, p: float):
+    """Percentile par rang le plus proche (p entre 0 et 100)."""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    rank = max(1, -(-len(ordered) * p // 100))
+    return ordered[int(rank) - 1]
+
+
+def summarize(values) -> dict:
+    """Moyenne, médiane et p95 d'une série de mesures."""
+    if not values:
+        return {"moyenne": None, "mediane": None, "p95": None}
+    return {
+        "moyenne": round(statistics.mean(values), 4),
+        "mediane": round(statistics.median(values), 4),
+        "p95": round(percentile(values, 95), 4),
+    }
+
+
+def aggregate_results(runs, names) -> dict:
+    """Regroupe les exécutions par algorithme et calcule les statistiques."""
+    stats = {}
+    for name in names:
+        algo_runs = [r for r in runs if r["algorithme"] == name]
+        finished = [r for r in algo_runs if not r.get("timeout") and not r.get("erreur")]
+        stats[name] = {
+            "nb_grilles": len(algo_runs),
+            "nb_succes": sum(1 for r in algo_runs if r.get("taux_succes")),
+            "nb_timeouts": sum(1 for r in algo_runs if r.get("timeout")),
+            "nb_erreurs": sum(1 for r in algo_runs if r.get("erreur")),
+            "temps": summarize([r["temps"] for r in finished]),
+            "iterations": summarize([r["iterations"] for r in finished if "iterations" in r]),
+        }
+    return stats
+
+
+def measure_mode(trace_memory: bool, count_events: bool = True) -> dict:
+    """Options de mesure d'un résultat, partie de sa clé de cache (voir ResultCache.key)."""
+    return {"trace_memory": bool(trace_memory), "count_events": bool(count_events)}
+
+
+def _cache_seed(seed: int, puzzle_id, name: str):
+    """Graine de la clé de cache d'une tâche batch (None pour un solveur déterministe)."""
+    return task_seed(seed, puzzle_id, name) if name in STOCHASTIC else None
+
+
+def run_batch(difficulty: str, sample=None, seed: int = 0, workers=None,
+              timeout=60.0, max_tasks_per_child=50, limits=None, algorithms=None, cache=None,
+              trace_memory=True):
+    """
+    Exécute chaque algorithme sur toutes les grilles du CSV (ou 'sample' grilles tirées avec 'seed')
+    dans un pool de processus, puis agrège moyenne / médiane / p95 du temps et des itérations.
+    :param timeout: temps max (s) par tâche, appliqué dans le worker (None = illimité)
+    :param max_tasks_per_child: recyclage des workers après N tâches (Python 3.11+)
+    :param limits: budget coopératif de chaque solveur (voir run_algorithm)
+    :param algorithms: noms des algorithmes à exécuter (défaut : tous)
+    :param cache: ResultCache ; seules les tâches (grille, algorithme, graine) absentes sont exécutées,
+                  agrandir l'échantillon ne relance donc que les nouvelles grilles
+    :param trace_memory: pic d'allocations de chaque tâche, relevé par une exécution tracée séparée (temps non affectés)
+    """
+    data_path = DATA_DIR / f"{difficulty.lower()}.csv"
+    if not data_path.exists():
+        raise FileNotFoundError(f"❌ Fichier introuvable : {data_path}")
+
+    names = list(algorithms) if algorithms is not None else list(ALGORITHMS)
+    unknown = [name for name in names if name not in ALGORITHMS]
+    if unknown:
+        raise ValueError(f"❌ Algorithme(s) inconnu(s) : {', '.join(unknown)}")
+    # Chaque tâche tourne déjà dans un worker : un solveur à pool propre y serait séquentiel
+    skipped = [name for name in names if name in OWN_POOL]
+    if skipped:
+        names = [name for name in names if name not in OWN_POOL]
+        if not names:
+            raise ValueError(f"❌ Non disponible en batch (parallélisme impossible dans un worker) : {', '.join(skipped)}")
+        print(f"⏭️ Ignoré(s) en batch (parallélisme impossible dans un worker) : {', '.join(skipped)}")
+    puzzles = load_all_grids(data_path, sample=sample, seed=seed)
+    print(f"📦 Batch : {len(puzzles)} grilles x {len(names)} algorithmes")
+
+    pool_kwargs = {"max_workers": workers}
+    if sys.version_info >= (3, 11) and max_tasks_per_child:
+        pool_kwargs["max_tasks_per_child"] = max_tasks_per_child
+
+    mode = measure_mode(trace_memory)
+    runs = []
+    tasks = []
+    for puzzle_id, grid in puzzles:
+        for name in names:
+            cached = None
+            if cache is not None:
+                cached = cache.get(name, ALGORITHMS[name], grid, limits, _cache_seed(seed, puzzle_id, name), mode)
+            if cached is None:
+                tasks.append((name, puzzle_id, grid))
+            else:
+                cached["puzzle_id"] = puzzle_id
+                runs.append(cached)
+    if cache is not None:
+        print(f"💾 {len(runs)} tâches servies depuis le cache, {len(tasks)} à exécuter")
+
+    with ProcessPoolExecutor(**pool_kwargs) as executor:
+        futures = {
+            executor.submit(_run_task, name, puzzle_id, grid, seed, timeout, limits, trace_memory):
+                (name, puzzle_id, grid)
+            for name, puzzle_id, grid in tasks
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            name, puzzle_id, grid = futures[future]
+            try:
+                res = future.result()
+            except Exception as e:
+                print(f"❌ Erreur avec {name} (grille {puzzle_id}) : {e}")
+                res = {"algorithme": name, "puzzle_id": puzzle_id, "taux_succes": False, "erreur": str(e)}
+            if res.get("timeout"):
+                print(f"⏱️ {name} : temps dépassé sur la grille {puzzle_id}")
+            elif cache is not None:
+                cache.put(name, ALGORITHMS[name], grid, res, limits, _cache_seed(seed, puzzle_id, name), mode)
+            runs.append(res)
+            if done % 50 == 0:
+                print(f"   {done}/{len(futures)} tâches terminées")
+
+    stats = aggregate_results(runs, names)
+
+    # Une entrée par algorithme (compatible avec le tableau de bord) : l'exécution
+    # sur la première grille du lot, complétée par les statistiques du batch
+    first_id = puzzles[0][0]
+    results = []
+    for name in names:
+        res = next((r for r in runs if r["algorithme"] == name and r["puzzle_id"] == first_id), None)
+        if res is None or "grille_resolue" not in res:
+            res = {
+                "algorithme": name,
+                "grille_initiale": puzzles[0][1],
+                "grille_resolue": puzzles[0][1],
+                "temps": (res or {}).get("temps", 0),
+                "taux_succes": False,
+                "categorie": next((r["categorie"] for r in runs if r["algorithme"] == name and "categorie" in r), None),
+            }
+        res["batch"] = stats[name]
+        results.append(res)
+
+    save_results(results, difficulty)
+    return results
+
+def count_false_cells(grid: SudokuGrid) -> int:
+    """Cases vides ou dont la valeur apparaît ailleurs dans leur ligne, colonne ou bloc."""
+    return sum(1 for i in range(9) for j in range(9) if grid.grid[i][j] == 0 or grid.has_duplicate(i, j))
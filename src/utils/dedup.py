@@ -0,0 +1,130 @@
+import argparse
+import csv
+import os
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+
+from src.core.canonical import canonicalize, apply_transform
+from src.utils.loader import iter_puzzles
+from src.utils.packed import convert_csv
+
+# ==== Déduplication d'un jeu de grilles à symétrie près ====
+#
+# Deux grilles équivalentes (transposition, permutations de lignes / colonnes / bandes / piles,
+# renommage des chiffres) ont la même forme canonique (src/core/canonical.py) :
+# on garde la première grille de chaque classe, dans l'ordre du fichier.
+
+FIELDS = ["puzzle_id", "puzzle", "solution", "difficulty"]
+
+
+def _canonicalize_chunk(puzzles):
+    return [canonicalize(puzzle) for puzzle in puzzles]
+
+
+def _parallel_pairs(records, executor, chunksize: int, in_flight: int):
+    """
+    (enregistrement, (forme canonique, transformation)) dans l'ordre du fichier, calculés par paquets
+    de 'chunksize' grilles ; au plus 'in_flight' paquets lus d'avance (mémoire bornée, lecture en flux).
+    """
+    pending = deque()
+    while True:
+        while len(pending) < in_flight:
+            chunk = list(islice(records, chunksize))
+            if not chunk:
+                break
+            pending.append((chunk, executor.submit(_canonicalize_chunk, [r.puzzle for r in chunk])))
+        if not pending:
+            return
+        chunk, future = pending.popleft()
+        yield from zip(chunk, future.result())
+
+
+def iter_unique(filename, workers=None, chunksize: int = 64, stats=None):
+    """
+    Parcourt un jeu de grilles (CSV, CSV compressé, .sdkb) et produit (enregistrement, forme canonique,
+    transformation) pour la première grille de chaque classe d'équivalence.
+    :param workers: processus de calcul des formes canoniques (1 = dans ce processus)
+    :param chunksize: grilles par paquet envoyé aux processus (2 paquets par processus en cours au plus)
+    :param stats: dict complété avec 'lues' et 'doublons'
+    """
+    stats = stats if stats is not None else {}
+    stats.update(lues=0, doublons=0)
+    seen = set()
+    records = iter_puzzles(filename)
+    if workers == 1:
+        pairs = ((record, canonicalize(record.puzzle)) for record in records)
+        executor = None
+    else:
+        workers = workers or os.cpu_count() or 1
+        executor = ProcessPoolExecutor(max_workers=workers)
+        pairs = _parallel_pairs(records, executor, chunksize, 2 * workers)
+    try:
+        for record, (canonical, transform) in pairs:
+            stats["lues"] += 1
+            if canonical in seen:
+                stats["doublons"] += 1
+                continue
+            seen.add(canonical)
+            yield record, canonical, transform
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+def _as_string(grid) -> str:
+    return "".join(str(v) for row in grid for v in row)
+
+
+def dedup_dataset(filename, out_path, workers=None, canonical: bool = False) -> dict:
+    """
+    Écrit les grilles uniques (à symétrie près) dans 'out_path' : CSV, ou .sdkb (voir src/utils/packed.py).
+    :param canonical: écrit la forme canonique (et la solution transformée de la même façon)
+                      au lieu de la première grille rencontrée
+    :return: {"lues", "doublons", "ecrites"}
+    """
+    out_path = Path(out_path)
+    packed = out_path.suffix == ".sdkb"
+    csv_path = out_path
+    if packed:
+        fd, tmp = tempfile.mkstemp(suffix=".csv", dir=str(out_path.parent))
+        os.close(fd)
+        csv_path = Path(tmp)
+
+    stats = {}
+    written = 0
+    try:
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(FIELDS)
+            for record, form, transform in iter_unique(filename, workers, stats=stats):
+                puzzle, solution = record.puzzle, record.solution
+                if canonical:
+                    puzzle = form
+                    if solution:
+                        solution = _as_string(apply_transform(solution, transform))
+                difficulty = "" if record.difficulty is None else record.difficulty
+                writer.writerow([record.puzzle_id, puzzle, solution or "", difficulty])
+                written += 1
+        if packed:
+            convert_csv(csv_path, out_path)
+    finally:
+        if packed:
+            csv_path.unlink()
+    stats["ecrites"] = written
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Supprime les grilles équivalentes (à symétrie près) d'un jeu de données")
+    parser.add_argument("dataset", help="Fichier de grilles (CSV, CSV compressé ou .sdkb)")
+    parser.add_argument("output", help="Fichier de sortie (.csv ou .sdkb)")
+    parser.add_argument("--workers", type=int, default=None, help="Nombre de processus (défaut : nb de coeurs)")
+    parser.add_argument("--canonical", action="store_true", help="Écrit la forme canonique de chaque grille")
+    args = parser.parse_args()
+
+    stats = dedup_dataset(args.dataset, args.output, workers=args.workers, canonical=args.canonical)
+    print(f"✅ {stats['ecrites']} grilles uniques écrites dans : {args.output} "
+          f"({stats['doublons']} doublons sur {stats['lues']} grilles lues)")
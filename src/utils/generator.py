@@ -1,5 +1,14 @@
-import random
+import argparse
 import copy
+import csv
+import os
+import random
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+from src.core.bitboard import BitboardGrid, MASK_DIGITS, POPCOUNT
+from src.algorithms.csp import CSPSolver
+from src.algorithms.dlx import count_solutions
 
 GRID_SIZE = 9
 BLOCK_SIZE = 3
@@ -22,38 +31,60 @@ def is_valid(grid, row, col, num):
                 return False
     return True
 
-def solve_grid(grid):
+def _fill(board, rng):
+    """Remplit le bitboard : case au plus petit nombre de candidats, chiffres dans un ordre aléatoire."""
+    best, best_mask, best_size = None, 0, 10
+    for cell in range(81):
+        if board.cells[cell]:
+            continue
+        mask = board.candidates(cell // 9, cell % 9)
+        size = POPCOUNT[mask]
+        if size < best_size:
+            best, best_mask, best_size = cell, mask, size
+            if size <= 1:
+                break
+    if best is None:
+        return True
+    if best_size == 0:
+        return False
+
+    row, col = divmod(best, 9)
+    nums = list(MASK_DIGITS[best_mask])
+    rng.shuffle(nums)
+    for num in nums:
+        board.place(row, col, num)
+        if _fill(board, rng):
+            return True
+        board.unplace(row, col)
+    return False
+
+def solve_grid(grid, rng=None):
     """
     Remplit la grille avec des chiffres valides (résolution complète via backtracking).
+    Les contraintes sont tenues dans un bitboard : test d'un chiffre en O(1).
     """
+    board = BitboardGrid(grid)
+    if not _fill(board, rng or random):
+        return False
     for row in range(GRID_SIZE):
-        for col in range(GRID_SIZE):
-            if grid[row][col] == 0:
-                nums = list(range(1, 10))
-                random.shuffle(nums)
-                for num in nums:
-                    if is_valid(grid, row, col, num):
-                        grid[row][col] = num
-                        if solve_grid(grid):
-                            return True
-                        grid[row][col] = 0
-                return False
+        grid[row][:] = board.cells[row * 9:row * 9 + 9]
     return True
 
-def generate_full_grid():
+def generate_full_grid(rng=None):
     """
     Génère une grille complète et valide de Sudoku.
     Returns:
         List[List[int]]: Grille complète
     """
     grid = [[0] * GRID_SIZE for _ in range(GRID_SIZE)]
-    solve_grid(grid)
+    solve_grid(grid, rng)
     return grid
 
 def remove_cells(grid, difficulty="medium"):
     """
     Supprime des cases selon le niveau de difficulté.
-    
+    (Ancienne méthode : nombre de cases fixe, sans garantie de solution unique.)
+
     Args:
         grid: grille complète
         difficulty: niveau ('easy', 'medium', 'hard', 'expert')
@@ -77,16 +108,179 @@ def remove_cells(grid, difficulty="medium"):
             removed += 1
     return grid_copy
 
-def generate_sudoku(difficulty="medium"):
+# ==== Difficulté mesurée par le solveur ====
+#
+# Rang = règle la plus forte dont le solveur CSP a besoin pour finir :
+#   0 : singletons nus seuls    1 : + singletons cachés
+#   2 : + paires nues           3 : recherche (au moins un choix)
+# easy : rang 0, medium : rang 1, hard : rang 2 ou une seule supposition, expert : recherche.
+# Le score 'difficulty' reste dans la tranche du niveau
+# (mêmes tranches que les CSV : easy < 0.25 <= medium < 0.5 <= hard < 0.75 <= expert).
+
+TECHNIQUES = ["singletons_nus", "singletons_caches", "paires_nues", "recherche"]
+LEVELS = ["easy", "medium", "hard", "expert"]
+LEVEL_BASE = {"easy": 0.0, "medium": 0.25, "hard": 0.5, "expert": 0.75}
+# En 'hard', la recherche est tolérée si une seule supposition suffit (sans retour arrière)
+HARD_MAX_ITERATIONS = 2
+
+def rate_puzzle(grid):
+    """
+    Mesure la difficulté d'une grille en la résolvant avec des règles de plus en plus fortes.
+    Returns:
+        dict: rang, technique, indices, itérations et backtracks de la recherche
+    """
+    clues = sum(1 for row in grid for v in row if v)
+    steps = (
+        {"use_hidden": False, "use_pairs": False},
+        {"use_hidden": True, "use_pairs": False},
+        {"use_hidden": True, "use_pairs": True},
+    )
+    for rank, options in enumerate(steps):
+        solver = CSPSolver(grid, **options)
+        if solver.solve() and solver.iterations == 1:
+            break  # résolue par propagation seule
+    else:
+        rank = 3
+    return {
+        "rang": rank,
+        "technique": TECHNIQUES[rank],
+        "indices": clues,
+        "iterations": solver.iterations,
+        "nb_backtracks": solver.nb_backtracks,
+    }
+
+def level_of(rating):
+    """Niveau correspondant à une mesure de rate_puzzle."""
+    rank = rating["rang"]
+    if rank == 3:
+        short = rating["iterations"] <= HARD_MAX_ITERATIONS and rating["nb_backtracks"] == 0
+        return "hard" if short else "expert"
+    return ("easy", "medium", "hard")[rank]
+
+def score_of(rating, level):
+    """Score continu dans la tranche du niveau : plus de cases vides et de backtracks = plus difficile."""
+    effort = (81 - rating["indices"]) / 64 + rating["nb_backtracks"] / 50
+    return round(LEVEL_BASE[level] + 0.249 * min(1.0, effort / 2), 3)
+
+def _removal_groups(symmetry, rng):
+    """Groupes de cases retirées ensemble ('rotational' : symétrie centrale, 'none' : case par case)."""
+    if symmetry == "rotational":
+        groups = [(cell, 80 - cell) if cell != 40 else (40,) for cell in range(41)]
+    elif symmetry == "none":
+        groups = [(cell,) for cell in range(81)]
+    else:
+        raise ValueError(f"❌ Symétrie inconnue : {symmetry}")
+    rng.shuffle(groups)
+    return groups
+
+def carve_unique(solution, difficulty="medium", symmetry="rotational", rng=None):
+    """
+    Retire des groupes de cases symétriques tant que la solution reste unique
+    (comptage des solutions arrêté à 2) et que la difficulté mesurée ne dépasse pas le niveau.
+    Returns:
+        (grille, mesure de la grille obtenue)
+    """
+    rng = rng or random
+    target = LEVELS.index(difficulty)
+    puzzle = [row[:] for row in solution]
+    rating = rate_puzzle(puzzle)
+
+    for group in _removal_groups(symmetry, rng):
+        saved = [(cell, puzzle[cell // 9][cell % 9]) for cell in group]
+        for cell, _ in saved:
+            puzzle[cell // 9][cell % 9] = 0
+        if count_solutions(puzzle, limit=2) == 1:
+            candidate = rate_puzzle(puzzle)
+            if LEVELS.index(level_of(candidate)) <= target:
+                rating = candidate
+                continue
+        for cell, value in saved:
+            puzzle[cell // 9][cell % 9] = value
+
+    return puzzle, rating
+
+def generate_unique(difficulty="medium", symmetry="rotational", rng=None, max_attempts=50):
+    """
+    Génère une grille à solution unique dont la difficulté mesurée correspond au niveau.
+    Returns:
+        (grille, solution, mesure)
+    """
+    difficulty = difficulty.lower()
+    if difficulty not in LEVELS:
+        raise ValueError(f"❌ Niveau inconnu : {difficulty}")
+    rng = rng or random
+    for _ in range(max_attempts):
+        solution = generate_full_grid(rng)
+        puzzle, rating = carve_unique(solution, difficulty, symmetry, rng)
+        if level_of(rating) == difficulty:
+            rating["difficulty"] = score_of(rating, difficulty)
+            return puzzle, solution, rating
+    raise RuntimeError(f"❌ Aucune grille de niveau {difficulty} après {max_attempts} essais.")
+
+def generate_sudoku(difficulty="medium", unique=True):
     """
     Génère une grille jouable selon une difficulté choisie.
-    
+
     Args:
         difficulty: Niveau de difficulté à appliquer.
+        unique: solution unique et niveau mesuré (sinon : retrait aléatoire d'un nombre fixe de cases)
 
     Returns:
         List[List[int]]: Grille à jouer
     """
+    if unique:
+        return generate_unique(difficulty)[0]
     full_grid = generate_full_grid()
     puzzle = remove_cells(full_grid, difficulty)
     return puzzle
+
+# ==== Génération en parallèle ====
+
+def _generate_task(difficulty, symmetry, seed, index):
+    """Tâche exécutée dans un worker : graine propre à la grille -> résultat reproductible."""
+    rng = random.Random(zlib.crc32(f"{seed}:{difficulty}:{index}".encode("utf-8")))
+    puzzle, solution, rating = generate_unique(difficulty, symmetry, rng)
+    to_str = lambda grid: "".join(str(v) for row in grid for v in row)
+    return to_str(puzzle), to_str(solution), rating["difficulty"]
+
+def generate_batch(count, difficulty="medium", symmetry="rotational", seed=0, workers=None, start_id=1):
+    """
+    Génère 'count' grilles uniques réparties sur plusieurs processus.
+    Returns:
+        List[dict]: lignes (puzzle_id, puzzle, solution, difficulty), dans l'ordre des indices
+    """
+    workers = workers or os.cpu_count() or 1
+    indices = range(count)
+    if workers == 1:
+        results = [_generate_task(difficulty, symmetry, seed, i) for i in indices]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_generate_task, [difficulty] * count, [symmetry] * count,
+                                        [seed] * count, indices, chunksize=max(1, count // (workers * 4))))
+    return [
+        {"puzzle_id": start_id + i, "puzzle": puzzle, "solution": solution, "difficulty": score}
+        for i, (puzzle, solution, score) in enumerate(results)
+    ]
+
+def write_csv(rows, path):
+    """Écrit les grilles au format des datasets (puzzle_id, puzzle, solution, difficulty)."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=["puzzle_id", "puzzle", "solution", "difficulty"])
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Génère des grilles à solution unique d'un niveau donné")
+    parser.add_argument("--level", default="medium", choices=LEVELS, help="Niveau visé")
+    parser.add_argument("--count", type=int, default=100, help="Nombre de grilles")
+    parser.add_argument("--out", default=None, help="Fichier CSV de sortie (défaut : <niveau>_generated.csv)")
+    parser.add_argument("--symmetry", default="rotational", choices=["rotational", "none"])
+    parser.add_argument("--seed", type=int, default=0, help="Graine (résultat reproductible)")
+    parser.add_argument("--workers", type=int, default=None, help="Nombre de processus (défaut : nb de coeurs)")
+    args = parser.parse_args()
+
+    rows = generate_batch(args.count, args.level, args.symmetry, args.seed, args.workers)
+    output = args.out or f"{args.level}_generated.csv"
+    write_csv(rows, output)
+    print(f"✅ {len(rows)} grilles ({args.level}) écrites dans : {output}")
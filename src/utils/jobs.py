@@ -0,0 +1,152 @@
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# Préfixe des lignes de progression écrites par scripts/main.py (--progress)
+PROGRESS_PREFIX = "@@progress "
+
+def format_progress_line(event):
+    """Sérialise un évènement de progression sur une ligne (sortie standard)."""
+    return PROGRESS_PREFIX + json.dumps(event)
+
+
+class JobQueueFull(Exception):
+    """Levée quand trop de tâches sont déjà en attente."""
+
+
+class Job:
+    """
+    Une exécution en arrière-plan (ex : génération des résultats d'un niveau).
+    Les évènements de progression sont conservés dans l'ordre ; les lecteurs
+    (endpoint de statut, flux SSE) attendent les nouveaux via une Condition.
+    """
+
+    PENDING = "en_attente"
+    RUNNING = "en_cours"
+    DONE = "termine"
+    FAILED = "erreur"
+
+    def __init__(self, key):
+        self.id = uuid.uuid4().hex
+        self.key = key
+        self.status = Job.PENDING
+        self.error = None
+        self.result = None
+        self.events = []
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self._cond = threading.Condition()
+
+    @property
+    def is_finished(self):
+        return self.status in (Job.DONE, Job.FAILED)
+
+    def publish(self, event):
+        """Ajoute un évènement et réveille les lecteurs en attente."""
+        with self._cond:
+            self.events.append(event)
+            self._cond.notify_all()
+
+    def _set_status(self, status, error=None):
+        with self._cond:
+            self.status = status
+            self.error = error
+            if status == Job.RUNNING:
+                self.started = time.time()
+            elif status in (Job.DONE, Job.FAILED):
+                self.finished = time.time()
+            self._cond.notify_all()
+
+    def wait_events(self, since, timeout=15.0):
+        """
+        Attend qu'il y ait des évènements après l'indice 'since' (ou la fin de la tâche).
+        Retourne (nouveaux évènements, tâche terminée ?).
+        """
+        with self._cond:
+            if len(self.events) <= since and not self.is_finished:
+                self._cond.wait(timeout)
+            return self.events[since:], self.is_finished
+
+    def to_dict(self):
+        with self._cond:
+            return {
+                "job_id": self.id,
+                "cle": self.key,
+                "statut": self.status,
+                "erreur": self.error,
+                "progression": list(self.events),
+                "cree": self.created,
+                "debut": self.started,
+                "fin": self.finished,
+            }
+
+
+class JobManager:
+    """
+    File de tâches en arrière-plan avec un nombre borné de workers.
+    Une demande identique (même clé) à une tâche encore en attente ou en cours
+    renvoie cette tâche au lieu d'en créer une nouvelle.
+    """
+
+    def __init__(self, runner, max_workers=2, max_pending=16, history=50):
+        """
+        :param runner: fonction runner(job, *args) exécutée dans un worker ; publie la progression via job.publish
+        :param max_workers: nombre de tâches exécutées en parallèle
+        :param max_pending: nombre max de tâches non terminées (au-delà : JobQueueFull)
+        :param history: nombre de tâches terminées conservées pour consultation
+        """
+        self.runner = runner
+        self.max_pending = max_pending
+        self.history = history
+        self.jobs = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+
+    def submit(self, key, *args):
+        """Retourne (job, dédupliqué ?)."""
+        with self._lock:
+            job = self._inflight.get(key)
+            if job is not None:
+                return job, True
+            if len(self._inflight) >= self.max_pending:
+                raise JobQueueFull(f"Trop de tâches en attente ({self.max_pending}).")
+            job = Job(key)
+            self.jobs[job.id] = job
+            self._inflight[key] = job
+            self._prune()
+        self._executor.submit(self._run, job, args)
+        return job, False
+
+    def get(self, job_id):
+        with self._lock:
+            return self.jobs.get(job_id)
+
+    def list_jobs(self):
+        with self._lock:
+            return list(self.jobs.values())
+
+    def _run(self, job, args):
+        job._set_status(Job.RUNNING)
+        try:
+            job.result = self.runner(job, *args)
+            job._set_status(Job.DONE)
+        except Exception as e:
+            job._set_status(Job.FAILED, str(e))
+        finally:
+            with self._lock:
+                if self._inflight.get(job.key) is job:
+                    del self._inflight[job.key]
+
+    def _prune(self):
+        """Oublie les plus anciennes tâches terminées au-delà de 'history'."""
+        finished = [job_id for job_id, job in self.jobs.items() if job.is_finished]
+        for job_id in finished[:max(0, len(finished) - self.history)]:
+            del self.jobs[job_id]
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
@@ -1,7 +1,13 @@
+import bz2
+import gzip
+import lzma
 import random
 import csv
+from itertools import islice
 from pathlib import Path
 
+from src.utils.packed import PackedDataset, PuzzleRecord
+
 # Base du projet (2 niveaux au-dessus de ce fichier)
 BASE_DIR = Path(__file__).resolve().parents[2]
 DATA_DIR = BASE_DIR / "data"
@@ -16,34 +22,176 @@ def list_grids(data_dir=DATA_DIR):
     """
     return [f.name for f in data_dir.glob("*.csv")]
 
-def load_grid_from_dataset(filename, data_dir=DATA_DIR):
+def parse_grid(puzzle_str):
     """
-    Charge une grille aléatoire depuis un fichier CSV formaté avec les colonnes : puzzle_id, puzzle, solution, difficulty.
-    :param filename: nom du fichier (ex: 'expert.csv')
-    :param data_dir: dossier data/
+    Convertit une chaîne de 81 chiffres en matrice 9x9.
+    :param puzzle_str: chaîne de 81 caractères ('0' = case vide)
     :return: grille sous forme 9x9 (List[List[int]])
     """
+    if len(puzzle_str) != 81 or not puzzle_str.isdigit():
+        raise ValueError("❌ Format de grille invalide (81 chiffres requis).")
+    return [[int(puzzle_str[i * 9 + j]) for j in range(9)] for i in range(9)]
+
+def _resolve(filename, data_dir):
     path = Path(filename)
     if not path.exists():
         path = data_dir / filename
     if not path.exists():
         raise FileNotFoundError(f"❌ Fichier introuvable : {path}")
+    return path
+
+def is_packed(path):
+    """True pour un jeu de grilles binaire (.sdkb, voir src/utils/packed.py)."""
+    return Path(path).suffix == ".sdkb"
+
+def open_dataset(filename, data_dir=DATA_DIR):
+    """
+    Ouvre un jeu de grilles binaire (.sdkb) en mmap.
+    Accès O(1) : dataset[i], dataset.get_by_id(puzzle_id) ; itération : for record in dataset.
+    Penser à le fermer (ou l'utiliser avec 'with').
+    """
+    return PackedDataset(_resolve(filename, data_dir))
+
+# Ouverture transparente des CSV compressés (ex : expert.csv.gz, expert.csv.xz)
+_OPENERS = {".gz": gzip.open, ".xz": lzma.open, ".bz2": bz2.open}
+
+def _open_text(path):
+    opener = _OPENERS.get(Path(path).suffix, open)
+    return opener(path, "rt", newline='', encoding='utf-8')
+
+def _parse_difficulty(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+def iter_puzzles(filename, data_dir=DATA_DIR, min_difficulty=None, max_difficulty=None,
+                 shard_index=0, shard_count=1, start=0, with_offset=False):
+    """
+    Parcourt un jeu de grilles en flux, un enregistrement à la fois (mémoire constante).
+    Formats : CSV, CSV compressé (.gz, .xz, .bz2) ou binaire .sdkb.
+    :param min_difficulty: ignore les grilles de score inférieur (None = pas de borne)
+    :param max_difficulty: ignore les grilles de score supérieur (None = pas de borne)
+    :param shard_index: numéro de la partition à lire (0 <= shard_index < shard_count)
+    :param shard_count: nombre de partitions ; la grille n° k appartient à la partition k % shard_count
+    :param start: numéro de la première grille à considérer (reprise d'un parcours interrompu)
+    :param with_offset: produit (numéro de la grille, enregistrement) ; reprendre avec start = numéro + 1
+    :return: générateur de PuzzleRecord(puzzle_id, puzzle, solution, difficulty)
+    """
+    if not 0 <= shard_index < shard_count:
+        raise ValueError("❌ Partition invalide (0 <= shard_index < shard_count).")
+    path = _resolve(filename, data_dir)
+
+    def keep(difficulty):
+        if min_difficulty is None and max_difficulty is None:
+            return True
+        if difficulty is None:
+            return False
+        return ((min_difficulty is None or difficulty >= min_difficulty)
+                and (max_difficulty is None or difficulty <= max_difficulty))
+
+    if is_packed(path):
+        with PackedDataset(path) as dataset:
+            # Accès direct : on saute aux seules positions de la partition
+            first = start + (shard_index - start) % shard_count
+            for offset in range(first, len(dataset), shard_count):
+                record = dataset[offset]
+                if keep(record.difficulty):
+                    record = record._replace(puzzle_id=str(record.puzzle_id))
+                    yield (offset, record) if with_offset else record
+        return
+
+    with _open_text(path) as csvfile:
+        reader = csv.reader(csvfile)
+        header = next(reader, None)
+        if header is None:
+            return
+        columns = {name: i for i, name in enumerate(header)}
+        try:
+            i_id, i_puzzle = columns['puzzle_id'], columns['puzzle']
+        except KeyError:
+            raise ValueError("❌ Colonnes puzzle_id et puzzle requises.")
+        i_solution, i_difficulty = columns.get('solution'), columns.get('difficulty')
+
+        for offset, row in enumerate(islice(reader, start, None), start):
+            if offset % shard_count != shard_index or not row:
+                continue
+            difficulty = _parse_difficulty(row[i_difficulty]) if i_difficulty is not None else None
+            if not keep(difficulty):
+                continue
+            puzzle = row[i_puzzle]
+            if len(puzzle) != 81 or not puzzle.isdigit():
+                raise ValueError(f"❌ Format de grille invalide (grille {row[i_id]}).")
+            solution = row[i_solution] if i_solution is not None else None
+            record = PuzzleRecord(row[i_id], puzzle, solution or None, difficulty)
+            yield (offset, record) if with_offset else record
+
+def load_grid_by_id(filename, puzzle_id, data_dir=DATA_DIR):
+    """
+    Charge la grille d'identifiant donné (O(1) pour un .sdkb, lecture du CSV sinon).
+    :return: grille sous forme 9x9 (List[List[int]])
+    """
+    path = _resolve(filename, data_dir)
+    if is_packed(path):
+        with PackedDataset(path) as dataset:
+            return parse_grid(dataset.get_by_id(int(puzzle_id)).puzzle)
+    for record in iter_puzzles(path):
+        if record.puzzle_id == str(puzzle_id):
+            return parse_grid(record.puzzle)
+    raise KeyError(puzzle_id)
+
+def load_all_grids(filename, data_dir=DATA_DIR, sample=None, seed=None):
+    """
+    Charge toutes les grilles d'un fichier CSV (ou un échantillon reproductible).
+    :param filename: nom du fichier (ex: 'expert.csv' ou 'expert.sdkb')
+    :param data_dir: dossier data/
+    :param sample: nombre de grilles à tirer au hasard (None = toutes)
+    :param seed: graine du tirage (même graine = même échantillon)
+    :return: liste de (puzzle_id, grille 9x9)
+    """
+    path = _resolve(filename, data_dir)
+
+    if is_packed(path):
+        with PackedDataset(path) as dataset:
+            positions = range(len(dataset))
+            if sample is not None and sample < len(dataset):
+                positions = random.Random(seed).sample(positions, sample)
+            records = [dataset[i] for i in positions]
+        return [(str(r.puzzle_id), parse_grid(r.puzzle)) for r in records]
+
+    rows = list(iter_puzzles(path))
+    if not rows:
+        raise ValueError("❌ Fichier vide ou format invalide.")
+
+    if sample is not None and sample < len(rows):
+        rows = random.Random(seed).sample(rows, sample)
+    return [(row.puzzle_id, parse_grid(row.puzzle)) for row in rows]
+
+def load_grid_from_dataset(filename, data_dir=DATA_DIR):
+    """
+    Charge une grille aléatoire depuis un fichier CSV formaté avec les colonnes : puzzle_id, puzzle, solution, difficulty,
+    ou depuis un fichier binaire .sdkb (tirage O(1), sans lire tout le fichier).
+    :param filename: nom du fichier (ex: 'expert.csv')
+    :param data_dir: dossier data/
+    :return: grille sous forme 9x9 (List[List[int]])
+    """
+    path = _resolve(filename, data_dir)
 
-    with open(path, newline='', encoding='utf-8') as csvfile:
-        reader = list(csv.DictReader(csvfile))
-        if not reader:
-            raise ValueError("❌ Fichier vide ou format invalide.")
+    if is_packed(path):
+        with PackedDataset(path) as dataset:
+            if not len(dataset):
+                raise ValueError("❌ Fichier vide ou format invalide.")
+            return parse_grid(dataset[random.randrange(len(dataset))].puzzle)
 
-        # Choisir une ligne aléatoire
-        row = random.choice(reader)
-        puzzle_str = row['puzzle']
+    reader = list(iter_puzzles(path))
+    if not reader:
+        raise ValueError("❌ Fichier vide ou format invalide.")
 
-        if len(puzzle_str) != 81 or not puzzle_str.isdigit():
-            raise ValueError("❌ Format de grille invalide (81 chiffres requis).")
+    # Choisir une ligne aléatoire
+    row = random.choice(reader)
 
-        # Convertir en matrice 9x9
-        grid = [[int(puzzle_str[i * 9 + j]) for j in range(9)] for i in range(9)]
-        return grid
+    # Convertir en matrice 9x9
+    return parse_grid(row.puzzle)
 
 # Fonction interactive (facultative)
 def choose_grid(data_dir=DATA_DIR):
@@ -0,0 +1,84 @@
+import threading
+import time
+import tracemalloc
+from typing import Callable, Dict, Optional, Tuple
+
+from src.core.budget import current_rss_bytes
+
+# ==== Mesures autour d'un appel de solveur ====
+#
+#   temps_ns             : durée réelle (perf_counter_ns)
+#   temps_cpu            : temps CPU du processus (process_time, secondes)
+#   memoire_pic_octets   : pic des allocations Python suivies par tracemalloc pendant l'appel
+#                          (None si désactivé ; ralentit le code mesuré d'un facteur 2 à 8 : les temps
+#                          d'un appel tracé ne sont pas représentatifs, voir benchmark.traced_peak)
+#   rss_pic_delta_octets : pic de mémoire résidente pendant l'appel moins sa valeur au départ,
+#                          échantillonné par un thread (tient compte de tout : objets C, fragmentation)
+# Les solveurs qui travaillent dans d'autres processus (restarts parallèles) n'y sont pas comptés.
+
+
+class _RssSampler(threading.Thread):
+    """Relève la mémoire résidente toutes les 'interval' secondes et garde le maximum."""
+
+    def __init__(self, interval: float):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak = current_rss_bytes()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self._sample()
+
+    def _sample(self):
+        rss = current_rss_bytes()
+        if rss is not None and (self.peak is None or rss > self.peak):
+            self.peak = rss
+
+    def stop(self) -> Optional[int]:
+        self._stop_event.set()
+        self.join()
+        self._sample()
+        return self.peak
+
+
+def measure_call(fn: Callable, *args, trace_memory: bool = False, rss_interval: float = 0.01,
+                 **kwargs) -> Tuple[object, Dict]:
+    """
+    Exécute fn(*args, **kwargs) et retourne (résultat, mesures).
+    :param trace_memory: active tracemalloc (pic d'allocations en octets)
+    :param rss_interval: période d'échantillonnage de la mémoire résidente (secondes)
+    """
+    started_tracing = False
+    traced_base = None
+    if trace_memory:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            started_tracing = True
+        elif hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        if started_tracing or hasattr(tracemalloc, "reset_peak"):
+            traced_base = tracemalloc.get_traced_memory()[0]
+
+    rss_start = current_rss_bytes()
+    sampler = _RssSampler(rss_interval)
+    sampler.start()
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter_ns()
+    try:
+        result = fn(*args, **kwargs)
+    finally:
+        wall = time.perf_counter_ns() - wall_start
+        cpu = time.process_time() - cpu_start
+        rss_peak = sampler.stop()
+        traced_peak = tracemalloc.get_traced_memory()[1] if traced_base is not None else None
+        if started_tracing:
+            tracemalloc.stop()
+
+    measures = {
+        "temps_ns": wall,
+        "temps_cpu": round(cpu, 4),
+        "memoire_pic_octets": max(0, traced_peak - traced_base) if traced_peak is not None else None,
+        "rss_pic_delta_octets": max(0, rss_peak - rss_start) if rss_start is not None and rss_peak is not None else None,
+    }
+    return result, measures
@@ -0,0 +1,209 @@
+import argparse
+import csv
+import math
+import mmap
+import struct
+from collections import namedtuple
+from pathlib import Path
+
+# ==== Format binaire compact des jeux de grilles (.sdkb) ====
+#
+# [en-tête 64 o][enregistrements de taille fixe][table d'index par identifiant]
+#
+# En-tête (little-endian) : magic, version, drapeaux, nombre de grilles,
+#   taille d'un enregistrement, position des enregistrements, position et taille de l'index.
+# Enregistrement : identifiant (u64), difficulté (f32), grille, solution (optionnelle).
+#   Grille / solution : 81 octets ASCII ('0' = vide) ou 41 octets (deux chiffres par octet).
+#   Valeurs absentes du CSV : difficulté NaN, solution entièrement vide (une vraie solution n'a
+#   aucune case vide) ; relues comme None.
+# Index : table de hachage à adressage ouvert (id u64, numéro d'enregistrement + 1 u64),
+#   taille puissance de 2, sondage linéaire -> accès par identifiant en O(1) sans tout charger.
+
+MAGIC = b"SDKB"
+VERSION = 1
+FLAG_NIBBLE = 1
+FLAG_SOLUTION = 2
+
+HEADER = struct.Struct("<4sHHQIQQQ20x")
+RECORD_PREFIX = struct.Struct("<Qf")
+INDEX_SLOT = struct.Struct("<QQ")
+
+RAW_SIZE = 81
+NIBBLE_SIZE = 41
+NO_SOLUTION = "0" * 81
+
+PuzzleRecord = namedtuple("PuzzleRecord", ["puzzle_id", "puzzle", "solution", "difficulty"])
+
+
+def pack_nibbles(puzzle: str) -> bytes:
+    """'81 chiffres' -> 41 octets (un chiffre par quartet, le premier dans le quartet haut)."""
+    # Les chiffres 0-9 sont aussi des chiffres hexadécimaux : la conversion fait le tassage
+    return int(puzzle + "0", 16).to_bytes(NIBBLE_SIZE, "big")
+
+
+def unpack_nibbles(data) -> str:
+    return bytes(data).hex()[:81]
+
+
+def _slot_hash(puzzle_id: int, mask: int) -> int:
+    # Hachage multiplicatif (Fibonacci) sur 64 bits
+    return ((puzzle_id * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> 32 & mask
+
+
+def convert_csv(csv_path, out_path, nibble: bool = True, with_solutions: bool = True) -> int:
+    """
+    Convertit un CSV (puzzle_id, puzzle, solution, difficulty) en fichier .sdkb.
+    Les grilles sont écrites au fil de la lecture ; seuls les identifiants restent en mémoire.
+    :return: nombre de grilles écrites
+    """
+    grid_size = NIBBLE_SIZE if nibble else RAW_SIZE
+    encode = pack_nibbles if nibble else (lambda s: s.encode("ascii"))
+    record_size = RECORD_PREFIX.size + grid_size * (2 if with_solutions else 1)
+    flags = (FLAG_NIBBLE if nibble else 0) | (FLAG_SOLUTION if with_solutions else 0)
+
+    ids = []
+    with open(csv_path, newline="", encoding="utf-8") as src, open(out_path, "wb") as out:
+        out.write(b"\0" * HEADER.size)
+        for row in csv.DictReader(src):
+            puzzle = row["puzzle"]
+            if len(puzzle) != 81 or not puzzle.isdigit():
+                raise ValueError(f"❌ Format de grille invalide (grille {row['puzzle_id']}).")
+            puzzle_id = int(row["puzzle_id"])
+            out.write(RECORD_PREFIX.pack(puzzle_id, float(row.get("difficulty") or math.nan)))
+            out.write(encode(puzzle))
+            if with_solutions:
+                solution = row.get("solution") or NO_SOLUTION
+                # Une solution tronquée décalerait tous les enregistrements suivants (et l'index)
+                if len(solution) != 81 or not solution.isdigit():
+                    raise ValueError(f"❌ Format de solution invalide (grille {row['puzzle_id']}).")
+                out.write(encode(solution))
+            ids.append(puzzle_id)
+
+        # Table d'index : au moins deux fois plus de cases que de grilles
+        slots = 1
+        while slots < 2 * max(1, len(ids)):
+            slots <<= 1
+        mask = slots - 1
+        table = [None] * slots
+        for index, puzzle_id in enumerate(ids):
+            slot = _slot_hash(puzzle_id, mask)
+            while table[slot] is not None:
+                if table[slot][0] == puzzle_id:
+                    raise ValueError(f"❌ Identifiant en double : {puzzle_id}")
+                slot = (slot + 1) & mask
+            table[slot] = (puzzle_id, index + 1)
+
+        index_offset = HEADER.size + record_size * len(ids)
+        out.write(b"".join(INDEX_SLOT.pack(*entry) if entry else INDEX_SLOT.pack(0, 0) for entry in table))
+
+        out.seek(0)
+        out.write(HEADER.pack(MAGIC, VERSION, flags, len(ids), record_size,
+                              HEADER.size, index_offset, slots))
+    return len(ids)
+
+
+class PackedDataset:
+    """
+    Lecture d'un fichier .sdkb via mmap : accès O(1) par position ou par identifiant,
+    et itération en flux sans charger le fichier.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"❌ Fichier vide : {self.path}")
+
+        (magic, version, flags, self.count, self.record_size,
+         self.records_offset, self.index_offset, self.index_slots) = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"❌ Format .sdkb invalide : {self.path}")
+        self.nibble = bool(flags & FLAG_NIBBLE)
+        self.has_solutions = bool(flags & FLAG_SOLUTION)
+        self._grid_size = NIBBLE_SIZE if self.nibble else RAW_SIZE
+
+    def __len__(self):
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if getattr(self, "_mm", None) is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    def _decode(self, data) -> str:
+        return unpack_nibbles(data) if self.nibble else data.decode("ascii")
+
+    def _read(self, index: int) -> PuzzleRecord:
+        mm = self._mm
+        offset = self.records_offset + index * self.record_size
+        puzzle_id, difficulty = RECORD_PREFIX.unpack_from(mm, offset)
+        start = offset + RECORD_PREFIX.size
+        size = self._grid_size
+        puzzle = self._decode(mm[start:start + size])
+        solution = self._decode(mm[start + size:start + 2 * size]) if self.has_solutions else None
+        if solution == NO_SOLUTION:
+            solution = None
+        difficulty = None if math.isnan(difficulty) else round(difficulty, 6)
+        return PuzzleRecord(puzzle_id, puzzle, solution, difficulty)
+
+    def __getitem__(self, index: int) -> PuzzleRecord:
+        """Grille à la position 'index' (O(1))."""
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        return self._read(index)
+
+    def position_of(self, puzzle_id: int):
+        """Position de la grille d'identifiant 'puzzle_id' (None si absente), via la table d'index."""
+        mm = self._mm
+        mask = self.index_slots - 1
+        slot = _slot_hash(puzzle_id, mask)
+        for _ in range(self.index_slots):
+            key, position = INDEX_SLOT.unpack_from(mm, self.index_offset + slot * INDEX_SLOT.size)
+            if position == 0:
+                return None
+            if key == puzzle_id:
+                return position - 1
+            slot = (slot + 1) & mask
+        return None
+
+    def get_by_id(self, puzzle_id: int) -> PuzzleRecord:
+        """Grille d'identifiant 'puzzle_id' (O(1)) ; KeyError si absente."""
+        position = self.position_of(int(puzzle_id))
+        if position is None:
+            raise KeyError(puzzle_id)
+        return self._read(position)
+
+    def __iter__(self):
+        """Itère sur les grilles dans l'ordre du fichier."""
+        return self.iter_records()
+
+    def iter_records(self, start: int = 0, stop=None, step: int = 1):
+        stop = self.count if stop is None else min(stop, self.count)
+        for index in range(start, stop, step):
+            yield self._read(index)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convertit un CSV de grilles en fichier binaire .sdkb")
+    parser.add_argument("csv", help="Fichier CSV source (puzzle_id, puzzle, solution, difficulty)")
+    parser.add_argument("output", nargs="?", help="Fichier .sdkb de sortie (défaut : même nom)")
+    parser.add_argument("--raw", action="store_true", help="81 octets par grille au lieu de 41")
+    parser.add_argument("--no-solutions", action="store_true", help="N'écrit pas les solutions")
+    args = parser.parse_args()
+
+    output = args.output or str(Path(args.csv).with_suffix(".sdkb"))
+    n = convert_csv(args.csv, output, nibble=not args.raw, with_solutions=not args.no_solutions)
+    print(f"✅ {n} grilles écrites dans : {output}")
@@ -0,0 +1,288 @@
+import hashlib
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import time
+from pathlib import Path
+
+from src.algorithms import ALGORITHMS
+from src.core.grid import SudokuGrid
+from src.utils.benchmark import DATA_DIR, PROJECT_ROOT, RESULTS_DIR, run_algorithm, task_seed
+from src.utils.loader import load_all_grids
+
+# ==== Suite de performance : jeu de grilles fixe, échauffement, répétitions, comparaison à une référence ====
+#
+# Pour chaque niveau, les mêmes grilles (tirage à graine fixe dans data/<niveau>.csv).
+# Chaque algorithme est d'abord exécuté 'warmup' fois (mesures ignorées), puis 'repetitions' fois
+# par grille, dans ce processus, sans tracemalloc ni compteurs (temps non perturbés).
+# Le rapport garde les temps de chaque répétition, grille par grille ; un algorithme est résumé par
+# la médiane sur les grilles des médianes par grille.
+# Les solveurs stochastiques reçoivent la même graine à chaque répétition : seules les
+# variations de temps dues à la machine restent.
+#
+# Comparaison à la référence, grille par grille (les grilles diffèrent trop entre elles pour comparer
+# des médianes globales) : rapport actuel / référence des temps médians d'une même grille, et son
+# intervalle tiré des répétitions (intervalles de confiance des deux médianes, sans hypothèse de loi).
+# Régression (par niveau et par algorithme, au-delà de 'threshold') :
+#   - temps : borne basse du rapport au-delà de 1 + threshold sur la majorité des grilles
+#     (médiane des bornes basses) : la hausse dépasse le bruit d'une exécution à l'autre ;
+#   - itérations médianes : hausse relative ;
+#   - taux de succès : baisse.
+
+SUITE_SIZE = 5
+SUITE_SEED = 2024
+LEVELS = ["Easy", "Medium", "Hard", "Expert"]
+BASELINE_PATH = PROJECT_ROOT / "benchmarks" / "baseline.json"
+REPORT_PATH = RESULTS_DIR / "benchmark.json"
+DEFAULT_THRESHOLD = 0.10
+DEFAULT_SUITE_LIMITS = {"max_time": 10.0}
+
+
+def suite_puzzles(level: str, size: int = SUITE_SIZE, seed: int = SUITE_SEED):
+    """Jeu de grilles fixe d'un niveau : [(puzzle_id, grille 9x9)]."""
+    path = DATA_DIR / f"{level.lower()}.csv"
+    if not path.exists():
+        raise FileNotFoundError(f"❌ Fichier introuvable : {path}")
+    return load_all_grids(path, sample=size, seed=seed)
+
+
+def fingerprint(puzzles) -> str:
+    """Empreinte du jeu de grilles (une référence n'est comparable qu'au même jeu)."""
+    digest = hashlib.sha256()
+    for puzzle_id, grid in puzzles:
+        digest.update(f"{puzzle_id}:{''.join(str(v) for row in grid for v in row)};".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def median_ci(values, confidence: float = 0.95):
+    """
+    Intervalle de confiance de la médiane par statistiques d'ordre : [x(j), x(n+1-j)] (rangs 1..n)
+    avec j le plus grand rang tel que P(B <= j-1) <= (1 - confidence) / 2, B ~ Binomiale(n, 1/2).
+    Sans hypothèse sur la loi des mesures ; avec peu de valeurs (n <= 5 à 95 %), il va du minimum
+    au maximum.
+    """
+    ordered = sorted(values)
+    n = len(ordered)
+    if n == 0:
+        return None, None
+    cdf, total = [], 0.0
+    for i in range(n + 1):
+        total += math.comb(n, i) / 2 ** n
+        cdf.append(total)
+    alpha = 1 - confidence
+    j = 1
+    while j < n // 2 and cdf[j] <= alpha / 2:
+        j += 1
+    return ordered[j - 1], ordered[n - j]
+
+
+def _summary(per_puzzle, successes, timeouts, samples):
+    """:param per_puzzle: {puzzle_id: {"temps_ns": [une mesure par répétition], "iterations": médiane}}"""
+    times = [statistics.median(p["temps_ns"]) for p in per_puzzle.values()]
+    iterations = [p["iterations"] for p in per_puzzle.values() if p["iterations"] is not None]
+    # Bruit d'une exécution à l'autre : demi-largeur relative de l'IC de la médiane, médiane sur les grilles
+    noise = []
+    for p in per_puzzle.values():
+        low, high = median_ci(p["temps_ns"])
+        noise.append((high - low) / (2 * statistics.median(p["temps_ns"])))
+    return {
+        "temps_median_ns": int(statistics.median(times)) if times else None,
+        "bruit_relatif": round(statistics.median(noise), 4) if noise else None,
+        "iterations_mediane": statistics.median(iterations) if iterations else None,
+        "taux_succes": round(successes / samples, 4) if samples else 0.0,
+        "nb_mesures": samples,
+        "nb_timeouts": timeouts,
+        "grilles": per_puzzle,
+    }
+
+
+def run_algorithm_suite(name: str, puzzles, repetitions: int, warmup: int, limits, seed: int) -> dict:
+    """Échauffement puis répétitions d'un algorithme sur les grilles d'un niveau."""
+    solver = ALGORITHMS[name]
+    for _ in range(warmup):
+        puzzle_id, grid = puzzles[0]
+        random.seed(task_seed(seed, puzzle_id, name))
+        run_algorithm(name, solver, SudokuGrid(grid), limits, trace_memory=False, count_events=False)
+
+    per_puzzle = {}
+    successes = timeouts = samples = 0
+    for puzzle_id, grid in puzzles:
+        runs = []
+        for _ in range(repetitions):
+            random.seed(task_seed(seed, puzzle_id, name))
+            res = run_algorithm(name, solver, SudokuGrid(grid), limits, trace_memory=False, count_events=False)
+            runs.append(res)
+            samples += 1
+            successes += bool(res.get("taux_succes"))
+            timeouts += bool(res.get("timeout"))
+        counts = [r["iterations"] for r in runs if "iterations" in r]
+        per_puzzle[str(puzzle_id)] = {
+            "temps_ns": [r["temps_ns"] for r in runs],
+            "iterations": statistics.median(counts) if counts else None,
+        }
+    return _summary(per_puzzle, successes, timeouts, samples)
+
+
+def environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "plateforme": platform.platform(),
+        "processeur": platform.processor() or platform.machine(),
+        "nb_coeurs": os.cpu_count(),
+    }
+
+
+def run_suite(levels=None, algorithms=None, size: int = SUITE_SIZE, repetitions: int = 5, warmup: int = 1,
+              limits=None, seed: int = 0, on_progress=None) -> dict:
+    """
+    Exécute la suite et retourne le rapport :
+    {"meta": {...}, "niveaux": {niveau: {"grilles", "empreinte", "algorithmes": {nom: statistiques}}}}
+    :param limits: budget de chaque exécution (défaut : DEFAULT_SUITE_LIMITS)
+    :param on_progress: appelé avec (niveau, algorithme, statistiques) après chaque algorithme
+    """
+    levels = list(levels or LEVELS)
+    names = list(algorithms) if algorithms is not None else list(ALGORITHMS)
+    unknown = [name for name in names if name not in ALGORITHMS]
+    if unknown:
+        raise ValueError(f"❌ Algorithme(s) inconnu(s) : {', '.join(unknown)}")
+    if repetitions < 1:
+        raise ValueError("❌ Il faut au moins une répétition.")
+    limits = DEFAULT_SUITE_LIMITS if limits is None else limits
+
+    report = {
+        "meta": {
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "environnement": environment(),
+            "repetitions": repetitions,
+            "echauffement": warmup,
+            "taille": size,
+            "graine": seed,
+            "limites": limits,
+        },
+        "niveaux": {},
+    }
+    for level in levels:
+        puzzles = suite_puzzles(level, size)
+        entry = {"grilles": [p[0] for p in puzzles], "empreinte": fingerprint(puzzles), "algorithmes": {}}
+        report["niveaux"][level] = entry
+        for name in names:
+            stats = run_algorithm_suite(name, puzzles, repetitions, warmup, limits, seed)
+            entry["algorithmes"][name] = stats
+            if on_progress is not None:
+                on_progress(level, name, stats)
+    return report
+
+
+def save_report(report: dict, path) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    return path
+
+
+def load_report(path) -> dict:
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"❌ Référence introuvable : {path}")
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _relative(current, reference):
+    if reference in (None, 0) or current is None:
+        return None
+    return current / reference - 1
+
+
+def time_ratio(stats: dict, base: dict):
+    """
+    Rapport des temps actuel / référence sur les grilles communes.
+    Par grille : rapport des médianes et intervalle [bas(actuel) / haut(référence), haut(actuel) / bas(référence)]
+    à partir des IC des médianes sur les répétitions.
+    :return: (médiane des rapports, médiane des bornes basses, médiane des bornes hautes), None sans grille commune
+    """
+    ratios, lows, highs = [], [], []
+    for puzzle_id, current in stats["grilles"].items():
+        reference = base["grilles"].get(puzzle_id)
+        if reference is None:
+            continue
+        cur_low, cur_high = median_ci(current["temps_ns"])
+        ref_low, ref_high = median_ci(reference["temps_ns"])
+        ratios.append(statistics.median(current["temps_ns"]) / statistics.median(reference["temps_ns"]))
+        lows.append(cur_low / ref_high)
+        highs.append(cur_high / ref_low)
+    if not ratios:
+        return None
+    return statistics.median(ratios), statistics.median(lows), statistics.median(highs)
+
+
+def compare(report: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD):
+    """
+    Compare un rapport à une référence.
+    :return: (régressions, non comparables, avertissements) ; une régression = dict niveau, algorithme,
+             mesure, reference, actuel, variation (et variation_ic pour le temps) ; non comparables =
+             messages pour les niveaux / algorithmes mesurés sans référence utilisable (rien n'a été vérifié)
+    """
+    regressions, missing, warnings = [], [], []
+    for level, entry in report["niveaux"].items():
+        base_entry = baseline.get("niveaux", {}).get(level)
+        if base_entry is None:
+            missing.append(f"{level} : absent de la référence")
+            continue
+        if base_entry.get("empreinte") != entry["empreinte"]:
+            missing.append(f"{level} : jeu de grilles différent de la référence")
+            continue
+        for name, stats in entry["algorithmes"].items():
+            base = base_entry["algorithmes"].get(name)
+            if base is None:
+                missing.append(f"{level} / {name} : absent de la référence")
+                continue
+
+            if "grilles" not in base:
+                missing.append(f"{level} / {name} : référence sans mesures par grille (ancien format), "
+                               f"temps non comparés")
+            else:
+                ratio = time_ratio(stats, base)
+                if ratio is not None and ratio[1] > 1 + threshold:
+                    median, low, high = ratio
+                    regressions.append({"niveau": level, "algorithme": name, "mesure": "temps_median_ns",
+                                        "reference": base["temps_median_ns"], "actuel": stats["temps_median_ns"],
+                                        "variation": round(median - 1, 4),
+                                        "variation_ic": [round(low - 1, 4), round(high - 1, 4)]})
+
+            change = _relative(stats["iterations_mediane"], base["iterations_mediane"])
+            if change is not None and change > threshold:
+                regressions.append({"niveau": level, "algorithme": name, "mesure": "iterations_mediane",
+                                    "reference": base["iterations_mediane"], "actuel": stats["iterations_mediane"],
+                                    "variation": round(change, 4)})
+
+            if stats["taux_succes"] < base["taux_succes"]:
+                regressions.append({"niveau": level, "algorithme": name, "mesure": "taux_succes",
+                                    "reference": base["taux_succes"], "actuel": stats["taux_succes"],
+                                    "variation": round(stats["taux_succes"] - base["taux_succes"], 4)})
+
+    if baseline.get("meta", {}).get("environnement") != report["meta"]["environnement"]:
+        warnings.append("environnement différent de celui de la référence : temps peu comparables")
+    return regressions, missing, warnings
+
+
+def format_diff(regressions) -> str:
+    """Tableau texte des régressions."""
+    lines = [f"{'niveau':8} {'algorithme':34} {'mesure':20} {'référence':>14} {'actuel':>14} {'variation':>10}"]
+    for r in regressions:
+        if r["mesure"] == "taux_succes":
+            variation = f"{r['variation'] * 100:+.0f} pts"
+        else:
+            variation = f"{r['variation'] * 100:+.1f} %"
+        line = (f"{r['niveau']:8} {r['algorithme']:34} {r['mesure']:20} "
+                f"{r['reference']:>14} {r['actuel']:>14} {variation:>10}")
+        if "variation_ic" in r:
+            low, high = r["variation_ic"]
+            line += f"  (IC [{low * 100:+.1f} % ; {high * 100:+.1f} %])"
+        lines.append(line)
+    return "\n".join(lines)
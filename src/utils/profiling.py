@@ -0,0 +1,133 @@
+import cProfile
+import os
+import pstats
+import re
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+# ==== Profilage des solveurs (cProfile) ====
+#
+# Pour chaque algorithme profilé, deux fichiers :
+#   <algo>.pstats : statistiques brutes (python -m pstats, snakeviz...)
+#   <algo>.folded : piles « repliées » (une ligne 'f1;f2;f3 microsecondes'), lisibles par
+#                   flamegraph.pl, speedscope ou inferno pour tracer un flamegraph
+# cProfile ne garde que les arcs appelant -> appelé : les piles sont reconstruites en répartissant le
+# temps cumulé de chaque fonction entre ses appelés au prorata des arcs. Les appels récursifs sont
+# repliés sur le premier niveau (le temps propre de toutes les profondeurs y est compté).
+# Le profilage ralentit le solveur (souvent x2) : les temps mesurés ne sont alors pas comparables.
+# Le travail fait dans d'autres processus (restarts parallèles) n'est pas profilé.
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_TOP = 15
+# Branches de moins d'une microseconde ignorées dans les piles repliées
+_MIN_US = 1
+
+
+def profile_call(fn: Callable, *args, **kwargs) -> Tuple[object, cProfile.Profile]:
+    """Exécute fn(*args, **kwargs) sous cProfile et retourne (résultat, profil)."""
+    profiler = cProfile.Profile()
+    result = profiler.runcall(fn, *args, **kwargs)
+    return result, profiler
+
+
+def slug(name: str) -> str:
+    """Nom d'algorithme -> nom de fichier ('A* + Backtracking' -> 'a_star_backtracking')."""
+    name = name.lower().replace("*", "_star")
+    return re.sub(r"[^a-z0-9]+", "_", name).strip("_")
+
+
+def _short_path(filename: str) -> str:
+    """Chemin relatif au projet pour ses fichiers, nom de fichier seul ailleurs (bibliothèque standard...)."""
+    if filename == "~":
+        return ""
+    try:
+        return Path(filename).resolve().relative_to(PROJECT_ROOT).as_posix()
+    except ValueError:
+        return os.path.basename(filename)
+
+
+def _is_profiler(func) -> bool:
+    """Entrée propre à cProfile (Profile.disable) : ni dans les piles ni dans le classement."""
+    return "_lsprof.Profiler" in func[2]
+
+
+def _label(func) -> str:
+    filename, line, name = func
+    if filename == "~":
+        return name
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+def collapsed_stacks(stats: pstats.Stats) -> Dict[str, int]:
+    """Piles repliées {'f1;f2;f3': microsecondes de temps propre} reconstruites depuis le graphe d'appels."""
+    raw = stats.stats
+    callees = {}
+    for func, (_, _, _, _, callers) in raw.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, []).append((func, edge[3]))
+    roots = [func for func, entry in raw.items() if not entry[4] and not _is_profiler(func)]
+
+    stacks = {}
+    # Pile explicite : (fonction, chemin, temps attribué à ce chemin en secondes)
+    pending = [(func, (), raw[func][3]) for func in roots]
+    while pending:
+        func, path, share = pending.pop()
+        path = path + (func,)
+        _, _, tottime, cumtime, _ = raw[func]
+        if cumtime <= 0:
+            continue
+        ratio = share / cumtime
+        own = tottime * ratio
+        for callee, edge_time in callees.get(func, ()):
+            if callee in path:
+                continue
+            child = edge_time * ratio
+            if child * 1e6 >= _MIN_US:
+                pending.append((callee, path, child))
+        micros = int(own * 1e6)
+        if micros >= _MIN_US:
+            key = ";".join(_label(f) for f in path)
+            stacks[key] = stacks.get(key, 0) + micros
+    return stacks
+
+
+def top_functions(stats: pstats.Stats, n: int = DEFAULT_TOP) -> List[dict]:
+    """Les n fonctions au plus fort temps propre."""
+    rows = []
+    for func, (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+        if _is_profiler(func):
+            continue
+        filename, line, name = func
+        rows.append({
+            "fonction": name,
+            "fichier": _short_path(filename),
+            "ligne": line,
+            "appels": ncalls,
+            "temps_propre": round(tottime, 6),
+            "temps_cumule": round(cumtime, 6),
+        })
+    rows.sort(key=lambda r: r["temps_propre"], reverse=True)
+    return rows[:n]
+
+
+def write_profile(profiler: cProfile.Profile, out_dir, name: str, top: int = DEFAULT_TOP) -> dict:
+    """
+    Écrit <out_dir>/<slug>.pstats et <slug>.folded pour un algorithme.
+    :return: {"pstats", "piles", "temps_total", "top"} (chemins relatifs à out_dir.parent,
+             temps profilé total en secondes, fonctions les plus coûteuses)
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    base = out_dir / slug(name)
+    stats = pstats.Stats(profiler)
+    stats.dump_stats(str(base.with_suffix(".pstats")))
+    with open(base.with_suffix(".folded"), "w", encoding="utf-8") as f:
+        for stack, micros in sorted(collapsed_stacks(stats).items()):
+            f.write(f"{stack} {micros}\n")
+    root = out_dir.parent
+    return {
+        "pstats": base.with_suffix(".pstats").relative_to(root).as_posix(),
+        "piles": base.with_suffix(".folded").relative_to(root).as_posix(),
+        "temps_total": round(stats.total_tt, 6),
+        "top": top_functions(stats, top),
+    }
@@ -0,0 +1,193 @@
+import ast
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+# ==== Cache persistant des résultats des solveurs (SQLite) ====
+#
+# Clé = empreinte de (algorithme, version du code, grille, budget, graine).
+# - version : hash du code source du module du solveur et de tous les modules src.* qu'il importe
+#   (récursivement) ; modifier un solveur ou une structure partagée invalide ses entrées.
+# - graine : None pour un solveur déterministe ; un solveur stochastique n'est mis en cache que
+#   pour une graine donnée (mode batch), sinon il est relancé à chaque demande.
+# Les résultats arrêtés par le budget ne sont pas conservés (ils dépendent de la machine).
+# Taille bornée : au-delà de 'max_bytes', les entrées les moins récemment lues sont supprimées.
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+CACHE_PATH = PROJECT_ROOT / ".cache" / "results.sqlite"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    algorithm TEXT NOT NULL,
+    version TEXT NOT NULL,
+    result TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used);
+"""
+
+_versions = {}
+
+
+def _module_path(module: str):
+    base = PROJECT_ROOT.joinpath(*module.split("."))
+    for path in (base.with_suffix(".py"), base / "__init__.py"):
+        if path.exists():
+            return path
+    return None
+
+
+def _local_imports(module: str, path: Path):
+    """Modules src.* importés par un fichier (imports relatifs résolus)."""
+    package = module if path.name == "__init__.py" else module.rpartition(".")[0]
+    for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"))):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                parent = package.split(".")[:len(package.split(".")) - node.level + 1]
+                base = ".".join(parent + ([base] if base else []))
+            # 'from paquet import sous_module' : le sous-module est une dépendance
+            names = [base] + [f"{base}.{alias.name}" for alias in node.names]
+        else:
+            continue
+        for name in names:
+            if name.split(".")[0] == "src" and _module_path(name) is not None:
+                yield name
+
+
+def code_version(solver) -> str:
+    """Empreinte du code d'un solveur : son module et ses dépendances src.* (transitives)."""
+    root = solver.__module__
+    if root not in _versions:
+        digest = hashlib.sha256()
+        seen, pending = set(), [root]
+        while pending:
+            module = pending.pop()
+            if module in seen:
+                continue
+            seen.add(module)
+            path = _module_path(module)
+            if path is None:
+                continue
+            pending.extend(_local_imports(module, path))
+        for module in sorted(seen):
+            path = _module_path(module)
+            if path is not None:
+                digest.update(module.encode("utf-8") + b"\0" + path.read_bytes() + b"\0")
+        _versions[root] = digest.hexdigest()[:16]
+    return _versions[root]
+
+
+def puzzle_key(grid) -> str:
+    """Grille 9x9 (ou 81 valeurs) -> chaîne de 81 chiffres."""
+    cells = grid if len(grid) == 81 else [v for row in grid for v in row]
+    return "".join(str(v) for v in cells)
+
+
+class ResultCache:
+    """
+    Résultats de solveurs en SQLite, partagés entre exécutions et entre threads
+    (une connexion par opération, écritures sérialisées par un verrou).
+    """
+
+    def __init__(self, path=CACHE_PATH, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as db:
+            db.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        db = sqlite3.connect(str(self.path), timeout=30)
+        try:
+            db.execute("PRAGMA journal_mode=WAL")
+            yield db
+            db.commit()
+        finally:
+            db.close()
+
+    @staticmethod
+    def key(name: str, version: str, grid, limits=None, seed=None, mode=None) -> str:
+        """
+        :param mode: options de mesure ({"trace_memory": ..., "count_events": ...}) : un résultat mesuré
+                     autrement (champs présents, conditions de la mesure) n'est pas servi à la place
+        """
+        limits = {k: v for k, v in (limits or {}).items() if v is not None}
+        payload = json.dumps([name, version, puzzle_key(grid), limits, seed, mode or {}], sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, name: str, solver, grid, limits=None, seed=None, mode=None):
+        """Résultat enregistré (dict) ou None ; marque l'entrée comme récemment utilisée."""
+        key = self.key(name, code_version(solver), grid, limits, seed, mode)
+        with self._lock, self._connect() as db:
+            row = db.execute("SELECT result FROM results WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                db.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key))
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        result = json.loads(row[0])
+        result["depuis_cache"] = True
+        return result
+
+    def put(self, name: str, solver, grid, result: dict, limits=None, seed=None, mode=None) -> bool:
+        """Enregistre un résultat terminé ; retourne False s'il n'est pas conservable."""
+        if result.get("timeout") or result.get("erreur"):
+            return False
+        version = code_version(solver)
+        key = self.key(name, version, grid, limits, seed, mode)
+        data = json.dumps({k: v for k, v in result.items() if k != "depuis_cache"})
+        with self._lock, self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO results (key, algorithm, version, result, size, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, name, version, data, len(data), time.time()),
+            )
+            self._evict(db)
+        return True
+
+    def _evict(self, db):
+        """Supprime les entrées les moins récemment utilisées au-delà de max_bytes."""
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = []
+        for key, size in db.execute("SELECT key, size FROM results ORDER BY last_used"):
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        db.executemany("DELETE FROM results WHERE key = ?", evicted)
+
+    def invalidate_stale(self, algorithms) -> int:
+        """Supprime les entrées dont la version ne correspond plus au code actuel des solveurs."""
+        removed = 0
+        with self._lock, self._connect() as db:
+            for name, solver in algorithms.items():
+                cursor = db.execute("DELETE FROM results WHERE algorithm = ? AND version != ?",
+                                    (name, code_version(solver)))
+                removed += cursor.rowcount
+        return removed
+
+    def clear(self):
+        with self._lock, self._connect() as db:
+            db.execute("DELETE FROM results")
+
+    def stats(self) -> dict:
+        with self._connect() as db:
+            count, size = db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+        return {"entrees": count, "octets": size, "succes": self.hits, "echecs": self.misses}
@@ -29,7 +29,27 @@ const ChartRenderer = {
     memory: {
       backgroundColor: 'rgba(253, 121, 168, 0.2)',
       borderColor: 'rgba(253, 121, 168, 1)'
+    },
+    rss: {
+      backgroundColor: 'rgba(9, 132, 227, 0.2)',
+      borderColor: 'rgba(9, 132, 227, 1)'
+    }
+  },
+
+  /**
+   * Format a byte count (1.5 MB, 320 KB...)
+   * @param {number} bytes
+   */
+  formatBytes(bytes) {
+    if (bytes === null || bytes === undefined) return '-';
+    const units = ['B', 'KB', 'MB', 'GB'];
+    let value = bytes;
+    let unit = 0;
+    while (value >= 1024 && unit < units.length - 1) {
+      value /= 1024;
+      unit++;
     }
+    return `${value.toFixed(unit === 0 ? 0 : 1)} ${units[unit]}`;
   },
   
   // Chart configuration
@@ -307,21 +327,28 @@ const ChartRenderer = {
   renderMemoryChart(results) {
     const ctx = document.getElementById('memoryChart').getContext('2d');
     
-    // Get memory usage from different metrics
+    // Real bytes: peak traced allocations and peak RSS growth during the solver call
     const data = {
       labels: results.map(r => r.algorithme),
       datasets: [{
-        label: 'Memory Usage',
-        data: results.map(r => {
-          return r.memoire_max_file || r.memoire_max_beam || r.taille_max_domaine || 0;
-        }),
+        label: 'Peak allocations (tracemalloc)',
+        data: results.map(r => r.memoire_pic_octets ?? 0),
         backgroundColor: this.colors.memory.backgroundColor,
         borderColor: this.colors.memory.borderColor,
         borderWidth: 2,
         tension: 0.3,
         fill: true
+      }, {
+        label: 'Peak RSS increase',
+        data: results.map(r => r.rss_pic_delta_octets ?? 0),
+        backgroundColor: this.colors.rss.backgroundColor,
+        borderColor: this.colors.rss.borderColor,
+        borderWidth: 2,
+        tension: 0.3,
+        fill: true
       }]
     };
+    const formatBytes = this.formatBytes;
     
     // Destroy existing chart if it exists
     if (this.charts.memory) {
@@ -334,11 +361,27 @@ const ChartRenderer = {
       data: data,
       options: { 
         ...this.chartConfig,
+        scales: {
+          ...this.chartConfig.scales,
+          y: {
+            ...this.chartConfig.scales.y,
+            ticks: {
+              ...this.chartConfig.scales.y.ticks,
+              callback: value => formatBytes(value)
+            }
+          }
+        },
         plugins: {
           ...this.chartConfig.plugins,
+          tooltip: {
+            ...this.chartConfig.plugins.tooltip,
+            callbacks: {
+              label: context => `${context.dataset.label}: ${formatBytes(context.parsed.y)}`
+            }
+          },
           title: {
             display: true,
-            text: 'Memory Usage Comparison',
+            text: 'Memory Usage Comparison (bytes)',
             color: '#f5f6fa',
             font: {
               family: 'Poppins',
@@ -70,9 +70,17 @@ const ComparisonGenerator = {
         label: 'Temps (ms)',
         value: r => `${Math.round(r.temps * 1000)} ms`
       },
+      {
+        label: 'CPU (ms)',
+        value: r => r.temps_cpu !== undefined ? `${Math.round(r.temps_cpu * 1000)} ms` : '-'
+      },
       {
         label: 'Itérations',
         value: r => r.iterations ?? '-'
+      },
+      {
+        label: 'Mémoire (pic)',
+        value: r => ChartRenderer.formatBytes(r.memoire_pic_octets)
       }
     ];
 
@@ -86,10 +86,46 @@ function renderData(data) {
   GridRenderer.renderInitialGrid(data[0].grille_initiale);
   GridRenderer.createAlgorithmTabs(data);
   ComparisonGenerator.generateComparisonTable(data);
+  ProfileRenderer.renderProfiles(data);
   ChartRenderer.renderCharts(data);
   AnalysisGenerator.generateAnalysis(data);
 }
 
+/**
+ * Démarre une tâche de génération côté serveur et renvoie son identifiant.
+ * Le serveur répond immédiatement (202) ; la progression arrive ensuite par SSE.
+ */
+function startJob(difficulty) {
+  return fetch(`/run?difficulty=${difficulty}`)
+    .then(res => res.json().then(data => {
+      if (!res.ok || !data.success) throw new Error(data.error || 'Erreur serveur');
+      return data.job_id;
+    }));
+}
+
+/**
+ * Suit une tâche via le flux SSE /jobs/<id>/events.
+ * onProgress est appelé après chaque algorithme terminé.
+ */
+function followJob(jobId, onProgress) {
+  return new Promise((resolve, reject) => {
+    const source = new EventSource(`/jobs/${jobId}/events`);
+    source.addEventListener('progress', e => onProgress(JSON.parse(e.data)));
+    source.addEventListener('done', e => {
+      source.close();
+      resolve(JSON.parse(e.data));
+    });
+    source.addEventListener('failed', e => {
+      source.close();
+      reject(new Error(JSON.parse(e.data).erreur || 'Erreur inconnue.'));
+    });
+    source.onerror = () => {
+      source.close();
+      reject(new Error('Connexion au flux de progression perdue'));
+    };
+  });
+}
+
 /**
  * Lance la génération des résultats pour un niveau
  */
@@ -98,44 +134,54 @@ function runLevel(difficulty) {
   runBtn.disabled = true;
   runBtn.innerHTML = '<span class="button-icon">⏳</span> Running...';
 
-  fetch(`/run?difficulty=${difficulty}`)
-    .then(res => {
-      if (!res.ok) throw new Error('Erreur serveur');
-      return res.json();
-    })
-    .then(data => {
-      if (data.success) {
-        setTimeout(() => {
-          loadData();
-          runBtn.disabled = false;
-          runBtn.innerHTML = '<span class="button-icon">🔄</span> Run Level';
-        }, 1000);
-      } else {
-        showErrorState(data.error || "Erreur inconnue.");
-        runBtn.disabled = false;
-      }
+  const resetButton = () => {
+    runBtn.disabled = false;
+    runBtn.innerHTML = '<span class="button-icon">🔄</span> Run Level';
+  };
+
+  startJob(difficulty)
+    .then(jobId => followJob(jobId, event => {
+      runBtn.innerHTML = `<span class="button-icon">⏳</span> ${event.index}/${event.total} ${event.algorithme}`;
+    }))
+    .then(() => {
+      if (difficulty === currentDifficulty) loadData();
+      resetButton();
     })
     .catch(err => {
-      showErrorState("Erreur réseau : " + err.message);
-      runBtn.disabled = false;
-      runBtn.innerHTML = '<span class="button-icon">🔄</span> Run Level';
+      showErrorState("Erreur : " + err.message);
+      resetButton();
     });
 }
 
 /**
- * Simule un run pour tous les niveaux (extension future)
+ * Lance la génération des résultats pour tous les niveaux (une tâche par niveau, exécutées l'une après l'autre côté serveur)
  */
 function runAllLevels() {
   const runAllBtn = document.getElementById('run-all');
   runAllBtn.disabled = true;
   runAllBtn.innerHTML = '<span class="button-icon">⏳</span> Running All...';
 
-  // À compléter si tu veux exécuter tous les niveaux
-  setTimeout(() => {
-    loadData();
+  const levels = ['easy', 'medium', 'hard', 'expert'];
+  const progress = {};
+  const total = () => Object.values(progress).reduce((sum, p) => sum + p, 0);
+
+  const jobs = levels.map(level =>
+    startJob(level).then(jobId => followJob(jobId, event => {
+      progress[level] = event.index;
+      runAllBtn.innerHTML = `<span class="button-icon">⏳</span> ${total()}/${event.total * levels.length}`;
+    }))
+  );
+
+  Promise.allSettled(jobs).then(outcomes => {
+    const failed = outcomes.filter(o => o.status === 'rejected');
+    if (failed.length) {
+      showErrorState("Erreur : " + failed.map(o => o.reason.message).join(', '));
+    } else {
+      loadData();
+    }
     runAllBtn.disabled = false;
     runAllBtn.innerHTML = '<span class="button-icon">🚀</span> Run All';
-  }, 2000);
+  });
 }
 
 /**
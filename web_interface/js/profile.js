@@ -0,0 +1,67 @@
+const ProfileRenderer = {
+  /**
+   * Fonctions les plus coûteuses de chaque algorithme (résultats générés avec --profile)
+   */
+  renderProfiles(results) {
+    const section = document.getElementById('profile-section');
+    const container = document.getElementById('profile-container');
+    container.innerHTML = '';
+
+    const profiled = results.filter(r => r.profil && r.profil.top && r.profil.top.length);
+    section.style.display = profiled.length ? '' : 'none';
+
+    profiled.forEach(result => {
+      const block = document.createElement('div');
+      block.className = 'category-comparison';
+
+      const title = document.createElement('h3');
+      title.textContent = result.algorithme;
+      block.appendChild(title);
+
+      const files = document.createElement('p');
+      files.className = 'profile-files';
+      files.innerHTML = `<a href="./data/${result.profil.pstats}" download>.pstats</a> · ` +
+        `<a href="./data/${result.profil.piles}" download>piles repliées (flamegraph)</a>`;
+      block.appendChild(files);
+
+      const table = document.createElement('table');
+      table.className = 'comparison-table';
+      const columns = this.getColumns(result.profil.temps_total);
+
+      const headerRow = document.createElement('tr');
+      columns.forEach(c => {
+        const th = document.createElement('th');
+        th.textContent = c.label;
+        headerRow.appendChild(th);
+      });
+      const thead = document.createElement('thead');
+      thead.appendChild(headerRow);
+      table.appendChild(thead);
+
+      const tbody = document.createElement('tbody');
+      result.profil.top.forEach(entry => {
+        const row = document.createElement('tr');
+        columns.forEach(c => {
+          const td = document.createElement('td');
+          td.textContent = c.value(entry);
+          row.appendChild(td);
+        });
+        tbody.appendChild(row);
+      });
+      table.appendChild(tbody);
+      block.appendChild(table);
+      container.appendChild(block);
+    });
+  },
+
+  getColumns(total) {
+    return [
+      { label: 'Fonction', value: e => e.fonction },
+      { label: 'Fichier', value: e => e.fichier ? `${e.fichier}:${e.ligne}` : '(intégrée)' },
+      { label: 'Appels', value: e => e.appels },
+      { label: 'Temps propre (ms)', value: e => (e.temps_propre * 1000).toFixed(2) },
+      { label: 'Temps cumulé (ms)', value: e => (e.temps_cumule * 1000).toFixed(2) },
+      { label: 'Part du temps', value: e => total ? `${Math.round(e.temps_propre / total * 100)} %` : '-' }
+    ];
+  }
+};